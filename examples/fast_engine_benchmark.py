@@ -0,0 +1,51 @@
+"""
+Side-by-side throughput of the `fast` (pypdfium2) and `simple` (pdfplumber)
+engines on the same PDFs.
+
+    python examples/fast_engine_benchmark.py docs/*.pdf
+"""
+
+import argparse
+import difflib
+import time
+
+from langparse.services.parse_service import ParseService
+
+
+def run_engine(service, engine_name, inputs):
+    pages = 0
+    texts = {}
+    started = time.perf_counter()
+    for file_path in inputs:
+        parsed = service.parse_result(file_path, engine_name=engine_name)
+        pages += len(parsed.pages)
+        texts[file_path] = "\n".join(page.plain_text for page in parsed.pages)
+    return pages, time.perf_counter() - started, texts
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("inputs", nargs="+")
+    args = parser.parse_args()
+
+    with ParseService() as service:
+        inputs = service.expand_inputs(args.inputs)
+        results = {engine_name: run_engine(service, engine_name, inputs) for engine_name in ("simple", "fast")}
+
+    for engine_name, (pages, seconds, _) in results.items():
+        print(f"{engine_name:>6}: {pages} pages in {seconds:.2f}s ({pages / seconds if seconds else 0:.1f} pages/s)")
+
+    simple_seconds, fast_seconds = results["simple"][1], results["fast"][1]
+    if fast_seconds:
+        print(f"speedup: {simple_seconds / fast_seconds:.1f}x")
+
+    # Word-level similarity of the extracted text, as a rough fidelity check.
+    for file_path in inputs:
+        simple_words = results["simple"][2][file_path].split()
+        fast_words = results["fast"][2][file_path].split()
+        ratio = difflib.SequenceMatcher(None, simple_words, fast_words, autojunk=False).quick_ratio()
+        print(f"{file_path}: text similarity {ratio:.3f}")
+
+
+if __name__ == "__main__":
+    main()
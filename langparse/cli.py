@@ -1,12 +1,27 @@
 from __future__ import annotations
 
 import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, replace
 from pathlib import Path
 from typing import Sequence
 
+from langparse.engines.pdf.mineru_mock import (
+    MockMinerUBehavior,
+    MockMinerUServer,
+    add_behavior_arguments,
+    behavior_from_args,
+)
 from langparse.services.batch_service import BatchParseService
 from langparse.services.benchmark_service import BenchmarkService
+from langparse.services.cache import ParseResultCache
 from langparse.services.parse_service import ParseService
+from langparse.services.resilience import DEFAULT_RETRY_POLICIES
+
+# argparse const for a bare --retries: use DEFAULT_RETRY_POLICIES as they are.
+DEFAULT_RETRIES = object()
 
 
 def build_parser():
@@ -22,19 +37,34 @@ def build_parser():
     parse_cmd.add_argument("--api-url", default=None)
     parse_cmd.add_argument("--api-host", default=None)
     parse_cmd.add_argument("--api-port", type=int, default=None)
+    parse_cmd.add_argument("--api-workers", type=int, default=None)
     parse_cmd.add_argument("--api-command", default=None)
     parse_cmd.add_argument("--api-start-timeout", type=float, default=None)
+    parse_cmd.add_argument("--shard-pages", type=int, default=None)
+    parse_cmd.add_argument("--shard-workers", type=int, default=None)
     parse_cmd.add_argument("--model-policy", choices=["download_if_missing", "require_existing"], default=None)
     parse_cmd.add_argument("--model-source", default=None)
     parse_cmd.add_argument("--auto-install-runtime", action="store_true")
     parse_cmd.add_argument("--runtime-package", default=None)
+    parse_cmd.add_argument("--pages", default=None)
+    parse_cmd.add_argument("--max-pages", type=int, default=None)
+    parse_cmd.add_argument("--response-zip", action="store_true")
+    parse_cmd.add_argument("--image-dir", default=None)
     parse_cmd.add_argument("--format", default="markdown")
     parse_cmd.add_argument("--batch", action="store_true")
+    parse_cmd.add_argument("--stream", action="store_true")
     parse_cmd.add_argument("--output", default=None)
     parse_cmd.add_argument("--output-dir", default=None)
     parse_cmd.add_argument("--max-workers", type=int, default=None)
+    parse_cmd.add_argument("--executor", choices=["thread", "process"], default=None)
+    parse_cmd.add_argument("--adaptive-concurrency", action="store_true")
+    parse_cmd.add_argument("--pack-files", action="store_true")
+    parse_cmd.add_argument("--retries", type=int, nargs="?", const=DEFAULT_RETRIES, default=None)
+    parse_cmd.add_argument("--circuit-breaker", action="store_true")
     parse_cmd.add_argument("--skip-existing", action="store_true")
     parse_cmd.add_argument("--metrics", action="store_true")
+    parse_cmd.add_argument("--cache-dir", default=None)
+    parse_cmd.add_argument("--cache-max-mb", type=float, default=1024.0)
 
     benchmark_cmd = subparsers.add_parser("benchmark")
     benchmark_cmd.add_argument("manifest")
@@ -48,9 +78,67 @@ def build_parser():
     benchmark_cmd.add_argument("--download-dir", default=None)
     benchmark_cmd.add_argument("--auto-install-runtime", action="store_true")
     benchmark_cmd.add_argument("--runtime-package", default=None)
+
+    mock_cmd = subparsers.add_parser("mock-mineru")
+    mock_cmd.add_argument("--host", default="127.0.0.1")
+    mock_cmd.add_argument("--port", type=int, default=None)
+    add_behavior_arguments(mock_cmd)
+    mock_cmd.add_argument("--load-test", nargs="+", default=None, metavar="INPUT")
+    mock_cmd.add_argument("--repeat", type=int, default=1)
+    mock_cmd.add_argument("--max-workers", type=int, default=4)
+    mock_cmd.add_argument("--adaptive-concurrency", action="store_true")
+    mock_cmd.add_argument("--pack-files", action="store_true")
+    mock_cmd.add_argument("--output-dir", default="out/mock-load")
     return parser
 
 
+def run_mock_load_test(
+    inputs: Sequence[str],
+    behavior: MockMinerUBehavior,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    repeat: int = 1,
+    max_workers: int = 4,
+    adaptive_concurrency: bool = False,
+    output_dir: str = "out/mock-load",
+    pack_files: bool = False,
+) -> dict:
+    """Drive BatchParseService against a mock mineru-api and report client-side throughput."""
+    documents = list(inputs) * max(1, repeat)
+    with MockMinerUServer(host=host, port=port, behavior=behavior) as server:
+        with BatchParseService() as batch_service:
+            started = time.perf_counter()
+            result = batch_service.run(
+                documents,
+                output_dir=output_dir,
+                engine_name="mineru",
+                fmt="markdown",
+                max_workers=max_workers,
+                collect_metrics=True,
+                adaptive_concurrency=adaptive_concurrency,
+                pack_files=pack_files,
+                api_url=server.base_url,
+            )
+            wall_seconds = time.perf_counter() - started
+        server_stats = server.stats()
+
+    parse_requests = server_stats["parse_requests"]
+    return {
+        "documents": len(documents),
+        "wall_seconds": round(wall_seconds, 4),
+        "documents_per_second": round(len(documents) / wall_seconds, 4) if wall_seconds > 0 else 0.0,
+        "success_count": result.success_count,
+        "failed_count": result.failed_count,
+        "total_pages": result.summary["total_pages"],
+        "concurrency": result.summary.get("concurrency"),
+        "pack_count": result.summary.get("pack_count"),
+        "server": server_stats,
+        "connection_reuse_ratio": round(1 - server_stats["connections"] / parse_requests, 4)
+        if parse_requests
+        else 0.0,
+    }
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
@@ -78,11 +166,52 @@ def main(argv: Sequence[str] | None = None) -> int:
         )
         return 0
 
+    if args.command == "mock-mineru":
+        behavior = behavior_from_args(args)
+        if args.load_test:
+            report = run_mock_load_test(
+                args.load_test,
+                behavior,
+                host=args.host,
+                port=args.port or 0,
+                repeat=args.repeat,
+                max_workers=args.max_workers,
+                adaptive_concurrency=args.adaptive_concurrency,
+                output_dir=args.output_dir,
+                pack_files=args.pack_files,
+            )
+            print(json.dumps(report, ensure_ascii=False, indent=2))
+            return 0
+
+        server = MockMinerUServer(
+            host=args.host,
+            port=8000 if args.port is None else args.port,
+            behavior=behavior,
+        )
+        print(f"Mock mineru-api listening on {server.base_url}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.close()
+        return 0
+
     if args.command != "parse":
         parser.error(f"Unsupported command: {args.command}")
 
-    service = ParseService()
+    service_kwargs = {}
+    if args.cache_dir:
+        service_kwargs["cache"] = ParseResultCache(
+            args.cache_dir, max_bytes=int(args.cache_max_mb * 1024 * 1024)
+        )
+    service = ParseService(**service_kwargs)
     engine_name = args.engine or "simple"
+    image_dir = args.image_dir
+    if image_dir is None and args.response_zip and (args.output_dir or args.output):
+        # ZIP responses carry images as files; keep them next to the parsed output.
+        output_root = Path(args.output_dir) if args.output_dir else Path(args.output).parent
+        image_dir = str(output_root / "images")
     parse_kwargs = {
         key: value
         for key, value in {
@@ -92,19 +221,54 @@ def main(argv: Sequence[str] | None = None) -> int:
             "api_url": args.api_url,
             "api_host": args.api_host,
             "api_port": args.api_port,
+            "api_workers": args.api_workers,
             "api_command": args.api_command,
             "api_start_timeout": args.api_start_timeout,
+            "shard_pages": args.shard_pages,
+            "shard_workers": args.shard_workers,
             "model_policy": args.model_policy,
             "model_source": args.model_source,
             "auto_install_runtime": args.auto_install_runtime,
             "runtime_package": args.runtime_package,
+            "pages": args.pages,
+            "max_pages": args.max_pages,
+            "response_format_zip": args.response_zip,
+            "image_dir": image_dir,
         }.items()
         if value is not None and value is not False
     }
 
     if args.batch:
-        if args.metrics or args.max_workers is not None or args.skip_existing:
-            BatchParseService().run(
+        if (
+            args.metrics
+            or args.max_workers is not None
+            or args.skip_existing
+            or args.adaptive_concurrency
+            or args.retries is not None
+            or args.circuit_breaker
+            or args.executor is not None
+            or args.pack_files
+        ):
+            if args.executor is not None:
+                parse_kwargs["executor"] = args.executor
+            if args.pack_files:
+                parse_kwargs["pack_files"] = True
+            if args.adaptive_concurrency:
+                parse_kwargs["adaptive_concurrency"] = True
+            if args.retries is DEFAULT_RETRIES:
+                parse_kwargs["retry_policies"] = dict(DEFAULT_RETRY_POLICIES)
+            elif args.retries is not None:
+                if args.retries < 0:
+                    parser.error("--retries must be zero or more.")
+                # --retries counts retries after the first attempt; backoff stays per error type.
+                parse_kwargs["retry_policies"] = {
+                    error_type: replace(policy, max_attempts=args.retries + 1)
+                    for error_type, policy in DEFAULT_RETRY_POLICIES.items()
+                }
+            if args.circuit_breaker:
+                parse_kwargs["circuit_breaker"] = True
+            batch_service = BatchParseService(service) if service_kwargs else BatchParseService()
+            batch_service.run(
                 args.inputs,
                 engine_name=engine_name,
                 output_dir=args.output_dir or "out",
@@ -132,6 +296,20 @@ def main(argv: Sequence[str] | None = None) -> int:
     if len(args.inputs) != 1:
         parser.error("Single parse mode accepts exactly one input. Use --batch for multiple inputs.")
 
+    if args.stream:
+        if args.format not in {"markdown", "jsonl"}:
+            parser.error("--stream supports --format markdown or jsonl.")
+        metrics = service.stream_output(
+            args.inputs[0],
+            Path(args.output) if args.output else sys.stdout,
+            engine_name=engine_name,
+            fmt=args.format,
+            **parse_kwargs,
+        )
+        if args.metrics:
+            print(json.dumps(asdict(metrics), ensure_ascii=False), file=sys.stderr)
+        return 0
+
     rendered = service.parse_output(
         args.inputs[0],
         engine_name=engine_name,
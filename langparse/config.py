@@ -24,17 +24,35 @@ class Config:
         "LANGPARSE_MINERU_API_URL": "engines.mineru.api_url",
         "LANGPARSE_MINERU_API_HOST": "engines.mineru.api_host",
         "LANGPARSE_MINERU_API_PORT": "engines.mineru.api_port",
+        "LANGPARSE_MINERU_API_WORKERS": "engines.mineru.api_workers",
         "LANGPARSE_MINERU_API_COMMAND": "engines.mineru.api_command",
         "LANGPARSE_MINERU_API_START_TIMEOUT": "engines.mineru.api_start_timeout",
+        "LANGPARSE_MINERU_SHARD_PAGES": "engines.mineru.shard_pages",
+        "LANGPARSE_MINERU_SHARD_WORKERS": "engines.mineru.shard_workers",
         "LANGPARSE_MINERU_MODEL_POLICY": "engines.mineru.model_policy",
         "LANGPARSE_MINERU_MODEL_SOURCE": "engines.mineru.model_source",
         "LANGPARSE_MINERU_AUTO_INSTALL_RUNTIME": "engines.mineru.auto_install_runtime",
         "LANGPARSE_MINERU_RUNTIME_PACKAGE": "engines.mineru.runtime_package",
+        "LANGPARSE_MINERU_RESPONSE_FORMAT_ZIP": "engines.mineru.response_format_zip",
+        "LANGPARSE_MINERU_IMAGE_DIR": "engines.mineru.image_dir",
+        "LANGPARSE_SIMPLE_PAGE_CACHE_DIR": "engines.simple.page_cache_dir",
+        "LANGPARSE_SIMPLE_WORKERS": "engines.simple.workers",
+        "LANGPARSE_SIMPLE_CHUNK_PAGES": "engines.simple.chunk_pages",
+        "LANGPARSE_SIMPLE_FORCE_TABLE_EXTRACTION": "engines.simple.force_table_extraction",
+        "LANGPARSE_SIMPLE_ENABLE_OCR": "engines.simple.enable_ocr",
     }
 
     DEFAULT_CONFIG = {
         "default_pdf_engine": "simple",
         "engines": {
+            "simple": {
+                "page_cache_dir": None,
+                "workers": 1,
+                "chunk_pages": 16,
+                "parallel_min_pages": 64,
+                "force_table_extraction": False,
+                "enable_ocr": False,
+            },
             "mineru": {
                 "device": "auto",
                 "model_dir": None,
@@ -43,9 +61,19 @@ class Config:
                 "api_url": None,
                 "api_host": "127.0.0.1",
                 "api_port": 8000,
+                "api_workers": 1,
                 "api_command": "mineru-api",
                 "api_start_timeout": 30.0,
                 "request_timeout": 300.0,
+                "shard_pages": None,
+                "shard_workers": 4,
+                "pack_max_files": 16,
+                "pack_max_pages": 64,
+                "pack_max_bytes": 32 * 1024 * 1024,
+                "retain_raw_response": False,
+                "response_format_zip": False,
+                "image_dir": None,
+                "async_max_concurrency": 64,
                 "model_policy": "download_if_missing",
                 "model_source": None,
                 "auto_install_runtime": False,
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict
+from importlib.metadata import PackageNotFoundError, version as package_version
+from pathlib import Path
+from typing import Any
+
+from langparse.core.engine import PageResult
+from langparse.types import ParsedElement
+
+
+def extraction_version() -> str:
+    """langparse and pdfplumber versions; an upgrade of either may change extracted pages."""
+    versions = []
+    for name in ("langparse", "pdfplumber"):
+        try:
+            versions.append(f"{name}={package_version(name)}")
+        except PackageNotFoundError:
+            versions.append(f"{name}=unknown")
+    return ";".join(versions)
+
+
+class PageResultCache:
+    """
+    Per-page result cache shared by engines.
+
+    Engines fingerprint a page from its content (see
+    langparse.engines.pdf.fingerprint) and look it up before extracting it, so
+    a revised document only re-extracts the pages that changed. Keys combine
+    the engine name, the options that affect extraction, the page fingerprint
+    and the langparse and pdfplumber versions. Entries live in a single SQLite
+    file and are evicted least recently used first once their total size
+    exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir, max_bytes: int = 256 * 1024 * 1024, version: str | None = None):
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}.")
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.version = version or extraction_version()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._db = sqlite3.connect(self.cache_dir / "pages.sqlite3", timeout=30.0, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS pages ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, "
+                "last_access REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS pages_last_access ON pages (last_access)")
+
+    def key_for(self, engine_name: str, fingerprint: str, options: dict[str, Any] | None = None) -> str:
+        payload = json.dumps(
+            {
+                "engine": engine_name,
+                "options": options or {},
+                "fingerprint": fingerprint,
+                "version": self.version,
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> PageResult | None:
+        with self._lock:
+            row = self._db.execute("SELECT payload FROM pages WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+            with self._db:
+                self._db.execute("UPDATE pages SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._stats["hits"] += 1
+        payload = json.loads(gzip.decompress(row[0]).decode("utf-8"))
+        payload["elements"] = [ParsedElement(**element) for element in payload.get("elements", [])]
+        return PageResult(**payload)
+
+    def put(self, key: str, page: PageResult) -> None:
+        data = gzip.compress(json.dumps(asdict(page), ensure_ascii=False).encode("utf-8"))
+        with self._lock:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages (key, payload, size, last_access) VALUES (?, ?, ?, ?)",
+                    (key, data, len(data), time.time()),
+                )
+            self._evict()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries, total_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM pages"
+            ).fetchone()
+            return {**self._stats, "entries": entries, "bytes": total_bytes, "max_bytes": self.max_bytes}
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __getstate__(self) -> dict:
+        # The SQLite connection cannot be pickled; each process opens its own.
+        return {"cache_dir": self.cache_dir, "max_bytes": self.max_bytes, "version": self.version}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def _evict(self) -> None:
+        (total_bytes,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()
+        if total_bytes <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._db.execute("SELECT key, size FROM pages ORDER BY last_access ASC"):
+            if total_bytes <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total_bytes -= size
+        with self._db:
+            self._db.executemany("DELETE FROM pages WHERE key = ?", evicted)
+        self._stats["evictions"] += len(evicted)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator
+
+from langparse.core.engine import PageResult
+from langparse.engines.pdf.page_ranges import PDFIUM_LOCK, select_page_ranges
+from langparse.engines.pdf.simple import BasePDFEngine
+
+
+class FastPDFEngine(BasePDFEngine):
+    """
+    Text-only engine on pypdfium2 (PDFium's C text extraction).
+
+    Built for bulk ingestion of born-digital PDFs: pages come out in the
+    same PageResult shape as the simple engine, with plain text as markdown,
+    but without table detection or layout analysis. Scanned pages without a
+    text layer yield empty pages. PDFium is not thread-safe, so calls are
+    serialized across threads; use worker processes to scale out.
+    """
+
+    def __init__(self, pages: Any = None, max_pages: int | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.pages = pages
+        self.max_pages = max_pages
+
+    def process(self, file_path: Path, **kwargs: Any) -> Iterator[PageResult]:
+        try:
+            import pypdfium2
+        except ImportError:
+            raise ImportError("Please install `pypdfium2` to use the 'fast' engine.")
+
+        with PDFIUM_LOCK:
+            document = pypdfium2.PdfDocument(str(file_path))
+            page_count = len(document)
+        try:
+            page_ranges = select_page_ranges(
+                kwargs.get("pages", self.pages), kwargs.get("max_pages", self.max_pages), page_count
+            )
+            if page_ranges is None:
+                page_ranges = [(0, page_count - 1)] if page_count else []
+            for start, end in page_ranges:
+                for index in range(start, end + 1):
+                    yield self._extract_page(document, index)
+        finally:
+            with PDFIUM_LOCK:
+                document.close()
+
+    def _extract_page(self, document, index: int) -> PageResult:
+        with PDFIUM_LOCK:
+            page = document[index]
+            try:
+                text_page = page.get_textpage()
+                try:
+                    text = text_page.get_text_range()
+                finally:
+                    text_page.close()
+            finally:
+                page.close()
+
+        text = text.replace("\r\n", "\n").replace("\r", "\n").strip()
+        return PageResult(
+            page_number=index + 1,
+            markdown_content=text,
+            plain_text=text,
+            elements=[],
+            tables=[],
+            images=[],
+            metadata={"engine_name": "fast"},
+        )
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+# Page attributes that point back into the page tree rather than at page content.
+_SKIPPED_KEYS = frozenset({"Parent", "StructParents", "Annots", "B"})
+
+
+class PageFingerprinter:
+    """
+    Content hash of pdfplumber/pdfminer pages.
+
+    A page's fingerprint covers its content streams and everything reachable
+    from its attributes (resources, fonts, images, boxes, rotation), so it only
+    changes when something that can affect extraction changes. Digests of
+    shared indirect objects such as fonts are memoized per document, so they
+    are hashed once rather than once per page.
+    """
+
+    def __init__(self):
+        self._object_digests: dict[int, bytes] = {}
+
+    def fingerprint(self, page) -> str | None:
+        """Return a hex digest for the page, or None when the page exposes no PDF objects."""
+        page_obj = getattr(page, "page_obj", None)
+        attrs = getattr(page_obj, "attrs", None)
+        if not isinstance(attrs, dict):
+            return None
+        try:
+            return self._digest_dict(attrs, in_progress=set()).hex()
+        except Exception:
+            # Unreadable objects should only cost the cache hit, never the parse.
+            return None
+
+    def _digest(self, value: Any, in_progress: set[int]) -> bytes:
+        from pdfminer.pdftypes import PDFObjRef, PDFStream
+        from pdfminer.psparser import PSLiteral
+
+        if isinstance(value, PDFObjRef):
+            objid = value.objid
+            cached = self._object_digests.get(objid)
+            if cached is not None:
+                return cached
+            if objid in in_progress:
+                return b"cycle:" + str(objid).encode()
+            in_progress.add(objid)
+            digest = self._digest(value.resolve(), in_progress)
+            in_progress.discard(objid)
+            self._object_digests[objid] = digest
+            return digest
+        if isinstance(value, PDFStream):
+            data = value.rawdata if value.rawdata is not None else value.data
+            return hashlib.sha256(
+                b"stream" + self._digest_dict(value.attrs, in_progress) + (data or b"")
+            ).digest()
+        if isinstance(value, dict):
+            return self._digest_dict(value, in_progress)
+        if isinstance(value, (list, tuple)):
+            digest = hashlib.sha256(b"list")
+            for item in value:
+                digest.update(self._digest(item, in_progress))
+            return digest.digest()
+        if isinstance(value, PSLiteral):
+            return hashlib.sha256(b"name" + str(value.name).encode()).digest()
+        return hashlib.sha256(repr(value).encode()).digest()
+
+    def _digest_dict(self, value: dict, in_progress: set[int]) -> bytes:
+        digest = hashlib.sha256(b"dict")
+        for key in sorted(value, key=str):
+            if key in _SKIPPED_KEYS:
+                continue
+            digest.update(str(key).encode())
+            digest.update(self._digest(value[key], in_progress))
+        return digest.digest()
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import http.client
+import select
+import shutil
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+
+class _RequestNotSentError(ConnectionError):
+    """The connection failed while the request was still being sent."""
+
+
+# Errors that mean a kept-alive socket was closed by the server while idle.
+# Requests that hit them on a reused connection are retried once on a fresh one,
+# but only if the server cannot have started on them (see HTTPConnectionPool.request).
+_STALE_CONNECTION_ERRORS = (
+    _RequestNotSentError,
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+# Requests that may be sent twice. A dropped POST /file_parse may already be running inference.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+@dataclass
+class HTTPResponse:
+    status: int
+    reason: str
+    headers: dict[str, str] = field(default_factory=dict)
+    body: bytes = b""
+    # upload_seconds (sending the request), server_seconds (waiting for the
+    # status line) and download_seconds (reading the body).
+    timings: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class _IdleConnection:
+    connection: http.client.HTTPConnection
+    released_at: float
+
+
+class HTTPConnectionPool:
+    """
+    Small thread-safe keep-alive pool built on http.client.
+    Connections are kept per (scheme, host, port) and dropped after
+    idle_timeout seconds unused. With max_connections_per_host set, requests
+    beyond it wait for a free connection; by default callers bound their own
+    concurrency and the pool opens as many connections as they need.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int | None = None,
+        idle_timeout: float = 30.0,
+        timeout: float = 300.0,
+    ):
+        if max_connections_per_host is not None and max_connections_per_host < 1:
+            raise ValueError("max_connections_per_host must be at least 1.")
+        self.max_connections_per_host = max_connections_per_host
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self._condition = threading.Condition()
+        self._idle: dict[tuple[str, str, int], deque[_IdleConnection]] = {}
+        self._open: dict[tuple[str, str, int], int] = {}
+        self._closed = False
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+        sink: Any = None,
+    ) -> HTTPResponse:
+        """
+        Send a request and return its response. With a binary file object as
+        sink, a successful (< 400) response body is copied into it block by
+        block instead of being held in HTTPResponse.body.
+        """
+        parts = urlsplit(url)
+        key = self._host_key(parts.scheme, parts.hostname or "", parts.port)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        effective_timeout = self.timeout if timeout is None else timeout
+
+        connection, reused = self._acquire(key, effective_timeout)
+        try:
+            try:
+                response = self._send(connection, method, target, body, headers or {}, sink)
+            except _STALE_CONNECTION_ERRORS as exc:
+                replayable = isinstance(exc, _RequestNotSentError) or method.upper() in _IDEMPOTENT_METHODS
+                if not reused or not replayable:
+                    raise
+                connection.close()
+                connection = self._new_connection(key, effective_timeout)
+                if sink is not None:
+                    sink.seek(0)
+                    sink.truncate()
+                response = self._send(connection, method, target, body, headers or {}, sink)
+        except BaseException:
+            self._discard(key, connection)
+            raise
+
+        if response.headers.get("connection", "").lower() == "close":
+            self._discard(key, connection)
+        else:
+            self._release(key, connection)
+        return response
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            idle = [item for queue in self._idle.values() for item in queue]
+            for key, queue in self._idle.items():
+                self._open[key] -= len(queue)
+            self._idle.clear()
+            self._condition.notify_all()
+        for item in idle:
+            item.connection.close()
+
+    def __enter__(self) -> "HTTPConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._condition:
+            return {
+                "open_connections": sum(self._open.values()),
+                "idle_connections": sum(len(queue) for queue in self._idle.values()),
+            }
+
+    def _send(
+        self,
+        connection: http.client.HTTPConnection,
+        method: str,
+        target: str,
+        body: Any,
+        headers: dict[str, str],
+        sink: Any = None,
+    ) -> HTTPResponse:
+        started = time.perf_counter()
+        try:
+            connection.request(method, target, body=body, headers=headers)
+        except _STALE_CONNECTION_ERRORS as exc:
+            raise _RequestNotSentError(str(exc) or type(exc).__name__) from exc
+        sent = time.perf_counter()
+        raw = connection.getresponse()
+        received = time.perf_counter()
+        if sink is not None and raw.status < 400:
+            shutil.copyfileobj(raw, sink, 64 * 1024)
+            payload = b""
+        else:
+            payload = raw.read()
+        return HTTPResponse(
+            status=raw.status,
+            reason=raw.reason,
+            headers={name.lower(): value for name, value in raw.getheaders()},
+            body=payload,
+            timings={
+                "upload_seconds": sent - started,
+                "server_seconds": received - sent,
+                "download_seconds": time.perf_counter() - received,
+            },
+        )
+
+    def _acquire(self, key: tuple[str, str, int], timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        deadline = time.monotonic() + timeout
+        expired: list[http.client.HTTPConnection] = []
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise RuntimeError("HTTP connection pool is closed.")
+                queue = self._idle.setdefault(key, deque())
+                now = time.monotonic()
+                while queue and now - queue[0].released_at > self.idle_timeout:
+                    expired.append(queue.popleft().connection)
+                    self._open[key] -= 1
+                while queue and _is_dropped(queue[-1].connection):
+                    expired.append(queue.pop().connection)
+                    self._open[key] -= 1
+                if queue:
+                    connection = queue.pop().connection
+                    break
+                limit = self.max_connections_per_host
+                if limit is None or self._open.get(key, 0) < limit:
+                    self._open[key] = self._open.get(key, 0) + 1
+                    connection = None
+                    break
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Timed out waiting for a free connection to {key[1]}:{key[2]}."
+                    )
+                self._condition.wait(remaining)
+
+        for stale in expired:
+            stale.close()
+        if connection is not None:
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            return connection, True
+        try:
+            return self._new_connection(key, timeout), False
+        except BaseException:
+            with self._condition:
+                self._open[key] -= 1
+                self._condition.notify()
+            raise
+
+    def _new_connection(self, key: tuple[str, str, int], timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = key
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, port, timeout=timeout)
+
+    def _release(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        with self._condition:
+            if not self._closed:
+                self._idle.setdefault(key, deque()).append(
+                    _IdleConnection(connection=connection, released_at=time.monotonic())
+                )
+                self._condition.notify()
+                return
+            self._open[key] -= 1
+        connection.close()
+
+    def _discard(self, key: tuple[str, str, int], connection: http.client.HTTPConnection) -> None:
+        connection.close()
+        with self._condition:
+            self._open[key] -= 1
+            self._condition.notify()
+
+    def _host_key(self, scheme: str, host: str, port: int | None) -> tuple[str, str, int]:
+        scheme = scheme or "http"
+        return scheme, host, port or (443 if scheme == "https" else 80)
+
+
+def _is_dropped(connection: http.client.HTTPConnection) -> bool:
+    # An idle keep-alive socket has nothing to read; if it is readable, the server closed it.
+    sock = connection.sock
+    if sock is None:
+        return True
+    try:
+        readable, _, _ = select.select([sock], [], [], 0)
+    except (OSError, ValueError):
+        return True
+    return bool(readable)
+
+
+_default_pool: HTTPConnectionPool | None = None
+_default_pool_lock = threading.Lock()
+
+
+def default_connection_pool() -> HTTPConnectionPool:
+    """Process-wide pool used by clients that were not given one explicitly."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = HTTPConnectionPool()
+        return _default_pool
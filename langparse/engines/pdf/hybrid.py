@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterator
+
+from langparse.config import settings
+from langparse.core.engine import PageResult
+from langparse.engines.pdf.fingerprint import PageFingerprinter
+from langparse.engines.pdf.mineru import MinerUEngine
+from langparse.engines.pdf.page_ranges import PageRange, count_pdf_pages, select_page_ranges
+from langparse.engines.pdf.simple import (
+    BasePDFEngine,
+    SimplePDFEngine,
+    _iter_pages,
+    _may_contain_table,
+    _release_page,
+)
+from langparse.types import ParsedDocumentResult, ParsedPageResult
+
+# Per-call options the hybrid engine consumes itself instead of forwarding to MinerU.
+_SELECTION_OPTIONS = ("pages", "max_pages")
+
+
+class HybridPDFEngine(BasePDFEngine):
+    """
+    Routes each page to the simple or the MinerU engine.
+
+    Every page is first classified from cheap pdfplumber signals: characters
+    in its text layer, the share of the page covered by images and, with
+    route_tables, ruling lines that can form a table. Pages with no usable
+    text layer or dominated by images go to MinerU, requested as page ranges
+    so the rest of the document never reaches mineru-api; all other pages are
+    extracted by the simple engine in the same pass. Each range is a request
+    that uploads the whole PDF, so runs of MinerU pages separated by at most
+    mineru_merge_gap simple pages share a range (MinerU's output for those
+    simple pages is discarded), and more than max_mineru_ranges ranges
+    collapse into one. Results are merged in page order and every page
+    records its routing decision under metadata["routing"].
+
+    simple_options and mineru_options configure the two engines on top of
+    their engines.simple / engines.mineru config; other keyword arguments
+    (api_url, device, ...) are MinerU options.
+    """
+
+    def __init__(
+        self,
+        simple_options: dict[str, Any] | None = None,
+        mineru_options: dict[str, Any] | None = None,
+        min_text_chars: int = 64,
+        max_image_coverage: float = 0.5,
+        route_tables: bool = False,
+        mineru_merge_gap: int = 2,
+        max_mineru_ranges: int = 4,
+        pages: Any = None,
+        max_pages: int | None = None,
+        **kwargs: Any,
+    ):
+        super().__init__()
+        self.simple_options = dict(simple_options or {})
+        self.mineru_options = {**(mineru_options or {}), **kwargs}
+        self.min_text_chars = min_text_chars
+        self.max_image_coverage = max_image_coverage
+        self.route_tables = route_tables
+        self.mineru_merge_gap = mineru_merge_gap
+        self.max_mineru_ranges = max_mineru_ranges
+        self.pages = pages
+        self.max_pages = max_pages
+        self._simple_engine: SimplePDFEngine | None = None
+        self._mineru_engine: MinerUEngine | None = None
+
+    @property
+    def starts_service(self) -> bool:
+        """True when MinerU pages would launch a local mineru-api instead of using api_url."""
+        return not settings.resolve_engine_config("mineru", self.mineru_options).get("api_url")
+
+    def close(self) -> None:
+        for engine in (self._simple_engine, self._mineru_engine):
+            if engine is not None:
+                engine.close()
+        self._simple_engine = self._mineru_engine = None
+
+    def process_document(self, file_path: Path, **kwargs: Any) -> ParsedDocumentResult:
+        try:
+            import pdfplumber
+        except ImportError:
+            raise ImportError("Please install `pdfplumber` to use the 'hybrid' engine.")
+
+        pages = kwargs.get("pages", self.pages)
+        max_pages = kwargs.get("max_pages", self.max_pages)
+        page_ranges = None
+        if pages is not None or max_pages is not None:
+            page_ranges = select_page_ranges(pages, max_pages, count_pdf_pages(file_path))
+
+        simple_engine = self._get_simple_engine()
+        fingerprinter = PageFingerprinter() if simple_engine.page_cache is not None else None
+        results: dict[int, ParsedPageResult] = {}
+        routing: dict[int, dict[str, Any]] = {}
+        with pdfplumber.open(file_path) as pdf:
+            for page_number, page in _iter_pages(pdf, page_ranges):
+                try:
+                    routing[page_number] = decision = self._route_page(page)
+                    if decision["engine"] == "simple":
+                        if fingerprinter is None:
+                            extracted = simple_engine._extract_page(page, page_number)
+                        else:
+                            extracted = simple_engine._extract_page_cached(page, page_number, fingerprinter)
+                        results[page_number] = _to_parsed_page(extracted)
+                finally:
+                    _release_page(pdf, page)
+
+        mineru_ranges = _group_page_numbers(
+            [number for number, decision in routing.items() if decision["engine"] == "mineru"],
+            max_gap=self.mineru_merge_gap,
+        )
+        if len(mineru_ranges) > max(1, self.max_mineru_ranges):
+            mineru_ranges = [(mineru_ranges[0][0], mineru_ranges[-1][1])]
+        mineru_metadata: dict[str, Any] = {}
+        if mineru_ranges:
+            mineru_kwargs = {key: value for key, value in kwargs.items() if key not in _SELECTION_OPTIONS}
+            parsed = self._get_mineru_engine().process_document(
+                file_path, pages=mineru_ranges, **mineru_kwargs
+            )
+            mineru_metadata = parsed.metadata
+            for mineru_page in parsed.pages:
+                if routing.get(mineru_page.page_number, {}).get("engine") == "mineru":
+                    results[mineru_page.page_number] = mineru_page
+
+        merged_pages = []
+        for page_number, decision in routing.items():
+            # MinerU may return nothing for a blank routed page; keep page numbering intact.
+            page_result = results.get(page_number) or ParsedPageResult(page_number=page_number, markdown_content="")
+            page_result.metadata["routing"] = decision
+            merged_pages.append(page_result)
+
+        return ParsedDocumentResult(
+            source=str(file_path),
+            filename=file_path.name,
+            engine="hybrid",
+            pages=merged_pages,
+            markdown_content="\n".join(page.markdown_content for page in merged_pages),
+            metadata={
+                **mineru_metadata,
+                "routing": {
+                    "simple_pages": sum(1 for decision in routing.values() if decision["engine"] == "simple"),
+                    "mineru_pages": sum(1 for decision in routing.values() if decision["engine"] == "mineru"),
+                    "mineru_ranges": [list(page_range) for page_range in mineru_ranges],
+                },
+            },
+        )
+
+    def process(self, file_path: Path, **kwargs: Any) -> Iterator[PageResult]:
+        parsed = self.process_document(file_path, **kwargs)
+        for page in parsed.pages:
+            yield PageResult(
+                page_number=page.page_number,
+                markdown_content=page.markdown_content,
+                plain_text=page.plain_text,
+                elements=page.elements,
+                tables=page.tables,
+                images=page.images,
+                metadata=page.metadata,
+            )
+
+    def _route_page(self, page) -> dict[str, Any]:
+        text_chars = sum(1 for char in getattr(page, "chars", []) if not char.get("text", "").isspace())
+        image_coverage = _image_coverage(page)
+        ruling_lines = _may_contain_table(page)
+
+        reasons = []
+        if text_chars < self.min_text_chars and image_coverage > 0:
+            reasons.append("no_text_layer")
+        if image_coverage >= self.max_image_coverage:
+            reasons.append("image_coverage")
+        if self.route_tables and ruling_lines:
+            reasons.append("ruling_lines")
+        return {
+            "engine": "mineru" if reasons else "simple",
+            "reasons": reasons,
+            "text_chars": text_chars,
+            "image_coverage": round(image_coverage, 4),
+            "ruling_lines": ruling_lines,
+        }
+
+    def _get_simple_engine(self) -> SimplePDFEngine:
+        if self._simple_engine is None:
+            self._simple_engine = SimplePDFEngine(**settings.resolve_engine_config("simple", self.simple_options))
+        return self._simple_engine
+
+    def _get_mineru_engine(self) -> MinerUEngine:
+        if self._mineru_engine is None:
+            self._mineru_engine = MinerUEngine(**settings.resolve_engine_config("mineru", self.mineru_options))
+        return self._mineru_engine
+
+
+def _image_coverage(page) -> float:
+    width = float(getattr(page, "width", 0) or 0)
+    height = float(getattr(page, "height", 0) or 0)
+    if width <= 0 or height <= 0:
+        return 0.0
+    covered = 0.0
+    for image in getattr(page, "images", None) or []:
+        x0, x1 = max(float(image["x0"]), 0.0), min(float(image["x1"]), width)
+        top, bottom = max(float(image["top"]), 0.0), min(float(image["bottom"]), height)
+        covered += max(x1 - x0, 0.0) * max(bottom - top, 0.0)
+    # Overlapping images are counted twice; the cap keeps the ratio meaningful.
+    return min(covered / (width * height), 1.0)
+
+
+def _group_page_numbers(page_numbers: list[int], max_gap: int = 0) -> list[PageRange]:
+    """
+    Group sorted 1-based page numbers into inclusive (first, last) runs; runs
+    separated by at most max_gap missing pages are joined.
+    """
+    ranges: list[PageRange] = []
+    for number in page_numbers:
+        if ranges and number - ranges[-1][1] - 1 <= max_gap:
+            ranges[-1] = (ranges[-1][0], number)
+        else:
+            ranges.append((number, number))
+    return ranges
+
+
+def _to_parsed_page(page: PageResult) -> ParsedPageResult:
+    return ParsedPageResult(
+        page_number=page.page_number,
+        markdown_content=page.markdown_content,
+        plain_text=page.plain_text,
+        elements=list(page.elements),
+        tables=list(page.tables),
+        images=list(page.images),
+        metadata=dict(page.metadata),
+    )
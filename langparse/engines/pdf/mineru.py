@@ -1,9 +1,22 @@
+import asyncio
+import contextlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, AsyncIterator, Iterator
 
 from langparse.core.engine import PageResult
-from langparse.engines.pdf.mineru_client import MinerUClient
-from langparse.engines.pdf.mineru_service import MinerUServiceManager
+from langparse.engines.pdf.http_pool import HTTPConnectionPool
+from langparse.engines.pdf.mineru_async_client import AsyncMinerUClient
+from langparse.engines.pdf.mineru_client import MinerUClient, merge_request_timings
+from langparse.engines.pdf.mineru_service import MinerUServiceManager, MinerUServicePool
+from langparse.engines.pdf.page_ranges import (
+    PageRange,
+    chunk_page_ranges,
+    count_pdf_pages,
+    select_page_ranges,
+    split_page_range,
+)
 from langparse.engines.pdf.simple import BasePDFEngine
 from langparse.types import ParsedDocumentResult, ParsedElement, ParsedPageResult
 
@@ -23,9 +36,22 @@ class MinerUEngine(BasePDFEngine):
         api_url: str | None = None,
         api_host: str = "127.0.0.1",
         api_port: int = 8000,
+        api_workers: int = 1,
         api_command: str = "mineru-api",
         api_start_timeout: float = 30.0,
         request_timeout: float = 300.0,
+        max_connections_per_host: int | None = None,
+        shard_pages: int | None = None,
+        shard_workers: int = 4,
+        pages: Any = None,
+        max_pages: int | None = None,
+        pack_max_files: int = 16,
+        pack_max_pages: int = 64,
+        pack_max_bytes: int = 32 * 1024 * 1024,
+        retain_raw_response: bool = False,
+        response_format_zip: bool = False,
+        image_dir: str | None = None,
+        async_max_concurrency: int = 64,
         model_policy: str = "download_if_missing",
         model_source: str | None = None,
         auto_install_runtime: bool = False,
@@ -40,14 +66,31 @@ class MinerUEngine(BasePDFEngine):
         self.api_url = api_url
         self.api_host = api_host
         self.api_port = api_port
+        self.api_workers = api_workers
         self.api_command = api_command
         self.api_start_timeout = api_start_timeout
         self.request_timeout = request_timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.shard_pages = shard_pages
+        self.shard_workers = shard_workers
+        self.pages = pages
+        self.max_pages = max_pages
+        self.pack_max_files = pack_max_files
+        self.pack_max_pages = pack_max_pages
+        self.pack_max_bytes = pack_max_bytes
+        self.retain_raw_response = retain_raw_response
+        self.response_format_zip = response_format_zip
+        self.image_dir = image_dir
+        self.async_max_concurrency = async_max_concurrency
         self.model_policy = model_policy
         self.model_source = model_source
         self.auto_install_runtime = auto_install_runtime
         self.runtime_package = runtime_package
         self.extra_options = {**(extra_options or {}), **kwargs}
+        self._service_manager: MinerUServiceManager | MinerUServicePool | None = None
+        self._connection_pool: HTTPConnectionPool | None = None
+        self._async_clients: dict[str, AsyncMinerUClient] = {}
+        self._service_lock = threading.Lock()
 
     def _cuda_available(self) -> bool:
         try:
@@ -100,21 +143,254 @@ class MinerUEngine(BasePDFEngine):
         }
 
     def _create_client(self, base_url: str) -> MinerUClient:
-        return MinerUClient(base_url, timeout=self.request_timeout)
+        return MinerUClient(
+            base_url,
+            timeout=self.request_timeout,
+            connection_pool=self._get_connection_pool(),
+            retain_raw=self.retain_raw_response,
+            response_format_zip=self.response_format_zip,
+            image_dir=self.image_dir,
+        )
+
+    def _get_connection_pool(self) -> HTTPConnectionPool:
+        with self._service_lock:
+            if self._connection_pool is None:
+                # Uncapped by default: max_workers, shard_workers and the adaptive limiter
+                # already bound how many requests are in flight.
+                self._connection_pool = HTTPConnectionPool(
+                    max_connections_per_host=self.max_connections_per_host,
+                    timeout=self.request_timeout,
+                )
+            return self._connection_pool
+
+    @property
+    def starts_service(self) -> bool:
+        """True when this engine launches its own mineru-api instead of using api_url."""
+        return not self.api_url
 
-    def _create_service_manager(self) -> MinerUServiceManager:
+    def _create_service_manager(self) -> MinerUServiceManager | MinerUServicePool:
+        if self.api_workers > 1 and not self.api_url:
+            return MinerUServicePool(self.api_workers, **self._build_service_config())
         return MinerUServiceManager(**self._build_service_config())
 
-    def _run_mineru(self, file_path: Path, runtime_config: dict[str, Any]) -> list[dict[str, Any]]:
-        manager = self._create_service_manager()
-        with manager.running_service() as base_url:
+    def _get_service_manager(self) -> MinerUServiceManager | MinerUServicePool:
+        with self._service_lock:
+            if self._service_manager is None:
+                self._service_manager = self._create_service_manager()
+            return self._service_manager
+
+    def close(self) -> None:
+        """Stop the managed mineru-api service, if this engine started one."""
+        with self._service_lock:
+            manager, self._service_manager = self._service_manager, None
+            connection_pool, self._connection_pool = self._connection_pool, None
+            async_clients, self._async_clients = list(self._async_clients.values()), {}
+        for client in async_clients:
+            client.close()
+        if connection_pool is not None:
+            connection_pool.close()
+        if manager is not None:
+            manager.close()
+
+    async def aclose(self) -> None:
+        """close() for asyncio callers: async clients close on the running loop, the service in a thread."""
+        with self._service_lock:
+            async_clients, self._async_clients = list(self._async_clients.values()), {}
+        for client in async_clients:
+            await client.aclose()
+        await asyncio.to_thread(self.close)
+
+    def health(self) -> dict[str, Any]:
+        with self._get_service_manager().lease() as base_url:
+            return self._create_client(base_url).health()
+
+    def __enter__(self) -> "MinerUEngine":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _run_mineru(
+        self,
+        file_path: Path,
+        runtime_config: dict[str, Any],
+        page_range: PageRange | None = None,
+    ) -> list[dict[str, Any]]:
+        with self._get_service_manager().lease() as base_url:
             client = self._create_client(base_url)
-            return client.parse_file(file_path, runtime_config)
+            if page_range is None:
+                return client.parse_file(file_path, runtime_config)
+            return client.parse_file(file_path, runtime_config, page_range=page_range)
+
+    def _plan_shards(self, file_path: Path, shard_pages: int | None) -> list[PageRange]:
+        if not shard_pages:
+            return []
+        page_count = count_pdf_pages(file_path)
+        if page_count is None or page_count <= shard_pages:
+            return []
+        return split_page_range(page_count, shard_pages)
+
+    def _plan_page_ranges(self, file_path: Path, kwargs: dict[str, Any]) -> list[PageRange] | None:
+        """
+        Page ranges to request, or None to send the whole document in one
+        request. A page selection is requested as its own ranges (split
+        further by shard_pages), so unselected pages never reach mineru-api.
+        """
+        shard_pages = kwargs.get("shard_pages", self.shard_pages)
+        pages = kwargs.get("pages", self.pages)
+        max_pages = kwargs.get("max_pages", self.max_pages)
+        if pages is None and max_pages is None:
+            return self._plan_shards(file_path, shard_pages) or None
+        page_ranges = select_page_ranges(pages, max_pages, count_pdf_pages(file_path))
+        return chunk_page_ranges(page_ranges, shard_pages) if shard_pages else page_ranges
+
+    def _run_mineru_sharded(
+        self,
+        file_path: Path,
+        runtime_config: dict[str, Any],
+        page_ranges: list[PageRange],
+    ) -> list[dict[str, Any]]:
+        # Shards run concurrently (spread over the service pool when one is
+        # configured) and are merged back in page order.
+        worker_count = max(1, min(self.shard_workers, len(page_ranges)))
+        with ThreadPoolExecutor(max_workers=worker_count) as executor:
+            shard_results = list(
+                executor.map(
+                    lambda page_range: self._run_mineru(file_path, runtime_config, page_range),
+                    page_ranges,
+                )
+            )
+        return [page for shard_pages in shard_results for page in shard_pages]
 
     def process_document(self, file_path: Path, **kwargs: Any) -> ParsedDocumentResult:
         self._ensure_runtime()
         runtime_config = self._build_runtime_config(**kwargs)
-        raw_pages = self._run_mineru(file_path, runtime_config)
+        page_ranges = self._plan_page_ranges(file_path, kwargs)
+        if page_ranges is None:
+            raw_pages = self._run_mineru(file_path, runtime_config)
+        else:
+            raw_pages = self._run_mineru_sharded(file_path, runtime_config, page_ranges)
+        return self._build_document_result(file_path, runtime_config, raw_pages, page_ranges or [])
+
+    def plan_packs(self, file_paths: list[Path]) -> list[list[Path]]:
+        """
+        Group files, in order, into packs that fit one /file_parse request:
+        at most pack_max_files files, pack_max_pages pages and pack_max_bytes
+        bytes, with unique file stems. Files over a budget on their own, or
+        whose page count cannot be read, get a pack of their own.
+        """
+        packs: list[list[Path]] = []
+        current: list[Path] = []
+        current_pages = current_bytes = 0
+        for file_path in map(Path, file_paths):
+            page_count = count_pdf_pages(file_path)
+            size = file_path.stat().st_size
+            fits = (
+                page_count is not None
+                and len(current) < self.pack_max_files
+                and current_pages + page_count <= self.pack_max_pages
+                and current_bytes + size <= self.pack_max_bytes
+                and file_path.stem not in {packed.stem for packed in current}
+            )
+            if current and not fits:
+                packs.append(current)
+                current, current_pages, current_bytes = [], 0, 0
+            current.append(file_path)
+            current_pages += page_count if page_count is not None else self.pack_max_pages
+            current_bytes += size
+        if current:
+            packs.append(current)
+        return packs
+
+    def process_documents(self, file_paths: list[Path], **kwargs: Any) -> list[ParsedDocumentResult]:
+        """
+        Parse several files with one multi-file /file_parse request and split
+        the response back into one ParsedDocumentResult per file. Page
+        selection and sharding are per file, so with those options (or a
+        single file) each file is parsed on its own.
+        """
+        file_paths = [Path(file_path) for file_path in file_paths]
+        per_file_options = ("pages", "max_pages", "shard_pages")
+        if len(file_paths) < 2 or any(
+            kwargs.get(option, getattr(self, option)) for option in per_file_options
+        ):
+            return [self.process_document(file_path, **kwargs) for file_path in file_paths]
+
+        self._ensure_runtime()
+        runtime_config = self._build_runtime_config(**kwargs)
+        with self._get_service_manager().lease() as base_url:
+            file_pages = self._create_client(base_url).parse_files(file_paths, runtime_config)
+        results = []
+        for file_path, raw_pages in zip(file_paths, file_pages):
+            parsed = self._build_document_result(file_path, runtime_config, raw_pages, [])
+            parsed.metadata["packed_files"] = len(file_paths)
+            results.append(parsed)
+        return results
+
+    async def aprocess_document(self, file_path: Path, **kwargs: Any) -> ParsedDocumentResult:
+        """
+        asyncio variant of process_document. Requests go through
+        AsyncMinerUClient, so many documents (and shards) can be in flight on
+        one event loop, bounded by async_max_concurrency per service instance.
+        """
+        self._ensure_runtime()
+        runtime_config = self._build_runtime_config(**kwargs)
+        page_ranges = await asyncio.to_thread(self._plan_page_ranges, file_path, kwargs)
+        if page_ranges is None:
+            raw_pages = await self._arun_mineru(file_path, runtime_config)
+        else:
+            shard_results = await asyncio.gather(
+                *(self._arun_mineru(file_path, runtime_config, page_range) for page_range in page_ranges)
+            )
+            raw_pages = [page for shard_pages in shard_results for page in shard_pages]
+        return self._build_document_result(file_path, runtime_config, raw_pages, page_ranges or [])
+
+    async def _arun_mineru(
+        self,
+        file_path: Path,
+        runtime_config: dict[str, Any],
+        page_range: PageRange | None = None,
+    ) -> list[dict[str, Any]]:
+        async with self._alease() as base_url:
+            client = self._get_async_client(base_url)
+            return await client.parse_file(file_path, runtime_config, page_range=page_range)
+
+    @contextlib.asynccontextmanager
+    async def _alease(self) -> AsyncIterator[str]:
+        # Leasing may start mineru-api, health-check a pool member or replace a dead one;
+        # all of that blocks, so both ends of the lease run in worker threads.
+        lease = self._get_service_manager().lease()
+        base_url = await asyncio.to_thread(lease.__enter__)
+        try:
+            yield base_url
+        except BaseException as exc:
+            if not await asyncio.to_thread(lease.__exit__, type(exc), exc, exc.__traceback__):
+                raise
+        else:
+            await asyncio.to_thread(lease.__exit__, None, None, None)
+
+    def _get_async_client(self, base_url: str) -> AsyncMinerUClient:
+        with self._service_lock:
+            client = self._async_clients.get(base_url)
+            if client is None:
+                client = AsyncMinerUClient(
+                    base_url,
+                    timeout=self.request_timeout,
+                    max_concurrency=self.async_max_concurrency,
+                    retain_raw=self.retain_raw_response,
+                    response_format_zip=self.response_format_zip,
+                    image_dir=self.image_dir,
+                )
+                self._async_clients[base_url] = client
+            return client
+
+    def _build_document_result(
+        self,
+        file_path: Path,
+        runtime_config: dict[str, Any],
+        raw_pages: list[dict[str, Any]],
+        page_ranges: list[PageRange],
+    ) -> ParsedDocumentResult:
         pages = [
             ParsedPageResult(
                 page_number=item["page_number"],
@@ -142,6 +418,8 @@ class MinerUEngine(BasePDFEngine):
             for item in raw_pages
         ]
         engine_specific_items = [page.metadata.get("engine_specific", {}) for page in pages]
+        # Clients attach each request's timing breakdown to the first page it returned.
+        request_timings = [item["timings"] for item in raw_pages if item.get("timings")]
         quality_metadata = {
             "ocr_applied": any(bool(item.get("ocr_applied")) for item in engine_specific_items),
             "ocr_text_chars": sum(int(item.get("ocr_text_chars", 0) or 0) for item in engine_specific_items),
@@ -154,6 +432,9 @@ class MinerUEngine(BasePDFEngine):
             "header_footer_removed_count": sum(
                 int(item.get("header_footer_removed_count", 0) or 0) for item in engine_specific_items
             ),
+            "retained_raw_bytes": sum(
+                int(item.get("retained_bytes", 0) or 0) for item in engine_specific_items
+            ),
         }
         return ParsedDocumentResult(
             source=str(file_path),
@@ -168,6 +449,9 @@ class MinerUEngine(BasePDFEngine):
                 "enable_ocr": runtime_config["enable_ocr"],
                 "model_policy": self.model_policy,
                 "model_source": self.model_source,
+                "shard_count": max(1, len(page_ranges)),
+                "service_startup_seconds": getattr(self._service_manager, "startup_seconds", None),
+                "request_timings": merge_request_timings(request_timings) if request_timings else None,
                 **quality_metadata,
             },
         )
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import socket
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any
+from urllib.parse import urlsplit
+
+from langparse.engines.pdf.http_pool import _IDEMPOTENT_METHODS, HTTPResponse, _RequestNotSentError
+from langparse.engines.pdf.mineru_client import MinerUClient, add_request_timing
+
+
+@dataclass
+class _AsyncConnection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+
+    def is_dropped(self) -> bool:
+        # An idle keep-alive connection has nothing to read; EOF means the server closed it.
+        return self.writer.is_closing() or self.reader.at_eof()
+
+    def close(self) -> None:
+        try:
+            self.writer.close()
+        except RuntimeError:
+            # The event loop that owned this stream is already closed; end the TCP connection directly.
+            sock = self.writer.get_extra_info("socket")
+            if sock is not None:
+                with contextlib.suppress(OSError):
+                    sock.shutdown(socket.SHUT_RDWR)
+
+
+class AsyncMinerUClient(MinerUClient):
+    """
+    asyncio counterpart of MinerUClient. health(), parse_file() and
+    parse_files() are coroutines; form building and response normalization are shared with the
+    blocking client. Requests run on the caller's event loop over kept-alive
+    HTTP/1.1 connections, with at most max_concurrency requests in flight.
+    ZIP responses are spooled as they arrive and unpacked in a worker thread.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 300.0,
+        max_concurrency: int = 64,
+        retain_raw: bool = False,
+        response_format_zip: bool = False,
+        image_dir: str | Path | None = None,
+    ):
+        super().__init__(
+            base_url,
+            timeout=timeout,
+            retain_raw=retain_raw,
+            response_format_zip=response_format_zip,
+            image_dir=image_dir,
+        )
+        parts = urlsplit(self.base_url)
+        if parts.scheme not in {"", "http"}:
+            raise ValueError(f"AsyncMinerUClient only supports http:// URLs, got: {self.base_url}")
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.path_prefix = parts.path.rstrip("/")
+        self.max_concurrency = max_concurrency
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._idle: list[_AsyncConnection] = []
+
+    async def health(self) -> dict[str, Any]:
+        return await self._request_json("GET", "/health")
+
+    async def parse_file(
+        self,
+        file_path: Path,
+        runtime_config: dict[str, Any],
+        page_range: tuple[int, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        fields = self._build_form_fields(runtime_config, page_range=page_range)
+        page_offset = page_range[0] if page_range else 0
+        with self._collect_timings() as timings:
+            if self.response_format_zip:
+                file_paths = [Path(file_path)]
+                spool = await self._request_zip("POST", "/file_parse", fields=fields, file_paths=file_paths)
+                with spool:
+                    (pages,) = await asyncio.to_thread(
+                        self._read_archive, spool, file_paths, page_offset=page_offset
+                    )
+            else:
+                response = await self._request_json("POST", "/file_parse", fields=fields, file_path=file_path)
+                (pages,) = self._normalize_file_results(response, [Path(file_path)], page_offset=page_offset)
+        pages[0]["timings"] = timings
+        return pages
+
+    async def parse_files(
+        self,
+        file_paths: list[Path],
+        runtime_config: dict[str, Any],
+    ) -> list[list[dict[str, Any]]]:
+        file_paths = [Path(file_path) for file_path in file_paths]
+        if len({file_path.stem for file_path in file_paths}) != len(file_paths):
+            raise ValueError("Files packed into one MinerU request must have unique names.")
+        fields = self._build_form_fields(runtime_config)
+        with self._collect_timings() as timings:
+            if self.response_format_zip:
+                spool = await self._request_zip("POST", "/file_parse", fields=fields, file_paths=file_paths)
+                with spool:
+                    file_pages = await asyncio.to_thread(self._read_archive, spool, file_paths)
+            else:
+                response = await self._request_json("POST", "/file_parse", fields=fields, file_paths=file_paths)
+                file_pages = self._normalize_file_results(response, file_paths)
+        self._share_timings(file_pages, timings)
+        return file_pages
+
+    async def aclose(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close idle connections; safe to call after their event loop has finished."""
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    async def _request_json(
+        self,
+        method: str,
+        path: str,
+        fields: dict[str, str] | None = None,
+        file_path: Path | None = None,
+        file_paths: list[Path] | None = None,
+    ) -> dict[str, Any]:
+        response = await self._request(method, path, fields=fields, file_path=file_path, file_paths=file_paths)
+        started = time.perf_counter()
+        try:
+            return json.loads(response.body.decode("utf-8"))
+        except json.JSONDecodeError as exc:
+            raise RuntimeError("MinerU API returned a non-JSON response.") from exc
+        finally:
+            add_request_timing("decode_seconds", time.perf_counter() - started)
+
+    async def _request_zip(
+        self,
+        method: str,
+        path: str,
+        fields: dict[str, str] | None = None,
+        file_paths: list[Path] | None = None,
+    ) -> IO[bytes]:
+        spool = tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MEMORY_BYTES)
+        try:
+            await self._request(
+                method, path, fields=fields, file_paths=file_paths, accept="application/zip", sink=spool
+            )
+        except BaseException:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        fields: dict[str, str] | None = None,
+        file_path: Path | None = None,
+        file_paths: list[Path] | None = None,
+        accept: str = "application/json",
+        sink: IO[bytes] | None = None,
+    ) -> HTTPResponse:
+        headers = {"Accept": accept}
+        body = None
+        files = list(file_paths or []) + ([file_path] if file_path is not None else [])
+        if files:
+            body, content_type = self._encode_multipart_form(fields or {}, *files)
+            headers["Content-Type"] = content_type
+            headers["Content-Length"] = str(body.content_length)
+
+        async with self._get_semaphore():
+            try:
+                response = await asyncio.wait_for(
+                    self._send(method, f"{self.path_prefix}{path}", headers, body, sink),
+                    timeout=self.timeout,
+                )
+            except asyncio.TimeoutError as exc:
+                raise RuntimeError("MinerU API request failed: timed out") from exc
+            except (OSError, asyncio.IncompleteReadError, ValueError) as exc:
+                raise RuntimeError(f"MinerU API request failed: {exc}") from exc
+
+        if response.status >= 400:
+            detail = response.body.decode("utf-8", errors="replace")
+            raise RuntimeError(f"MinerU API request failed with HTTP {response.status}: {detail}")
+        self._record_response_timings(response)
+        return response
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Streams and semaphores are bound to one event loop; start fresh on a new one.
+            for connection in self._idle:
+                connection.close()
+            self._idle = []
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def _send(
+        self, method: str, target: str, headers: dict[str, str], body, sink: IO[bytes] | None = None
+    ) -> HTTPResponse:
+        while self._idle and self._idle[-1].is_dropped():
+            self._idle.pop().close()
+        reused = bool(self._idle)
+        connection = self._idle.pop() if reused else await self._connect()
+        try:
+            try:
+                response = await self._exchange(connection, method, target, headers, body, sink)
+            except (ConnectionError, asyncio.IncompleteReadError) as exc:
+                # Replay only what the server cannot have started on: a dropped
+                # POST /file_parse may already be running inference.
+                replayable = isinstance(exc, _RequestNotSentError) or method.upper() in _IDEMPOTENT_METHODS
+                if not reused or not replayable:
+                    raise
+                # The server closed an idle keep-alive connection; retry once on a new one.
+                connection.close()
+                connection = await self._connect()
+                if sink is not None:
+                    sink.seek(0)
+                    sink.truncate()
+                response = await self._exchange(connection, method, target, headers, body, sink)
+        except BaseException:
+            connection.close()
+            raise
+
+        if response.headers.get("connection", "").lower() == "close":
+            connection.close()
+        else:
+            self._idle.append(connection)
+        return response
+
+    async def _connect(self) -> _AsyncConnection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        return _AsyncConnection(reader=reader, writer=writer)
+
+    async def _exchange(
+        self,
+        connection: _AsyncConnection,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        body,
+        sink: IO[bytes] | None = None,
+    ) -> HTTPResponse:
+        writer = connection.writer
+        started = time.perf_counter()
+        head = [f"{method} {target} HTTP/1.1", f"Host: {self.host}:{self.port}"]
+        head.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is None and method in {"POST", "PUT"}:
+            head.append("Content-Length: 0")
+        try:
+            writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1"))
+            if body is not None:
+                for block in body:
+                    writer.write(block)
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError as exc:
+            raise _RequestNotSentError(str(exc) or type(exc).__name__) from exc
+        sent = time.perf_counter()
+        response = await self._read_response(connection.reader, sink)
+        response.timings["upload_seconds"] = sent - started
+        return response
+
+    async def _read_response(
+        self, reader: asyncio.StreamReader, sink: IO[bytes] | None = None
+    ) -> HTTPResponse:
+        started = time.perf_counter()
+        status_line = (await reader.readuntil(b"\r\n")).decode("latin-1").strip()
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ValueError(f"Malformed HTTP status line: {status_line!r}")
+        status = int(parts[1])
+        reason = parts[2] if len(parts) > 2 else ""
+
+        headers: dict[str, str] = {}
+        while True:
+            line = (await reader.readuntil(b"\r\n")).decode("latin-1")
+            if line == "\r\n":
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        received = time.perf_counter()
+
+        # Successful bodies go to the sink as they arrive; error bodies stay in memory.
+        chunks: list[bytes] = []
+        write = sink.write if sink is not None and status < 400 else chunks.append
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            while True:
+                size = int((await reader.readuntil(b"\r\n")).split(b";", 1)[0], 16)
+                if size == 0:
+                    while (await reader.readuntil(b"\r\n")) != b"\r\n":
+                        pass
+                    break
+                write(await reader.readexactly(size))
+                await reader.readexactly(2)
+        elif "content-length" in headers:
+            remaining = int(headers["content-length"])
+            while remaining:
+                block = await reader.readexactly(min(remaining, 64 * 1024))
+                write(block)
+                remaining -= len(block)
+        else:
+            while block := await reader.read(64 * 1024):
+                write(block)
+            headers["connection"] = "close"
+        timings = {"server_seconds": received - started, "download_seconds": time.perf_counter() - received}
+        return HTTPResponse(
+            status=status, reason=reason, headers=headers, body=b"".join(chunks), timings=timings
+        )
@@ -1,36 +1,278 @@
 from __future__ import annotations
 
+import base64
+import http.client
 import json
 import mimetypes
+import shutil
+import tempfile
+import time
 import uuid
+import zipfile
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Any
-from urllib import request
-from urllib.error import HTTPError, URLError
+from typing import IO, Any, Iterator
+
+from langparse.engines.pdf.http_pool import HTTPConnectionPool, HTTPResponse, default_connection_pool
+from langparse.metrics import REQUEST_TIMING_PHASES
+
+# Timings of the parse_file()/parse_files() call running in the current thread or task.
+_active_timings: ContextVar[dict[str, Any] | None] = ContextVar("mineru_request_timings", default=None)
+
+
+def estimate_payload_bytes(value: Any) -> int:
+    """Approximate the UTF-8 size of a decoded JSON payload without re-serializing it."""
+    if isinstance(value, str):
+        return len(value.encode("utf-8"))
+    if isinstance(value, dict):
+        return sum(estimate_payload_bytes(key) + estimate_payload_bytes(item) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_payload_bytes(item) for item in value)
+    if value is None or isinstance(value, bool):
+        return 4
+    return 8
+
+
+def new_request_timings() -> dict[str, Any]:
+    return {"requests": 0, **dict.fromkeys(REQUEST_TIMING_PHASES, 0.0), "server_reported_seconds": None}
+
+
+def merge_request_timings(items: list[dict[str, Any]]) -> dict[str, Any]:
+    """Sum request timings; server_reported_seconds stays None unless some request reported it."""
+    merged = new_request_timings()
+    for item in items:
+        merged["requests"] += int(item.get("requests", 0) or 0)
+        for phase in REQUEST_TIMING_PHASES:
+            merged[phase] += float(item.get(phase, 0.0) or 0.0)
+        if item.get("server_reported_seconds") is not None:
+            merged["server_reported_seconds"] = (merged["server_reported_seconds"] or 0.0) + float(
+                item["server_reported_seconds"]
+            )
+    for phase in (*REQUEST_TIMING_PHASES, "server_reported_seconds"):
+        if merged[phase] is not None:
+            merged[phase] = round(merged[phase], 4)
+    return merged
+
+
+def server_reported_seconds(headers: dict[str, str]) -> float | None:
+    """
+    Processing time reported by the server: the `total` entry of a
+    Server-Timing header (or the sum of its durations, in milliseconds), else
+    X-Process-Time in seconds.
+    """
+    durations = {}
+    for entry in headers.get("server-timing", "").split(","):
+        name, *params = (part.strip() for part in entry.split(";"))
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "dur":
+                try:
+                    durations[name] = float(value.strip('"')) / 1000
+                except ValueError:
+                    pass
+    if durations:
+        return durations.get("total", sum(durations.values()))
+    try:
+        return float(headers["x-process-time"])
+    except (KeyError, ValueError):
+        return None
+
+
+def add_request_timing(phase: str, seconds: float) -> None:
+    timings = _active_timings.get()
+    if timings is not None:
+        timings[phase] += seconds
+
+
+class MultipartFormBody:
+    """
+    multipart/form-data body that is streamed from disk in fixed-size blocks.
+    The Content-Length is computed up front from the part headers and file
+    sizes, so upload memory stays constant regardless of file size. The body
+    can be iterated more than once, which lets a request be retried.
+    """
+
+    def __init__(
+        self,
+        fields: dict[str, str],
+        files: list[Path],
+        file_field: str = "files",
+        block_size: int = 64 * 1024,
+    ):
+        self.boundary = f"----langparse-mineru-{uuid.uuid4().hex}"
+        self.block_size = block_size
+        self._segments: list[bytes | Path] = []
+        for name, value in fields.items():
+            self._segments.append(
+                (
+                    f"--{self.boundary}\r\n"
+                    f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                    f"{value}\r\n"
+                ).encode("utf-8")
+            )
+        for file_path in files:
+            file_path = Path(file_path)
+            content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
+            self._segments.append(
+                (
+                    f"--{self.boundary}\r\n"
+                    f'Content-Disposition: form-data; name="{file_field}"; filename="{file_path.name}"\r\n'
+                    f"Content-Type: {content_type}\r\n\r\n"
+                ).encode("utf-8")
+            )
+            self._segments.append(file_path)
+            self._segments.append(b"\r\n")
+        self._segments.append(f"--{self.boundary}--\r\n".encode("utf-8"))
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def content_length(self) -> int:
+        return sum(
+            segment.stat().st_size if isinstance(segment, Path) else len(segment)
+            for segment in self._segments
+        )
+
+    def __iter__(self) -> Iterator[bytes]:
+        for segment in self._segments:
+            if not isinstance(segment, Path):
+                yield segment
+                continue
+            with segment.open("rb") as handle:
+                while True:
+                    block = handle.read(self.block_size)
+                    if not block:
+                        break
+                    yield block
 
 
 class MinerUClient:
-    def __init__(self, base_url: str, timeout: float = 300.0):
+    """
+    Blocking client for mineru-api's /file_parse.
+
+    By default responses are JSON, with content lists (and base64 images) as
+    strings inside one document. With response_format_zip the service sends a
+    ZIP archive instead: it is spooled to a temporary file (in memory up to
+    ZIP_SPOOL_MEMORY_BYTES) and each file's markdown and content list members
+    are decoded only when that file is normalized. With image_dir set, images
+    are requested and written to image_dir/<file stem>/, and pages list them
+    under `images`.
+
+    Each call records where its time went (see REQUEST_TIMING_PHASES, plus
+    any server-reported processing time) and attaches the breakdown to the
+    first returned page under `timings`.
+    """
+
+    ZIP_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 300.0,
+        connection_pool: HTTPConnectionPool | None = None,
+        retain_raw: bool = False,
+        response_format_zip: bool = False,
+        image_dir: str | Path | None = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.retain_raw = retain_raw
+        self.response_format_zip = response_format_zip
+        self.image_dir = Path(image_dir).expanduser() if image_dir else None
+        # Keep-alive connections are shared through the pool, so short-lived
+        # clients still reuse TCP connections to the same mineru-api host.
+        self.connection_pool = connection_pool or default_connection_pool()
 
     def health(self) -> dict[str, Any]:
         return self._request_json("GET", "/health")
 
-    def parse_file(self, file_path: Path, runtime_config: dict[str, Any]) -> list[dict[str, Any]]:
-        response = self._request_json(
-            "POST",
-            "/file_parse",
-            fields=self._build_form_fields(runtime_config),
-            file_path=file_path,
-        )
-        return self._normalize_parse_response(response)
+    def parse_file(
+        self,
+        file_path: Path,
+        runtime_config: dict[str, Any],
+        page_range: tuple[int, int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Parse a file through /file_parse. page_range is an inclusive, 0-based
+        (start, end) page range; returned page numbers are always document-global.
+        """
+        fields = self._build_form_fields(runtime_config, page_range=page_range)
+        page_offset = page_range[0] if page_range else 0
+        with self._collect_timings() as timings:
+            if self.response_format_zip:
+                file_paths = [Path(file_path)]
+                with self._request_zip("POST", "/file_parse", fields=fields, file_paths=file_paths) as spool:
+                    (pages,) = self._read_archive(spool, file_paths, page_offset=page_offset)
+            else:
+                response = self._request_json("POST", "/file_parse", fields=fields, file_path=file_path)
+                (pages,) = self._normalize_file_results(response, [Path(file_path)], page_offset=page_offset)
+        pages[0]["timings"] = timings
+        return pages
+
+    def parse_files(
+        self,
+        file_paths: list[Path],
+        runtime_config: dict[str, Any],
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Parse several files in one /file_parse request (one "files" part each)
+        and return each file's pages in input order. mineru-api keys results by
+        file stem, so the stems within one request must be unique.
+        """
+        file_paths = [Path(file_path) for file_path in file_paths]
+        stems = [file_path.stem for file_path in file_paths]
+        if len(set(stems)) != len(stems):
+            raise ValueError("Files packed into one MinerU request must have unique names.")
+        fields = self._build_form_fields(runtime_config)
+        with self._collect_timings() as timings:
+            if self.response_format_zip:
+                with self._request_zip("POST", "/file_parse", fields=fields, file_paths=file_paths) as spool:
+                    file_pages = self._read_archive(spool, file_paths)
+            else:
+                response = self._request_json("POST", "/file_parse", fields=fields, file_paths=file_paths)
+                file_pages = self._normalize_file_results(response, file_paths)
+        self._share_timings(file_pages, timings)
+        return file_pages
 
-    def _build_form_fields(self, runtime_config: dict[str, Any]) -> dict[str, str]:
+    @contextmanager
+    def _collect_timings(self) -> Iterator[dict[str, Any]]:
+        timings = new_request_timings()
+        token = _active_timings.set(timings)
+        try:
+            yield timings
+        finally:
+            _active_timings.reset(token)
+
+    def _share_timings(self, file_pages: list[list[dict[str, Any]]], timings: dict[str, Any]) -> None:
+        # A packed request is shared: its seconds are split evenly across the
+        # files and the request itself is counted once, on the first file.
+        for index, pages in enumerate(file_pages):
+            share = {
+                key: value / len(file_pages) if isinstance(value, float) else value
+                for key, value in timings.items()
+            }
+            share["requests"] = timings["requests"] if index == 0 else 0
+            pages[0]["timings"] = share
+
+    def _build_form_fields(
+        self,
+        runtime_config: dict[str, Any],
+        page_range: tuple[int, int] | None = None,
+    ) -> dict[str, str]:
         fields = {
             "return_md": "true",
-            "response_format_zip": "false",
+            "response_format_zip": "true" if self.response_format_zip else "false",
         }
+        if self.response_format_zip:
+            fields["return_content_list"] = "true"
+        if self.image_dir is not None:
+            fields["return_images"] = "true"
+        if page_range is not None:
+            fields["start_page_id"] = str(page_range[0])
+            fields["end_page_id"] = str(page_range[1])
         extra_options = runtime_config.get("extra_options", {})
         if runtime_config.get("enable_ocr") is False:
             fields["method"] = "txt"
@@ -52,97 +294,293 @@ class MinerUClient:
         path: str,
         fields: dict[str, str] | None = None,
         file_path: Path | None = None,
+        file_paths: list[Path] | None = None,
     ) -> dict[str, Any]:
-        headers = {"Accept": "application/json"}
+        response = self._request(method, path, fields=fields, file_path=file_path, file_paths=file_paths)
+        started = time.perf_counter()
+        try:
+            return json.loads(response.body.decode("utf-8"))
+        except json.JSONDecodeError as exc:
+            raise RuntimeError("MinerU API returned a non-JSON response.") from exc
+        finally:
+            add_request_timing("decode_seconds", time.perf_counter() - started)
+
+    def _request_zip(
+        self,
+        method: str,
+        path: str,
+        fields: dict[str, str] | None = None,
+        file_paths: list[Path] | None = None,
+    ) -> IO[bytes]:
+        """Send a request and return its body spooled to a temporary file, rewound."""
+        spool = tempfile.SpooledTemporaryFile(max_size=self.ZIP_SPOOL_MEMORY_BYTES)
+        try:
+            self._request(
+                method, path, fields=fields, file_paths=file_paths, accept="application/zip", sink=spool
+            )
+        except BaseException:
+            spool.close()
+            raise
+        spool.seek(0)
+        return spool
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        fields: dict[str, str] | None = None,
+        file_path: Path | None = None,
+        file_paths: list[Path] | None = None,
+        accept: str = "application/json",
+        sink: IO[bytes] | None = None,
+    ) -> HTTPResponse:
+        headers = {"Accept": accept}
         data = None
-        if file_path is not None:
-            data, content_type = self._encode_multipart_form(fields or {}, file_path)
+        files = list(file_paths or []) + ([file_path] if file_path is not None else [])
+        if files:
+            data, content_type = self._encode_multipart_form(fields or {}, *files)
             headers["Content-Type"] = content_type
+            headers["Content-Length"] = str(data.content_length)
 
-        req = request.Request(
-            f"{self.base_url}{path}",
-            data=data,
-            headers=headers,
-            method=method,
-        )
         try:
-            with request.urlopen(req, timeout=self.timeout) as response:
-                payload = response.read().decode("utf-8")
-        except HTTPError as exc:
-            detail = exc.read().decode("utf-8", errors="replace")
-            raise RuntimeError(f"MinerU API request failed with HTTP {exc.code}: {detail}") from exc
-        except URLError as exc:
-            raise RuntimeError(f"MinerU API request failed: {exc.reason}") from exc
+            response = self.connection_pool.request(
+                method,
+                f"{self.base_url}{path}",
+                body=data,
+                headers=headers,
+                timeout=self.timeout,
+                sink=sink,
+            )
+        except (OSError, http.client.HTTPException) as exc:
+            raise RuntimeError(f"MinerU API request failed: {exc}") from exc
 
-        try:
-            return json.loads(payload)
-        except json.JSONDecodeError as exc:
-            raise RuntimeError("MinerU API returned a non-JSON response.") from exc
+        if response.status >= 400:
+            detail = response.body.decode("utf-8", errors="replace")
+            raise RuntimeError(f"MinerU API request failed with HTTP {response.status}: {detail}")
+        self._record_response_timings(response)
+        return response
 
-    def _encode_multipart_form(self, fields: dict[str, str], file_path: Path) -> tuple[bytes, str]:
-        boundary = f"----langparse-mineru-{uuid.uuid4().hex}"
-        lines: list[bytes] = []
-        for name, value in fields.items():
-            lines.extend(
-                [
-                    f"--{boundary}".encode("utf-8"),
-                    f'Content-Disposition: form-data; name="{name}"'.encode("utf-8"),
-                    b"",
-                    str(value).encode("utf-8"),
-                ]
+    def _record_response_timings(self, response: HTTPResponse) -> None:
+        timings = _active_timings.get()
+        if timings is None:
+            return
+        timings["requests"] += 1
+        for phase, seconds in response.timings.items():
+            timings[phase] += seconds
+        reported = server_reported_seconds(response.headers)
+        if reported is not None:
+            timings["server_reported_seconds"] = (timings["server_reported_seconds"] or 0.0) + reported
+
+    def _encode_multipart_form(
+        self, fields: dict[str, str], *file_paths: Path
+    ) -> tuple[MultipartFormBody, str]:
+        body = MultipartFormBody(fields, list(file_paths))
+        return body, body.content_type
+
+    def _split_file_results(
+        self, response: dict[str, Any], file_paths: list[Path]
+    ) -> list[dict[str, Any]]:
+        """
+        Return each file's part of a /file_parse response. mineru-api wraps
+        per-file output in a "results" dict keyed by file stem; responses
+        without it describe a single file.
+        """
+        results = response.get("results")
+        if not isinstance(results, dict):
+            if len(file_paths) != 1:
+                raise RuntimeError("MinerU API returned a single result for a multi-file request.")
+            return [response]
+        file_responses = []
+        for file_path in file_paths:
+            file_response = results.get(file_path.stem, results.get(file_path.name))
+            if file_response is None and len(file_paths) == 1 and len(results) == 1:
+                file_response = next(iter(results.values()))
+            if not isinstance(file_response, dict):
+                raise RuntimeError(f"MinerU API returned no result for {file_path.name}.")
+            file_responses.append(file_response)
+        return file_responses
+
+    def _normalize_file_results(
+        self, response: dict[str, Any], file_paths: list[Path], page_offset: int = 0
+    ) -> list[list[dict[str, Any]]]:
+        normalized = []
+        for file_path, file_response in zip(file_paths, self._split_file_results(response, file_paths)):
+            started = time.perf_counter()
+            image_paths = self._write_response_images(file_response, file_path)
+            decoded = time.perf_counter()
+            normalized.append(
+                self._normalize_parse_response(
+                    file_response, page_offset=page_offset, image_paths=image_paths
+                )
             )
+            add_request_timing("decode_seconds", decoded - started)
+            add_request_timing("normalize_seconds", time.perf_counter() - decoded)
+        return normalized
 
-        content_type = mimetypes.guess_type(file_path.name)[0] or "application/octet-stream"
-        file_bytes = file_path.read_bytes()
-        lines.extend(
-            [
-                f"--{boundary}".encode("utf-8"),
-                f'Content-Disposition: form-data; name="files"; filename="{file_path.name}"'.encode(
-                    "utf-8"
-                ),
-                f"Content-Type: {content_type}".encode("utf-8"),
-                b"",
-                file_bytes,
-                f"--{boundary}--".encode("utf-8"),
-                b"",
-            ]
-        )
-        return b"\r\n".join(lines), f"multipart/form-data; boundary={boundary}"
+    def _read_archive(
+        self, spool: IO[bytes], file_paths: list[Path], page_offset: int = 0
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Normalize a ZIP /file_parse response. mineru-api stores each file's
+        output under a "<stem>/" folder: <stem>.md, <stem>_content_list.json
+        and images/. Members are read one file at a time and images are
+        copied to image_dir without passing through memory as a whole.
+        """
+        if not zipfile.is_zipfile(spool):
+            # Services that ignore response_format_zip answer with JSON.
+            spool.seek(0)
+            started = time.perf_counter()
+            try:
+                response = json.load(spool)
+            except ValueError as exc:
+                raise RuntimeError("MinerU API returned neither a ZIP nor a JSON response.") from exc
+            finally:
+                add_request_timing("decode_seconds", time.perf_counter() - started)
+            return self._normalize_file_results(response, file_paths, page_offset=page_offset)
+
+        normalized = []
+        with zipfile.ZipFile(spool) as archive:
+            names = [name for name in archive.namelist() if not name.endswith("/")]
+            for file_path in file_paths:
+                started = time.perf_counter()
+                members = [name for name in names if name.startswith(f"{file_path.stem}/")]
+                if not members and len(file_paths) == 1:
+                    members = names
+                if not members:
+                    raise RuntimeError(f"MinerU API returned no result for {file_path.name}.")
+                response: dict[str, Any] = {}
+                image_members = []
+                for name in members:
+                    if "images/" in name:
+                        image_members.append(name)
+                    elif name.endswith("_content_list.json"):
+                        response["content_list"] = json.loads(archive.read(name).decode("utf-8"))
+                    elif name.endswith(".md") and "md_content" not in response:
+                        response["md_content"] = archive.read(name).decode("utf-8")
+                image_paths = self._extract_archive_images(archive, image_members, file_path)
+                decoded = time.perf_counter()
+                normalized.append(
+                    self._normalize_parse_response(response, page_offset=page_offset, image_paths=image_paths)
+                )
+                add_request_timing("decode_seconds", decoded - started)
+                add_request_timing("normalize_seconds", time.perf_counter() - decoded)
+        return normalized
+
+    def _extract_archive_images(
+        self, archive: zipfile.ZipFile, members: list[str], file_path: Path
+    ) -> dict[str, str] | None:
+        if self.image_dir is None:
+            return None
+        target_dir = self.image_dir / file_path.stem
+        target_dir.mkdir(parents=True, exist_ok=True)
+        image_paths = {}
+        for name in members:
+            target = target_dir / Path(name).name
+            with archive.open(name) as source, target.open("wb") as handle:
+                shutil.copyfileobj(source, handle, 64 * 1024)
+            image_paths[target.name] = str(target)
+        return image_paths
+
+    def _write_response_images(self, response: dict[str, Any], file_path: Path) -> dict[str, str] | None:
+        """Decode the base64 `images` map of a JSON response into image_dir."""
+        if self.image_dir is None:
+            return None
+        images = response.get("images")
+        if not isinstance(images, dict):
+            return {}
+        target_dir = self.image_dir / file_path.stem
+        target_dir.mkdir(parents=True, exist_ok=True)
+        image_paths = {}
+        for name, data in images.items():
+            # Entries are data URIs ("data:image/jpeg;base64,...") or bare base64.
+            _, _, encoded = str(data).rpartition("base64,")
+            target = target_dir / Path(name).name
+            target.write_bytes(base64.b64decode(encoded))
+            image_paths[target.name] = str(target)
+        return image_paths
 
-    def _normalize_parse_response(self, response: dict[str, Any]) -> list[dict[str, Any]]:
-        markdown = self._extract_markdown(response)
+    def _normalize_parse_response(
+        self,
+        response: dict[str, Any],
+        page_offset: int = 0,
+        image_paths: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        # mineru-api slices the PDF before parsing, so page_idx is relative to page_offset.
         content_list = self._extract_content_list(response)
         if not content_list:
-            return [{"page_number": 1, "markdown": markdown}]
+            return [{"page_number": page_offset + 1, "markdown": self._extract_markdown(response)}]
 
-        page_map: dict[int, list[dict[str, Any]]] = {}
+        # Single pass over content_list: each item is turned into its element and
+        # markdown fragment once, and raw items are only kept when retain_raw is set.
+        page_map: dict[int, dict[str, Any]] = {}
         for item in content_list:
             page_idx = int(item.get("page_idx", 0))
-            page_map.setdefault(page_idx, []).append(item)
+            page = page_map.get(page_idx)
+            if page is None:
+                page = page_map[page_idx] = {
+                    "page_number": page_offset + page_idx + 1,
+                    "text_lines": [],
+                    "markdown_parts": [],
+                    "elements": [],
+                    "images": [],
+                    "raw_items": [],
+                }
+            if image_paths and item.get("img_path"):
+                image_path = image_paths.get(Path(item["img_path"]).name)
+                if image_path is not None:
+                    item = {**item, "img_path": image_path}
+                    page["images"].append(
+                        {"path": image_path, "caption": self._item_caption(item), "bbox": item.get("bbox")}
+                    )
+            text = item.get("text") or ""
+            if text:
+                page["text_lines"].append(text)
+            fragment = self._item_markdown(item)
+            if fragment:
+                page["markdown_parts"].append(fragment)
+            page["elements"].append(
+                {
+                    "kind": item.get("type", "text"),
+                    "text": text,
+                    "bbox": item.get("bbox"),
+                    "metadata": {"page_idx": page_offset + page_idx},
+                }
+            )
+            if self.retain_raw:
+                page["raw_items"].append(item)
 
         pages = []
         for page_idx in sorted(page_map):
-            items = page_map[page_idx]
-            text_lines = [item.get("text", "") for item in items if item.get("text")]
-            pages.append(
-                {
-                    "page_number": page_idx + 1,
-                    "markdown": "\n".join(text_lines) or markdown,
-                    "plain_text": "\n".join(text_lines),
-                    "elements": [
-                        {
-                            "kind": item.get("type", "text"),
-                            "text": item.get("text", ""),
-                            "bbox": item.get("bbox"),
-                            "metadata": {"page_idx": page_idx},
-                        }
-                        for item in items
-                    ],
-                    "engine_specific": {"content_list": items},
-                }
+            page = page_map.pop(page_idx)
+            raw_items = page.pop("raw_items")
+            text_lines = page.pop("text_lines")
+            page["markdown"] = "\n".join(page.pop("markdown_parts"))
+            page["plain_text"] = "\n".join(text_lines)
+            page["engine_specific"] = (
+                {"content_list": raw_items, "retained_bytes": estimate_payload_bytes(raw_items)}
+                if self.retain_raw
+                else {}
             )
+            pages.append(page)
+
+        if not any(page["markdown"] for page in pages):
+            # Nothing renderable per page: keep the document markdown once, on the first page.
+            pages[0]["markdown"] = self._extract_markdown(response)
         return pages
 
+    def _item_markdown(self, item: dict[str, Any]) -> str:
+        if item.get("table_body"):
+            return str(item["table_body"])
+        if item.get("img_path"):
+            return f"![{self._item_caption(item)}]({item['img_path']})"
+        return item.get("text") or ""
+
+    def _item_caption(self, item: dict[str, Any]) -> str:
+        caption = item.get("image_caption") or item.get("img_caption") or ""
+        if isinstance(caption, list):
+            caption = " ".join(str(part) for part in caption)
+        return caption
+
     def _extract_markdown(self, response: dict[str, Any]) -> str:
         candidates = [
             response.get("md_content"),
@@ -168,6 +606,12 @@ class MinerUClient:
     def _extract_content_list(self, response: dict[str, Any]) -> list[dict[str, Any]]:
         for key in ("content_list", "content_list_v2"):
             value = response.get(key)
+            if isinstance(value, str):
+                # mineru-api's "results" entries carry content_list as a JSON string.
+                try:
+                    value = json.loads(value)
+                except json.JSONDecodeError:
+                    continue
             if isinstance(value, list):
                 if value and isinstance(value[0], dict):
                     return value
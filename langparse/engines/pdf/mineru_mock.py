@@ -0,0 +1,352 @@
+from __future__ import annotations
+
+import argparse
+import base64
+import io
+import json
+import math
+import random
+import threading
+import time
+import zipfile
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Sequence
+
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "exponential", "lognormal")
+
+
+@dataclass
+class MockMinerUBehavior:
+    """
+    How the mock mineru-api responds. Latency is sampled per request from
+    `latency` (constant, uniform, exponential or lognormal around
+    latency_mean, with latency_spread as the half-width or sigma) plus
+    page_latency per returned page. error_rate answers with error_status and
+    disconnect_rate drops the connection without a response. Each page
+    carries images_per_page incompressible images of image_bytes bytes,
+    returned when the request sets return_images.
+    """
+
+    latency: str = "constant"
+    latency_mean: float = 0.0
+    latency_spread: float = 0.0
+    page_latency: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    disconnect_rate: float = 0.0
+    pages: int = 1
+    page_chars: int = 1000
+    images_per_page: int = 0
+    image_bytes: int = 32 * 1024
+    seed: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unsupported latency distribution: {self.latency}. "
+                f"Expected one of: {', '.join(LATENCY_DISTRIBUTIONS)}."
+            )
+        if self.pages < 1:
+            raise ValueError(f"pages must be at least 1, got {self.pages}.")
+
+    def sample_latency(self, rng: random.Random, page_count: int) -> float:
+        mean = max(self.latency_mean, 0.0)
+        if self.latency == "uniform":
+            base = rng.uniform(mean - self.latency_spread, mean + self.latency_spread)
+        elif self.latency == "exponential":
+            base = rng.expovariate(1 / mean) if mean > 0 else 0.0
+        elif self.latency == "lognormal":
+            # Parameterized so the distribution mean stays at latency_mean.
+            sigma = max(self.latency_spread, 0.0)
+            base = rng.lognormvariate(math.log(mean) - sigma**2 / 2, sigma) if mean > 0 else 0.0
+        else:
+            base = mean
+        return max(base, 0.0) + self.page_latency * page_count
+
+
+class MockMinerUServer:
+    """
+    In-process stand-in for mineru-api implementing /health and /file_parse
+    over HTTP/1.1 keep-alive. Responses use the content_list shape of the real
+    service, honour start_page_id/end_page_id and, with response_format_zip,
+    come back as a ZIP archive laid out like mineru-api's. Successful parses
+    carry a Server-Timing header with the simulated processing time. stats() reports request,
+    error and connection counts so client overhead and connection reuse can be
+    measured without models.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        behavior: MockMinerUBehavior | None = None,
+    ):
+        self.behavior = behavior or MockMinerUBehavior()
+        self._rng = random.Random(self.behavior.seed)
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "health_requests": 0,
+            "parse_requests": 0,
+            "errors": 0,
+            "disconnects": 0,
+            "connections": 0,
+            "bytes_received": 0,
+            "bytes_sent": 0,
+            "in_flight": 0,
+            "max_in_flight": 0,
+        }
+        self._image_payload = self._rng.randbytes(self.behavior.image_bytes)
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+            )
+            self._thread.start()
+        return self.base_url
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever(poll_interval=0.05)
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "MockMinerUServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
+
+    def _record(self, **increments: int) -> None:
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[key] += value
+            self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+
+    def _draw(self) -> float:
+        with self._lock:
+            return self._rng.random()
+
+    def _build_parse_response(
+        self, fields: dict[str, str], filenames: list[str] | None = None
+    ) -> tuple[dict[str, Any] | bytes, float]:
+        behavior = self.behavior
+        start = int(fields.get("start_page_id", 0) or 0)
+        end = int(fields.get("end_page_id", behavior.pages - 1) or 0)
+        page_count = max(0, min(end, behavior.pages - 1) - start + 1) or 1
+        filenames = filenames or []
+        # One request's overhead, plus per-page latency for every file it carries.
+        with self._lock:
+            delay = behavior.sample_latency(self._rng, page_count * max(1, len(filenames)))
+
+        filler = ("lorem ipsum " * (behavior.page_chars // 12 + 1))[: behavior.page_chars]
+        content_list = []
+        image_names = []
+        for page_idx in range(page_count):
+            content_list.append(
+                {"type": "text", "text": f"Mock page {start + page_idx + 1}. {filler}", "page_idx": page_idx}
+            )
+            for image_idx in range(behavior.images_per_page):
+                image_names.append(f"page{start + page_idx + 1}_{image_idx}.jpg")
+                content_list.append(
+                    {
+                        "type": "image",
+                        "img_path": f"images/{image_names[-1]}",
+                        "image_caption": [f"Figure {start + page_idx + 1}.{image_idx}"],
+                        "page_idx": page_idx,
+                    }
+                )
+        markdown = "\n\n".join(item["text"] for item in content_list if item["type"] == "text")
+        return_images = fields.get("return_images") == "true"
+        stems = [Path(name).stem for name in filenames] or ["document"]
+
+        if fields.get("response_format_zip") == "true":
+            buffer = io.BytesIO()
+            with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+                for stem in stems:
+                    archive.writestr(f"{stem}/{stem}.md", markdown)
+                    archive.writestr(f"{stem}/{stem}_content_list.json", json.dumps(content_list))
+                    for name in image_names if return_images else []:
+                        archive.writestr(
+                            f"{stem}/images/{name}", self._image_payload, compress_type=zipfile.ZIP_STORED
+                        )
+            return buffer.getvalue(), delay
+
+        response: dict[str, Any] = {"md_content": markdown, "content_list": content_list}
+        if return_images:
+            encoded = "data:image/jpeg;base64," + base64.b64encode(self._image_payload).decode("ascii")
+            response["images"] = {name: encoded for name in image_names}
+        if len(filenames) > 1:
+            # Multi-file requests get mineru-api's per-file "results" shape, keyed by stem.
+            response = {"results": {stem: response for stem in stems}}
+        return response, delay
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self):
+                super().setup()
+                server._record(connections=1)
+
+            def do_GET(self):
+                server._record(requests=1)
+                if self.path.rstrip("/").endswith("/health"):
+                    server._record(health_requests=1)
+                    self._send_json(200, {"status": "ok"})
+                    return
+                self._send_json(404, {"error": f"Unknown path: {self.path}"})
+
+            def do_POST(self):
+                server._record(requests=1, in_flight=1)
+                try:
+                    body = self.rfile.read(int(self.headers.get("Content-Length", 0) or 0))
+                    server._record(bytes_received=len(body))
+                    if not self.path.rstrip("/").endswith("/file_parse"):
+                        self._send_json(404, {"error": f"Unknown path: {self.path}"})
+                        return
+                    server._record(parse_requests=1)
+                    started = time.perf_counter()
+                    content_type = self.headers.get("Content-Type", "")
+                    response, delay = server._build_parse_response(
+                        parse_form_fields(body, content_type), parse_form_filenames(body, content_type)
+                    )
+                    if delay > 0:
+                        time.sleep(delay)
+                    draw = server._draw()
+                    if draw < server.behavior.disconnect_rate:
+                        server._record(disconnects=1)
+                        self.close_connection = True
+                        return
+                    if draw < server.behavior.disconnect_rate + server.behavior.error_rate:
+                        server._record(errors=1)
+                        self._send_json(server.behavior.error_status, {"error": "injected failure"})
+                        return
+                    # Report processing time the way timing middleware in front of mineru-api would.
+                    timing = {"Server-Timing": f"total;dur={(time.perf_counter() - started) * 1000:.3f}"}
+                    if isinstance(response, bytes):
+                        self._send_body(200, response, "application/zip", timing)
+                    else:
+                        self._send_body(200, json.dumps(response).encode("utf-8"), "application/json", timing)
+                finally:
+                    server._record(in_flight=-1)
+
+            def _send_json(self, status: int, payload: dict[str, Any]) -> None:
+                self._send_body(status, json.dumps(payload).encode("utf-8"), "application/json")
+
+            def _send_body(
+                self, status: int, body: bytes, content_type: str, headers: dict[str, str] | None = None
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+                server._record(bytes_sent=len(body))
+
+            def log_message(self, format, *args):
+                return
+
+        return Handler
+
+
+def parse_form_fields(body: bytes, content_type: str) -> dict[str, str]:
+    """Return the plain (non-file) fields of a multipart/form-data body."""
+    _, _, boundary = content_type.partition("boundary=")
+    if not boundary:
+        return {}
+    fields = {}
+    for part in body.split(b"--" + boundary.strip('"').encode("latin-1")):
+        head, separator, value = part.partition(b"\r\n\r\n")
+        if not separator or b"filename=" in head:
+            continue
+        disposition = head.decode("utf-8", errors="replace")
+        _, _, name = disposition.partition('name="')
+        if name:
+            fields[name.split('"', 1)[0]] = value.rstrip(b"\r\n").decode("utf-8", errors="replace")
+    return fields
+
+
+def parse_form_filenames(body: bytes, content_type: str) -> list[str]:
+    """Return the filenames of the file parts of a multipart/form-data body, in order."""
+    _, _, boundary = content_type.partition("boundary=")
+    if not boundary:
+        return []
+    filenames = []
+    for part in body.split(b"--" + boundary.strip('"').encode("latin-1")):
+        head, separator, _ = part.partition(b"\r\n\r\n")
+        _, found, rest = head.partition(b'filename="')
+        if separator and found:
+            filenames.append(rest.split(b'"', 1)[0].decode("utf-8", errors="replace"))
+    return filenames
+
+
+def add_behavior_arguments(parser: argparse.ArgumentParser) -> None:
+    defaults = MockMinerUBehavior()
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default=defaults.latency)
+    parser.add_argument("--latency-mean", type=float, default=defaults.latency_mean)
+    parser.add_argument("--latency-spread", type=float, default=defaults.latency_spread)
+    parser.add_argument("--page-latency", type=float, default=defaults.page_latency)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--disconnect-rate", type=float, default=defaults.disconnect_rate)
+    parser.add_argument("--pages", type=int, default=defaults.pages)
+    parser.add_argument("--page-chars", type=int, default=defaults.page_chars)
+    parser.add_argument("--images-per-page", type=int, default=defaults.images_per_page)
+    parser.add_argument("--image-bytes", type=int, default=defaults.image_bytes)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def behavior_from_args(args: argparse.Namespace) -> MockMinerUBehavior:
+    return MockMinerUBehavior(
+        **{name: getattr(args, name) for name in asdict(MockMinerUBehavior())}
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Serve the mock until interrupted; usable as a MinerUServiceManager command."""
+    parser = argparse.ArgumentParser(prog="python -m langparse.engines.pdf.mineru_mock")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    add_behavior_arguments(parser)
+    args = parser.parse_args(argv)
+
+    server = MockMinerUServer(host=args.host, port=args.port, behavior=behavior_from_args(args))
+    # Same lines uvicorn prints, so the service manager's readiness watcher picks them up.
+    print(f"INFO:     Uvicorn running on {server.base_url} (mock mineru-api)", flush=True)
+    print("INFO:     Application startup complete.", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,19 +1,64 @@
 from __future__ import annotations
 
+import atexit
 import shlex
 import shutil
 import socket
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from contextlib import contextmanager
+from collections import deque
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 import json
 import os
 
 from langparse.engines.pdf.mineru_client import MinerUClient
 
+# Lines mineru-api (uvicorn) prints once it is accepting requests.
+READY_MARKERS = ("Application startup complete", "Uvicorn running on")
+
+
+class _ProcessOutputWatcher:
+    """
+    Drains a child process' combined stdout/stderr on a daemon thread, keeping
+    the last tail_lines lines for error messages and setting `ready` when a
+    READY_MARKERS line appears. Draining continues after startup so the child
+    never blocks on a full pipe.
+    """
+
+    def __init__(self, process: subprocess.Popen, tail_lines: int = 50):
+        self.ready = threading.Event()
+        self.closed = threading.Event()
+        self._tail: deque[str] = deque(maxlen=tail_lines)
+        stream = getattr(process, "stdout", None)
+        if stream is None:
+            self.closed.set()
+            return
+        threading.Thread(target=self._drain, args=(stream,), daemon=True).start()
+
+    @property
+    def tail(self) -> str:
+        return "\n".join(self._tail)
+
+    def _drain(self, stream) -> None:
+        try:
+            for raw_line in iter(stream.readline, b""):
+                line = raw_line.decode("utf-8", errors="replace") if isinstance(raw_line, bytes) else raw_line
+                if not line:
+                    break
+                line = line.rstrip()
+                self._tail.append(line)
+                if any(marker in line for marker in READY_MARKERS):
+                    self.ready.set()
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.closed.set()
+
 
 class MinerUServiceManager:
     def __init__(
@@ -43,28 +88,103 @@ class MinerUServiceManager:
         self.model_source = model_source
         self.auto_install_runtime = auto_install_runtime
         self.runtime_package = runtime_package
+        self._lock = threading.Lock()
+        self._base_url: str | None = None
+        self._process: subprocess.Popen | None = None
+        self._resources: ExitStack | None = None
+        self.startup_seconds: float | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._base_url is not None
+
+    @property
+    def process_alive(self) -> bool:
+        """False once a locally started mineru-api has exited; remote services count as alive."""
+        process = self._process
+        return process is None or process.poll() is None
+
+    def ensure_started(self) -> str:
+        """
+        Return the service base URL, starting a local mineru-api on first use.
+        The service stays up until close() so later calls reuse the loaded models.
+        """
+        with self._lock:
+            if self._base_url is not None and not self.process_alive:
+                # The managed process died; clean it up and start a fresh one.
+                resources, self._resources = self._resources, None
+                self._base_url = None
+                self._process = None
+                if resources is not None:
+                    atexit.unregister(self.close)
+                    resources.close()
+            if self._base_url is None:
+                self._base_url = self._start()
+            return self._base_url
+
+    def close(self) -> None:
+        with self._lock:
+            resources = self._resources
+            self._base_url = None
+            self._process = None
+            self._resources = None
+        if resources is not None:
+            atexit.unregister(self.close)
+            resources.close()
+
+    def __enter__(self) -> "MinerUServiceManager":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @contextmanager
+    def lease(self):
+        yield self.ensure_started()
 
     @contextmanager
     def running_service(self):
-        if self.api_url:
-            yield self.api_url
+        if self.started:
+            yield self.ensure_started()
             return
 
+        try:
+            yield self.ensure_started()
+        finally:
+            self.close()
+
+    def _start(self) -> str:
+        if self.api_url:
+            return self.api_url
+
+        if not self.port:
+            # Port 0 asks for an ephemeral port so concurrent jobs never collide.
+            self.port = self.find_free_port()
+        elif self._is_healthy(MinerUClient(f"http://{self.host}:{self.port}", timeout=self.request_timeout)):
+            return f"http://{self.host}:{self.port}"
+
         base_url = f"http://{self.host}:{self.port}"
         client = MinerUClient(base_url, timeout=self.request_timeout)
-        if self._is_healthy(client):
-            yield base_url
-            return
 
         self._validate_model_policy()
-        home_override_cm = self._prepare_local_home()
-        with home_override_cm as home_override:
+        with ExitStack() as resources:
+            home_override = resources.enter_context(self._prepare_local_home())
             process = self._start_local_service(home_override=home_override)
-            try:
-                self._wait_until_ready(client)
-                yield base_url
-            finally:
-                self._stop_process(process)
+            resources.callback(self._stop_process, process)
+            self._wait_until_ready(client, process)
+            self._process = process
+            self._resources = resources.pop_all()
+
+        # Make sure a forgotten close() does not leave mineru-api running.
+        atexit.register(self.close)
+        return base_url
+
+    def is_healthy(self) -> bool:
+        """True when the service is started, its process is alive and /health answers."""
+        base_url = self._base_url
+        if base_url is None or not self.process_alive:
+            return False
+        return self._is_healthy(MinerUClient(base_url, timeout=self.request_timeout))
 
     def _is_healthy(self, client: MinerUClient) -> bool:
         try:
@@ -88,8 +208,8 @@ class MinerUServiceManager:
         try:
             return subprocess.Popen(
                 args,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 env=env,
             )
         except FileNotFoundError as exc:
@@ -112,17 +232,52 @@ class MinerUServiceManager:
                 f"Failed to install MinerU runtime package: {self.runtime_package}"
             ) from exc
 
-    def _wait_until_ready(self, client: MinerUClient) -> None:
-        deadline = time.time() + self.start_timeout
+    def _wait_until_ready(self, client: MinerUClient, process: subprocess.Popen | None = None) -> None:
+        """
+        Block until the service answers /health. The health check runs as soon
+        as the child prints a ready line, otherwise on an exponential backoff;
+        a child that exits during startup fails immediately with its output.
+        """
+        started = time.monotonic()
+        deadline = started + self.start_timeout
+        watcher = _ProcessOutputWatcher(process) if process is not None else None
+        delay = 0.05
         last_error: Exception | None = None
-        while time.time() < deadline:
+        while True:
             try:
                 client.health()
-                return
-            except Exception as exc:  # pragma: no cover - exercised in timeout flow
+            except Exception as exc:
                 last_error = exc
-                time.sleep(0.25)
-        raise RuntimeError("Timed out waiting for local mineru-api service to become ready.") from last_error
+            else:
+                self.startup_seconds = round(time.monotonic() - started, 4)
+                return
+
+            if process is not None and process.poll() is not None:
+                # Let the reader thread collect the last lines before reporting them.
+                watcher.closed.wait(1.0)
+                raise RuntimeError(
+                    f"Local mineru-api service exited with code {process.returncode} during startup."
+                    + self._format_output_tail(watcher)
+                ) from last_error
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if watcher is not None and not watcher.ready.is_set():
+                watcher.ready.wait(min(delay, remaining))
+            else:
+                time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 1.0)
+
+        raise RuntimeError(
+            "Timed out waiting for local mineru-api service to become ready."
+            + self._format_output_tail(watcher)
+        ) from last_error
+
+    def _format_output_tail(self, watcher: _ProcessOutputWatcher | None) -> str:
+        if watcher is None or not watcher.tail:
+            return ""
+        return f" Last output:\n{watcher.tail}"
 
     def _stop_process(self, process: subprocess.Popen) -> None:
         if process.poll() is not None:
@@ -220,3 +375,177 @@ class MinerUServiceManager:
             }
         }
         config_path.write_text(json.dumps(config, ensure_ascii=False, indent=2), encoding="utf-8")
+
+
+@dataclass(eq=False)
+class _PoolMember:
+    manager: MinerUServiceManager
+    base_url: str
+    outstanding: int = 0
+    last_checked: float = 0.0
+    replacing: bool = False
+
+
+class MinerUServicePool:
+    """
+    Runs several local mineru-api processes on free ports and spreads requests
+    across them, routing each lease to the instance with the fewest requests in
+    flight. Instances that exit or fail a health check are replaced.
+    """
+
+    def __init__(self, size: int, health_check_interval: float = 30.0, **manager_kwargs):
+        if size < 1:
+            raise ValueError(f"MinerU service pool size must be at least 1, got {size}.")
+        manager_kwargs.pop("api_url", None)
+        manager_kwargs["port"] = 0
+        self.size = size
+        self.health_check_interval = health_check_interval
+        self.manager_kwargs = manager_kwargs
+        self._lock = threading.Lock()
+        self._members: list[_PoolMember] = []
+
+    @property
+    def started(self) -> bool:
+        return bool(self._members)
+
+    @property
+    def startup_seconds(self) -> float | None:
+        """Slowest member cold start; members start in parallel, so this is the pool's start-up time."""
+        with self._lock:
+            durations = [
+                member.manager.startup_seconds
+                for member in self._members
+                if member.manager.startup_seconds is not None
+            ]
+        return max(durations) if durations else None
+
+    @property
+    def base_urls(self) -> list[str]:
+        with self._lock:
+            return [member.base_url for member in self._members]
+
+    def ensure_started(self) -> str:
+        """
+        Start the instances on first use and return the first one's base URL,
+        like MinerUServiceManager.ensure_started(). Route requests through
+        lease(); base_urls lists every instance.
+        """
+        with self._lock:
+            if not self._members:
+                self._members = self._start_members(self.size)
+            return self._members[0].base_url
+
+    def close(self) -> None:
+        with self._lock:
+            members, self._members = self._members, []
+        for member in members:
+            member.manager.close()
+
+    def __enter__(self) -> "MinerUServicePool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    @contextmanager
+    def lease(self):
+        self.ensure_started()
+        member = self._acquire()
+        try:
+            yield member.base_url
+        except Exception:
+            try:
+                self._check_member(member, force=True)
+            except Exception:
+                # Surface the request error; a failed replacement shows up on the next lease.
+                pass
+            raise
+        finally:
+            # Also on cancellation or KeyboardInterrupt, so routing counts stay accurate.
+            with self._lock:
+                member.outstanding -= 1
+
+    def _acquire(self) -> _PoolMember:
+        with self._lock:
+            candidates = [member for member in self._members if not member.replacing]
+            if not candidates:
+                raise RuntimeError("Unable to start local mineru-api service: no healthy pool members.")
+            member = min(candidates, key=lambda item: item.outstanding)
+            member.outstanding += 1
+        if not member.manager.process_alive:
+            with self._lock:
+                member.outstanding -= 1
+            self._check_member(member, force=True)
+            return self._acquire()
+        self._check_member(member)
+        with self._lock:
+            current = member in self._members and not member.replacing
+            if not current:
+                member.outstanding -= 1
+        if not current:
+            # The health check replaced it (or another caller is): pick again.
+            return self._acquire()
+        return member
+
+    def _check_member(self, member: _PoolMember, force: bool = False) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if member.replacing or member not in self._members:
+                return
+            if not force and now - member.last_checked < self.health_check_interval:
+                return
+            member.last_checked = now
+        if member.manager.is_healthy():
+            return
+        self._replace(member)
+
+    def _replace(self, member: _PoolMember) -> None:
+        with self._lock:
+            if member.replacing or member not in self._members:
+                return
+            member.replacing = True
+        member.manager.close()
+        try:
+            replacement = self._start_members(1)[0]
+        except BaseException:
+            with self._lock:
+                if member in self._members:
+                    self._members.remove(member)
+            raise
+        with self._lock:
+            if member in self._members:
+                self._members[self._members.index(member)] = replacement
+            else:
+                replacement.manager.close()
+
+    def _start_members(self, count: int) -> list[_PoolMember]:
+        managers = [self._create_manager() for _ in range(count)]
+        base_urls: dict[int, str] = {}
+        errors: list[BaseException] = []
+
+        def start(index: int, manager: MinerUServiceManager) -> None:
+            try:
+                base_urls[index] = manager.ensure_started()
+            except BaseException as exc:
+                errors.append(exc)
+
+        # Model loading dominates start-up, so bring the instances up in parallel.
+        threads = [
+            threading.Thread(target=start, args=(index, manager), daemon=True)
+            for index, manager in enumerate(managers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if errors:
+            for manager in managers:
+                manager.close()
+            raise errors[0]
+        return [
+            _PoolMember(manager=manager, base_url=base_urls[index], last_checked=time.monotonic())
+            for index, manager in enumerate(managers)
+        ]
+
+    def _create_manager(self) -> MinerUServiceManager:
+        return MinerUServiceManager(**self.manager_kwargs)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+PageRange = tuple[int, int]
+
+# PDFium is not thread-safe; every pypdfium2 call in langparse holds this lock.
+PDFIUM_LOCK = threading.Lock()
+
+
+def count_pdf_pages(file_path: Path) -> int | None:
+    """
+    Return the page count of a PDF without extracting any page content.
+    Uses pypdfium2 when available and falls back to pdfplumber; returns None
+    when neither can read the file.
+    """
+    try:
+        import pypdfium2
+    except ImportError:
+        pypdfium2 = None
+
+    if pypdfium2 is not None:
+        with PDFIUM_LOCK:
+            try:
+                document = pypdfium2.PdfDocument(str(file_path))
+            except Exception:
+                return None
+            try:
+                return len(document)
+            finally:
+                document.close()
+
+    try:
+        import pdfplumber
+    except ImportError:
+        return None
+
+    try:
+        with pdfplumber.open(file_path) as pdf:
+            return len(pdf.pages)
+    except Exception:
+        return None
+
+
+def split_page_range(page_count: int, shard_pages: int) -> list[PageRange]:
+    """Split pages 0..page_count-1 into inclusive (start, end) ranges of at most shard_pages."""
+    if shard_pages < 1:
+        raise ValueError(f"shard_pages must be at least 1, got {shard_pages}.")
+    return [
+        (start, min(start + shard_pages, page_count) - 1)
+        for start in range(0, page_count, shard_pages)
+    ]
+
+
+def select_page_ranges(pages=None, max_pages: int | None = None, page_count: int | None = None) -> list[PageRange] | None:
+    """
+    Resolve a page selection to sorted, merged, inclusive 0-based ranges, or
+    None when nothing is selected (the whole document).
+
+    pages uses 1-based page numbers: "1-3,7,10-", an int, or an iterable of
+    ints, "a-b" strings and (first, last) tuples. Open-ended ranges ("10-")
+    need page_count. Pages past page_count are dropped, and max_pages keeps
+    only the first max_pages selected pages.
+    """
+    if pages is None and max_pages is None:
+        return None
+    if max_pages is not None and max_pages < 0:
+        raise ValueError(f"max_pages must not be negative, got {max_pages}.")
+
+    if pages is None:
+        if page_count is None:
+            raise ValueError("max_pages needs the document's page count.")
+        ranges = [(0, page_count - 1)] if page_count else []
+    else:
+        ranges = []
+        for first, last in _parse_page_spec(pages):
+            if last is None:
+                if page_count is None:
+                    raise ValueError(f"Open-ended page range '{first}-' needs the document's page count.")
+                last = page_count
+            if page_count is not None:
+                last = min(last, page_count)
+            if first <= last:
+                ranges.append((first - 1, last - 1))
+
+    merged: list[PageRange] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
+        else:
+            merged.append((start, end))
+
+    if max_pages is None:
+        return merged
+    limited: list[PageRange] = []
+    remaining = max_pages
+    for start, end in merged:
+        if remaining <= 0:
+            break
+        end = min(end, start + remaining - 1)
+        limited.append((start, end))
+        remaining -= end - start + 1
+    return limited
+
+
+def chunk_page_ranges(page_ranges: list[PageRange], chunk_pages: int) -> list[PageRange]:
+    """Split each range into consecutive ranges of at most chunk_pages pages."""
+    return [
+        (start + chunk_start, start + chunk_end)
+        for start, end in page_ranges
+        for chunk_start, chunk_end in split_page_range(end - start + 1, chunk_pages)
+    ]
+
+
+def _parse_page_spec(pages) -> list[tuple[int, int | None]]:
+    if isinstance(pages, str):
+        items = [item for item in pages.replace(" ", "").split(",") if item]
+    elif isinstance(pages, int):
+        items = [pages]
+    else:
+        items = list(pages)
+
+    spec = []
+    for item in items:
+        if isinstance(item, tuple):
+            first, last = item
+        elif isinstance(item, int):
+            first = last = item
+        elif isinstance(item, str) and "-" in item:
+            first_text, last_text = item.split("-", 1)
+            first, last = int(first_text), int(last_text) if last_text else None
+        elif isinstance(item, str):
+            first = last = int(item)
+        else:
+            raise ValueError(f"Invalid page selection item: {item!r}")
+        if first < 1 or (last is not None and last < first):
+            raise ValueError(f"Invalid page range: {item!r}. Pages are numbered from 1.")
+        spec.append((first, last))
+    return spec
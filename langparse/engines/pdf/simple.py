@@ -1,6 +1,37 @@
+import inspect
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from langparse.core.engine import BaseEngine, PageResult
+from langparse.core.page_cache import PageResultCache
+from langparse.engines.pdf.fingerprint import PageFingerprinter
+from langparse.engines.pdf.page_ranges import (
+    PDFIUM_LOCK,
+    PageRange,
+    chunk_page_ranges,
+    count_pdf_pages,
+    select_page_ranges,
+)
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, List, Optional, Sequence
+
+# Page metadata timing work done by the extracting run; a page cache hit did none of it.
+_RUN_METADATA_KEYS = ("ocr_seconds", "table_extraction_seconds")
+
+# Engine used by page worker processes, installed once per worker by _init_page_worker.
+_page_worker_engine = None
+
+
+def _init_page_worker(engine: "SimplePDFEngine") -> None:
+    global _page_worker_engine
+    _page_worker_engine = engine
+
+
+def _extract_page_range(file_path: str, page_range: PageRange) -> List[PageResult]:
+    return list(_page_worker_engine._process_pages(Path(file_path), [page_range]))
 
 class BasePDFEngine(BaseEngine):
     """
@@ -13,46 +44,355 @@ class SimplePDFEngine(BasePDFEngine):
     """
     A lightweight, dependency-free (except pdfplumber) engine.
     Good for simple, native PDFs.
+
+    With a page cache (page_cache, or page_cache_dir to create one), every page
+    is fingerprinted from its PDF objects first and unchanged pages are served
+    from the cache, so revised documents only re-extract edited pages.
+
+    With workers > 1, documents of at least parallel_min_pages pages are split
+    into chunk_pages-page ranges that worker processes open and extract
+    independently. Pages are still yielded in order; at most reorder_window
+    chunks (default 2 * workers) are in flight or waiting to be yielded.
+
+    pages ("1-3,7", a list of page numbers or (first, last) tuples) and
+    max_pages restrict extraction to a subset of pages, either as engine
+    defaults or per process() call; unselected pages are never extracted.
+
+    Table extraction only runs on pages with enough ruling lines to form a
+    cell (see _may_contain_table); force_table_extraction runs it on every
+    page. Page metadata records whether it was skipped and how long it took.
+
+    With enable_ocr, pages whose text layer has fewer than ocr_min_chars
+    characters but carry images (i.e. scans) are rendered at ocr_resolution
+    dpi and run through RapidOCR (the `ocr` extra). Digital pages are never
+    rendered. Each engine, and so each worker process, loads one OCR session
+    and reuses it; OCR'd pages report ocr_applied, ocr_text_chars and
+    ocr_seconds in their metadata.
+
+    Memory: pages are created lazily and their layout caches released once
+    their PageResult is yielded, so peak memory is about one page's layout
+    plus a few KiB per page of pdfminer bookkeeping, independent of length.
     """
-    
+
+    def __init__(
+        self,
+        page_cache: Optional[PageResultCache] = None,
+        page_cache_dir: Optional[str] = None,
+        page_cache_max_bytes: int = 256 * 1024 * 1024,
+        workers: int = 1,
+        chunk_pages: int = 16,
+        parallel_min_pages: int = 64,
+        reorder_window: Optional[int] = None,
+        pages=None,
+        max_pages: Optional[int] = None,
+        force_table_extraction: bool = False,
+        enable_ocr: bool = False,
+        ocr_min_chars: int = 16,
+        ocr_resolution: int = 200,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        if page_cache is None and page_cache_dir:
+            page_cache = PageResultCache(page_cache_dir, max_bytes=page_cache_max_bytes)
+        self.page_cache = page_cache
+        self.workers = workers
+        self.chunk_pages = chunk_pages
+        self.parallel_min_pages = parallel_min_pages
+        self.reorder_window = reorder_window
+        self.pages = pages
+        self.max_pages = max_pages
+        self.force_table_extraction = force_table_extraction
+        self.enable_ocr = enable_ocr
+        self.ocr_min_chars = ocr_min_chars
+        self.ocr_resolution = ocr_resolution
+        self._page_pool: Optional[ProcessPoolExecutor] = None
+        self._page_pool_lock = threading.Lock()
+        self._ocr_engine = None
+        self._ocr_lock = threading.Lock()
+
+    def close(self) -> None:
+        with self._page_pool_lock:
+            pool, self._page_pool = self._page_pool, None
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+
+    def __getstate__(self) -> dict:
+        # Worker processes get the configuration, never the parent's pool or OCR session.
+        state = self.__dict__.copy()
+        state["_page_pool"] = None
+        state["_ocr_engine"] = None
+        del state["_page_pool_lock"]
+        del state["_ocr_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._page_pool_lock = threading.Lock()
+        self._ocr_lock = threading.Lock()
+
     def process(self, file_path: Path, **kwargs) -> Iterator[PageResult]:
         try:
-            import pdfplumber
+            import pdfplumber  # noqa: F401
         except ImportError:
             raise ImportError("Please install `pdfplumber` to use the 'simple' engine.")
-            
+
+        pages = kwargs.get("pages", self.pages)
+        max_pages = kwargs.get("max_pages", self.max_pages)
+        page_ranges = None
+        if pages is not None or max_pages is not None:
+            page_ranges = select_page_ranges(pages, max_pages, count_pdf_pages(file_path))
+
+        if self.workers > 1:
+            parallel_ranges = page_ranges
+            if parallel_ranges is None:
+                page_count = count_pdf_pages(file_path)
+                parallel_ranges = [(0, page_count - 1)] if page_count else []
+            selected_pages = sum(end - start + 1 for start, end in parallel_ranges)
+            if selected_pages >= self.parallel_min_pages:
+                yield from self._process_parallel(file_path, parallel_ranges)
+                return
+        yield from self._process_pages(file_path, page_ranges)
+
+    def _process_pages(
+        self, file_path: Path, page_ranges: Optional[Sequence[PageRange]] = None
+    ) -> Iterator[PageResult]:
+        import pdfplumber
+
+        fingerprinter = PageFingerprinter() if self.page_cache is not None else None
         with pdfplumber.open(file_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                # Basic text extraction
-                text = page.extract_text() or ""
-                tables = []
-                table_markdown = []
-                extract_tables = getattr(page, "extract_tables", None)
-                for table in (extract_tables() if callable(extract_tables) else []) or []:
-                    cleaned_table = [
-                        ["" if cell is None else str(cell).strip().replace("\n", " ") for cell in row]
-                        for row in table
-                    ]
-                    if not cleaned_table:
-                        continue
-
-                    tables.append({"rows": cleaned_table})
-                    headers = cleaned_table[0]
-                    table_markdown.append(f"| {' | '.join(headers)} |")
-                    table_markdown.append(f"| {' | '.join(['---'] * len(headers))} |")
-                    for row in cleaned_table[1:]:
-                        table_markdown.append(f"| {' | '.join(row)} |")
-
-                markdown_content = text
-                if table_markdown:
-                    markdown_content = "\n\n".join([text, "\n".join(table_markdown)]).strip()
-                
-                yield PageResult(
-                    page_number=i + 1,
-                    markdown_content=markdown_content,
-                    plain_text=text,
-                    elements=[],
-                    tables=tables,
-                    images=[],
-                    metadata={"engine_name": "simple"},
+            for page_number, page in _iter_pages(pdf, page_ranges):
+                try:
+                    if fingerprinter is None:
+                        yield self._extract_page(page, page_number)
+                    else:
+                        yield self._extract_page_cached(page, page_number, fingerprinter)
+                finally:
+                    _release_page(pdf, page)
+
+    def _process_parallel(self, file_path: Path, page_ranges: Sequence[PageRange]) -> Iterator[PageResult]:
+        pool = self._get_page_pool()
+        page_ranges = iter(chunk_page_ranges(list(page_ranges), self.chunk_pages))
+        window = max(1, self.reorder_window or self.workers * 2)
+        pending = deque(
+            pool.submit(_extract_page_range, str(file_path), page_range)
+            for page_range in islice(page_ranges, window)
+        )
+        try:
+            while pending:
+                # Chunks are submitted in page order, so waiting on the oldest one
+                # keeps output ordered while later chunks finish in the background.
+                pages = pending.popleft().result()
+                next_range = next(page_ranges, None)
+                if next_range is not None:
+                    pending.append(pool.submit(_extract_page_range, str(file_path), next_range))
+                yield from pages
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _get_page_pool(self) -> ProcessPoolExecutor:
+        with self._page_pool_lock:
+            if self._page_pool is None:
+                self._page_pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_page_worker,
+                    initargs=(self,),
                 )
+            return self._page_pool
+
+    def _extract_page_cached(self, page, page_number: int, fingerprinter: PageFingerprinter) -> PageResult:
+        fingerprint = fingerprinter.fingerprint(page)
+        if fingerprint is None:
+            return self._extract_page(page, page_number)
+
+        cache_key = self.page_cache.key_for("simple", fingerprint, self._page_cache_options())
+        result = self.page_cache.get(cache_key)
+        if result is not None:
+            result.page_number = page_number
+            for key in _RUN_METADATA_KEYS:
+                result.metadata.pop(key, None)
+            result.metadata["page_cache"] = "hit"
+            return result
+
+        result = self._extract_page(page, page_number)
+        self.page_cache.put(cache_key, result)
+        result.metadata["page_cache"] = "miss"
+        return result
+
+    def _page_cache_options(self) -> dict:
+        """Options that change extraction output; part of every page cache key."""
+        options = {}
+        if self.force_table_extraction:
+            options["force_table_extraction"] = True
+        if self.enable_ocr:
+            options["ocr"] = {"min_chars": self.ocr_min_chars, "resolution": self.ocr_resolution}
+        return options
+
+    def _extract_page(self, page, page_number: int) -> PageResult:
+        # Basic text extraction
+        text = page.extract_text() or ""
+        tables = []
+        table_markdown = []
+        metadata = {"engine_name": "simple"}
+        if self.enable_ocr and self._needs_ocr(page, text):
+            started = time.perf_counter()
+            text = self._ocr_page(page)
+            metadata["ocr_applied"] = True
+            metadata["ocr_text_chars"] = len(text)
+            metadata["ocr_seconds"] = round(time.perf_counter() - started, 6)
+        raw_tables = []
+        extract_tables = getattr(page, "extract_tables", None)
+        if callable(extract_tables):
+            if self.force_table_extraction or _may_contain_table(page):
+                started = time.perf_counter()
+                raw_tables = extract_tables() or []
+                metadata["table_extraction"] = "run"
+                metadata["table_extraction_seconds"] = round(time.perf_counter() - started, 6)
+            else:
+                metadata["table_extraction"] = "skipped"
+        for table in raw_tables:
+            cleaned_table = [
+                ["" if cell is None else str(cell).strip().replace("\n", " ") for cell in row]
+                for row in table
+            ]
+            if not cleaned_table:
+                continue
+
+            tables.append({"rows": cleaned_table})
+            headers = cleaned_table[0]
+            table_markdown.append(f"| {' | '.join(headers)} |")
+            table_markdown.append(f"| {' | '.join(['---'] * len(headers))} |")
+            for row in cleaned_table[1:]:
+                table_markdown.append(f"| {' | '.join(row)} |")
+
+        markdown_content = text
+        if table_markdown:
+            markdown_content = "\n\n".join([text, "\n".join(table_markdown)]).strip()
+
+        return PageResult(
+            page_number=page_number,
+            markdown_content=markdown_content,
+            plain_text=text,
+            elements=[],
+            tables=tables,
+            images=[],
+            metadata=metadata,
+        )
+
+    def _needs_ocr(self, page, text: str) -> bool:
+        # Blank pages have no images; only pages with little text and a raster image are scans.
+        return len(text.strip()) < self.ocr_min_chars and bool(getattr(page, "images", None))
+
+    def _ocr_page(self, page) -> str:
+        import numpy
+
+        with PDFIUM_LOCK:
+            image = page.to_image(resolution=self.ocr_resolution).original.convert("RGB")
+        # RapidOCR expects OpenCV's BGR channel order.
+        result, _ = self._get_ocr_engine()(numpy.asarray(image)[:, :, ::-1])
+        return "\n".join(line[1] for line in result or [])
+
+    def _get_ocr_engine(self):
+        with self._ocr_lock:
+            if self._ocr_engine is None:
+                try:
+                    from rapidocr_onnxruntime import RapidOCR
+                except ImportError:
+                    raise ImportError(
+                        "Please install `rapidocr_onnxruntime` (the `ocr` extra) to use OCR in the 'simple' engine."
+                    )
+                self._ocr_engine = RapidOCR()
+            return self._ocr_engine
+
+
+def _may_contain_table(page) -> bool:
+    """
+    Cheap pre-check for extract_tables(). With pdfplumber's default settings
+    table cells are built only from ruling edges (lines, rect sides, curve
+    segments), so a page needs at least two horizontal and two vertical edges
+    for any table to be found. Edges are counted before pdfplumber's
+    snapping/joining, which can only merge them, so no table is ever missed.
+    Pages that do not expose edges are always extracted.
+    """
+    edges = getattr(page, "edges", None)
+    if edges is None:
+        return True
+    horizontal = vertical = 0
+    for edge in edges:
+        orientation = edge.get("orientation")
+        if orientation == "h":
+            horizontal += 1
+        elif orientation == "v":
+            vertical += 1
+        if horizontal >= 2 and vertical >= 2:
+            return True
+    return False
+
+
+def _iter_pages(pdf, page_ranges: Optional[Sequence[PageRange]] = None):
+    """
+    Yield (page_number, page) one page at a time, optionally only for the
+    sorted inclusive 0-based page_ranges. pdfplumber's pdf.pages builds every
+    Page up front and keeps them for the life of the file; creating them
+    lazily from pdfminer keeps only the current page alive. That relies on
+    pdfplumber internals, so pdf.pages is used whenever they are missing.
+    """
+    doc = getattr(pdf, "doc", None)
+    page_class = _lazy_page_class() if doc is not None else None
+    if page_class is None:
+        if page_ranges is None:
+            yield from enumerate(pdf.pages, start=1)
+            return
+        for start, end in page_ranges:
+            for offset, page in enumerate(pdf.pages[start : end + 1]):
+                yield start + offset + 1, page
+        return
+
+    from pdfminer.pdfpage import PDFPage
+
+    remaining = iter(page_ranges) if page_ranges is not None else None
+    current = next(remaining, None) if remaining is not None else None
+    if remaining is not None and current is None:
+        return
+
+    doctop = 0
+    for index, page_obj in enumerate(PDFPage.create_pages(doc)):
+        while current is not None and index > current[1]:
+            current = next(remaining, None)
+        if remaining is not None and current is None:
+            break
+        page = page_class(pdf, page_obj, page_number=index + 1, initial_doctop=doctop)
+        doctop += page.height
+        if current is None or index >= current[0]:
+            yield index + 1, page
+
+
+def _lazy_page_class():
+    """pdfplumber's Page class, if its constructor still takes what _iter_pages passes it."""
+    try:
+        from pdfplumber.page import Page
+    except ImportError:
+        return None
+    try:
+        parameters = inspect.signature(Page.__init__).parameters
+    except (TypeError, ValueError):
+        return None
+    if not {"pdf", "page_obj", "page_number", "initial_doctop"} <= parameters.keys():
+        return None
+    return Page
+
+
+def _release_page(pdf, page) -> None:
+    """
+    Free what pdfplumber and pdfminer cached for a finished page: the page's
+    layout objects and text maps, and the document's resolved-object cache
+    (which holds e.g. decoded images of scanned pages). Objects needed again
+    are re-read from the file on demand.
+    """
+    close = getattr(page, "close", None)
+    if callable(close):
+        close()
+    cached_objects = getattr(getattr(pdf, "doc", None), "_cached_objs", None)
+    if isinstance(cached_objects, dict):
+        cached_objects.clear()
@@ -37,8 +37,16 @@ def classify_exception(exc: BaseException) -> ClassifiedError:
         return ClassifiedError(ErrorType.ENGINE_UNAVAILABLE, message)
     if "unable to start local mineru-api" in lowered:
         return ClassifiedError(ErrorType.ENGINE_UNAVAILABLE, message)
+    if "circuit breaker open" in lowered:
+        return ClassifiedError(ErrorType.ENGINE_UNAVAILABLE, message)
     if "timed out" in lowered or "timeout" in lowered:
         return ClassifiedError(ErrorType.ENGINE_TIMEOUT, message)
+    if any(f"http {code}" in lowered for code in (502, 503, 504)):
+        return ClassifiedError(ErrorType.ENGINE_UNAVAILABLE, message)
+    if "api request failed" in lowered and (
+        "refused" in lowered or "reset" in lowered or "disconnected" in lowered
+    ):
+        return ClassifiedError(ErrorType.ENGINE_UNAVAILABLE, message)
     if "ocr" in lowered and "unavailable" in lowered:
         return ClassifiedError(ErrorType.OCR_UNAVAILABLE, message)
     if "table" in lowered and "failed" in lowered:
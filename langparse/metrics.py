@@ -32,11 +32,51 @@ class ParseMetrics:
     page_marker_coverage: float = 0.0
     ocr_applied: bool = False
     ocr_text_chars: int = 0
+    ocr_pages: int = 0
     multi_column_detected: bool = False
     reading_order_warnings: int = 0
     header_footer_removed_count: int = 0
     caption_count: int = 0
     images_with_caption_ratio: float = 0.0
+    service_startup_seconds: float | None = None
+    page_cache_hits: int = 0
+    page_cache_misses: int = 0
+    page_cache_hit_rate: float = 0.0
+    table_pages_skipped: int = 0
+    table_extraction_seconds: float = 0.0
+    request_count: int = 0
+    upload_seconds: float = 0.0
+    server_seconds: float = 0.0
+    download_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    normalize_seconds: float = 0.0
+    server_reported_seconds: float | None = None
+
+
+REQUEST_TIMING_PHASES = (
+    "upload_seconds",
+    "server_seconds",
+    "download_seconds",
+    "decode_seconds",
+    "normalize_seconds",
+)
+
+
+def summarize_request_timings(metrics: list[ParseMetrics]) -> dict[str, Any]:
+    """
+    Total time per request phase across documents, plus the share spent
+    waiting on the server. A high server_share points at inference capacity;
+    a low one at the client (network, decoding, normalization).
+    """
+    totals = {name: round(sum(getattr(item, name) for item in metrics), 4) for name in REQUEST_TIMING_PHASES}
+    reported = [item.server_reported_seconds for item in metrics if item.server_reported_seconds is not None]
+    phase_total = sum(totals.values())
+    return {
+        "requests": sum(item.request_count for item in metrics),
+        **totals,
+        "server_reported_seconds": round(sum(reported), 4) if reported else None,
+        "server_share": round(totals["server_seconds"] / phase_total, 4) if phase_total > 0 else 0.0,
+    }
 
 
 @dataclass
@@ -50,6 +90,7 @@ class BatchItemResult:
     engine: str | None = None
     started_at: str | None = None
     finished_at: str | None = None
+    attempts: int = 1
 
 
 @dataclass
@@ -74,31 +115,98 @@ class BatchRunResult:
         return sum(1 for item in self.items if item.status == "skipped")
 
 
+class ParseMetricsAccumulator:
+    """
+    Builds ParseMetrics incrementally, one page at a time, so streamed parses
+    can report metrics without holding the whole document. Markdown pieces
+    are counted as if joined with newlines.
+    """
+
+    def __init__(self):
+        self.page_count = 0
+        self.output_bytes = 0
+        self.markdown_chars = 0
+        self.structured_table_count = 0
+        self.markdown_table_count = 0
+        self.image_count = 0
+        self.caption_count = 0
+        self.page_cache_hits = 0
+        self.page_cache_misses = 0
+        self.table_pages_skipped = 0
+        self.table_extraction_seconds = 0.0
+        self.ocr_pages = 0
+        self.ocr_text_chars = 0
+        self._markdown_pieces = 0
+
+    def add_page(self, page, count_markdown: bool = True) -> None:
+        self.page_count += 1
+        self.structured_table_count += len(page.tables)
+        self.image_count += len(page.images)
+        self.caption_count += sum(1 for image in page.images if image.get("caption"))
+        page_cache = page.metadata.get("page_cache")
+        if page_cache == "hit":
+            self.page_cache_hits += 1
+        elif page_cache == "miss":
+            self.page_cache_misses += 1
+        if page.metadata.get("table_extraction") == "skipped":
+            self.table_pages_skipped += 1
+        self.table_extraction_seconds += float(page.metadata.get("table_extraction_seconds", 0.0) or 0.0)
+        if page.metadata.get("ocr_applied"):
+            self.ocr_pages += 1
+            self.ocr_text_chars += int(page.metadata.get("ocr_text_chars", 0) or 0)
+        if count_markdown:
+            self.add_markdown(page.markdown_content)
+
+    def add_markdown(self, markdown: str) -> None:
+        if self._markdown_pieces:
+            self.output_bytes += 1
+            self.markdown_chars += 1
+        self._markdown_pieces += 1
+        self.output_bytes += len(markdown.encode("utf-8"))
+        self.markdown_chars += len(markdown)
+        self.markdown_table_count += count_markdown_tables(markdown)
+
+    def finish(self, elapsed_seconds: float, metadata: dict[str, Any] | None = None) -> ParseMetrics:
+        metadata = metadata or {}
+        request_timings = metadata.get("request_timings") or {}
+        page_cache_lookups = self.page_cache_hits + self.page_cache_misses
+        return ParseMetrics(
+            elapsed_seconds=round(elapsed_seconds, 4),
+            page_count=self.page_count,
+            pages_per_second=pages_per_second(self.page_count, elapsed_seconds),
+            output_bytes=self.output_bytes,
+            markdown_chars=self.markdown_chars,
+            table_count=self.structured_table_count or self.markdown_table_count,
+            image_count=self.image_count,
+            # Whole-document engines (MinerU) report OCR in document metadata; others per page.
+            ocr_applied=bool(metadata.get("ocr_applied", False)) or self.ocr_pages > 0,
+            ocr_text_chars=int(metadata.get("ocr_text_chars", 0) or 0) or self.ocr_text_chars,
+            ocr_pages=self.ocr_pages,
+            multi_column_detected=bool(metadata.get("multi_column_detected", False)),
+            reading_order_warnings=int(metadata.get("reading_order_warnings", 0) or 0),
+            header_footer_removed_count=int(metadata.get("header_footer_removed_count", 0) or 0),
+            caption_count=self.caption_count,
+            images_with_caption_ratio=round(self.caption_count / self.image_count, 4)
+            if self.image_count
+            else 0.0,
+            service_startup_seconds=metadata.get("service_startup_seconds"),
+            page_cache_hits=self.page_cache_hits,
+            page_cache_misses=self.page_cache_misses,
+            page_cache_hit_rate=round(self.page_cache_hits / page_cache_lookups, 4)
+            if page_cache_lookups
+            else 0.0,
+            table_pages_skipped=self.table_pages_skipped,
+            table_extraction_seconds=round(self.table_extraction_seconds, 4),
+            request_count=int(request_timings.get("requests", 0) or 0),
+            **{name: float(request_timings.get(name, 0.0) or 0.0) for name in REQUEST_TIMING_PHASES},
+            server_reported_seconds=request_timings.get("server_reported_seconds"),
+        )
+
+
 def collect_parse_metrics(parsed: ParsedDocumentResult, elapsed_seconds: float) -> ParseMetrics:
-    markdown = parsed.markdown_content or ""
-    page_count = len(parsed.pages)
-    image_count = sum(len(page.images) for page in parsed.pages)
-    table_count = sum(len(page.tables) for page in parsed.pages) or count_markdown_tables(markdown)
-    caption_count = sum(
-        1
-        for page in parsed.pages
-        for image in page.images
-        if image.get("caption")
-    )
-
-    return ParseMetrics(
-        elapsed_seconds=round(elapsed_seconds, 4),
-        page_count=page_count,
-        pages_per_second=pages_per_second(page_count, elapsed_seconds),
-        output_bytes=len(markdown.encode("utf-8")),
-        markdown_chars=len(markdown),
-        table_count=table_count,
-        image_count=image_count,
-        ocr_applied=bool(parsed.metadata.get("ocr_applied", False)),
-        ocr_text_chars=int(parsed.metadata.get("ocr_text_chars", 0) or 0),
-        multi_column_detected=bool(parsed.metadata.get("multi_column_detected", False)),
-        reading_order_warnings=int(parsed.metadata.get("reading_order_warnings", 0) or 0),
-        header_footer_removed_count=int(parsed.metadata.get("header_footer_removed_count", 0) or 0),
-        caption_count=caption_count,
-        images_with_caption_ratio=round(caption_count / image_count, 4) if image_count else 0.0,
-    )
+    accumulator = ParseMetricsAccumulator()
+    for page in parsed.pages:
+        accumulator.add_page(page, count_markdown=False)
+    # Engines may assemble document markdown differently from a page join; measure what they produced.
+    accumulator.add_markdown(parsed.markdown_content or "")
+    return accumulator.finish(elapsed_seconds, parsed.metadata)
@@ -1,5 +1,6 @@
 from langparse.services.batch_service import BatchParseService
 from langparse.services.benchmark_service import BenchmarkService
+from langparse.services.cache import ParseResultCache
 from langparse.services.parse_service import ParseService
 
-__all__ = ["BatchParseService", "BenchmarkService", "ParseService"]
+__all__ = ["BatchParseService", "BenchmarkService", "ParseResultCache", "ParseService"]
@@ -1,23 +1,86 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import multiprocessing
 import os
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import asdict, astuple
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
 from typing import Iterable
 
-from langparse.errors import classify_exception
-from langparse.metrics import BatchItemResult, BatchRunResult, collect_parse_metrics
+from langparse.errors import ErrorType, classify_exception
+from langparse.metrics import (
+    BatchItemResult,
+    BatchRunResult,
+    ParseMetrics,
+    collect_parse_metrics,
+    summarize_request_timings,
+)
+from langparse.services.concurrency import AdaptiveConcurrencyLimiter
+from langparse.services.resilience import CircuitBreaker, RetryPolicy
 from langparse.services.parse_service import ParseService
 
+EXECUTORS = ("thread", "process")
+
+# run() options consumed by _run_one rather than forwarded to the engine.
+_RUN_OPTIONS = frozenset(
+    {"output_dir", "fmt", "skip_existing", "fail_fast", "collect_metrics", "retry_policies", "circuit_breaker"}
+)
+_ITEM_FIELDS = tuple(BatchItemResult.__dataclass_fields__)
+
+# Per-process state of executor="process" workers, set up once by _init_process_worker.
+_process_run_item = None
+
+
+def _init_process_worker(parse_service: ParseService, engine_name: str, run_kwargs: dict) -> None:
+    global _process_run_item
+    batch_service = BatchParseService(parse_service)
+    engine_kwargs = {key: value for key, value in run_kwargs.items() if key not in _RUN_OPTIONS}
+    # Build the engine now so imports and runtime setup happen once per worker.
+    get_engine = getattr(parse_service, "_get_engine", None)
+    if callable(get_engine):
+        get_engine(engine_name, **engine_kwargs)
+    _process_run_item = partial(batch_service._run_one, engine_name=engine_name, **run_kwargs)
+
+
+def _run_in_process(path: Path) -> tuple:
+    return _pack_item(_process_run_item(path))
+
+
+def _pack_item(item: BatchItemResult) -> tuple:
+    """Flatten a BatchItemResult into plain tuples for the trip back from a worker process."""
+    return tuple(
+        astuple(value) if isinstance(value, ParseMetrics) else value
+        for value in (getattr(item, name) for name in _ITEM_FIELDS)
+    )
+
+
+def _unpack_item(packed: tuple) -> BatchItemResult:
+    values = dict(zip(_ITEM_FIELDS, packed))
+    if values["metrics"] is not None:
+        values["metrics"] = ParseMetrics(*values["metrics"])
+    return BatchItemResult(**values)
+
 
 class BatchParseService:
     def __init__(self, parse_service: ParseService | None = None):
         self.parse_service = parse_service or ParseService()
 
+    def close(self) -> None:
+        close = getattr(self.parse_service, "close", None)
+        if callable(close):
+            close()
+
+    def __enter__(self) -> "BatchParseService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def run(
         self,
         inputs,
@@ -28,52 +91,134 @@ class BatchParseService:
         skip_existing: bool = False,
         fail_fast: bool = False,
         collect_metrics: bool = True,
+        adaptive_concurrency: bool | AdaptiveConcurrencyLimiter = False,
+        retry_policies: dict[ErrorType, RetryPolicy] | None = None,
+        circuit_breaker: bool | CircuitBreaker = False,
+        executor: str = "thread",
+        pack_files: bool = False,
         **kwargs,
     ) -> BatchRunResult:
+        """
+        Parse inputs concurrently and write one output per file plus
+        batch-results.jsonl and batch-summary.json. executor="process" runs
+        files in worker processes (one engine per worker) for GIL-bound
+        engines; it does not combine with adaptive concurrency or the circuit
+        breaker, whose state lives in this process, nor with engines that would
+        start their own local service (mineru or hybrid without api_url). pack_files lets engines
+        that plan packs (mineru) parse several small files per request; if a
+        pack fails, its files are retried one by one.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unsupported executor: {executor}. Expected one of: {', '.join(EXECUTORS)}.")
+        if executor == "process" and (adaptive_concurrency or circuit_breaker):
+            raise ValueError(
+                "executor='process' does not support adaptive_concurrency or circuit_breaker."
+            )
+        if pack_files and (executor == "process" or adaptive_concurrency or circuit_breaker):
+            raise ValueError(
+                "pack_files does not support executor='process', adaptive_concurrency or circuit_breaker."
+            )
+        if executor == "process" and self._engine_starts_service(engine_name, **kwargs):
+            raise ValueError(
+                f"executor='process' would start a separate {engine_name} engine service in every worker; "
+                "pass api_url to share one running service, or use executor='thread'."
+            )
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         paths = self.expand_inputs(inputs)
         worker_count = max_workers or min(4, os.cpu_count() or 1)
+        summary_extras = {}
 
-        if worker_count == 1:
-            items = [
-                self._run_one(
-                    path,
-                    output_dir,
-                    engine_name,
-                    fmt,
-                    skip_existing,
-                    fail_fast,
-                    collect_metrics,
-                    **kwargs,
+        breaker = None
+        if circuit_breaker:
+            breaker = (
+                circuit_breaker
+                if isinstance(circuit_breaker, CircuitBreaker)
+                else CircuitBreaker(probe=self._health_probe(engine_name, **kwargs))
+            )
+        run_item = partial(
+            self._run_one,
+            output_dir=output_dir,
+            engine_name=engine_name,
+            fmt=fmt,
+            skip_existing=skip_existing,
+            fail_fast=fail_fast,
+            collect_metrics=collect_metrics,
+            retry_policies=retry_policies,
+            circuit_breaker=breaker,
+            **kwargs,
+        )
+
+        limiter = None
+        if adaptive_concurrency:
+            # max_workers becomes the ceiling; the limiter decides how many run at once.
+            limiter = (
+                adaptive_concurrency
+                if isinstance(adaptive_concurrency, AdaptiveConcurrencyLimiter)
+                else AdaptiveConcurrencyLimiter(
+                    initial_limit=min(2, max_workers or 32),
+                    max_limit=max_workers or 32,
                 )
-                for path in paths
-            ]
+            )
+            run_item = partial(self._run_limited, limiter, run_item)
+            worker_count = limiter.max_limit
+
+        if executor == "process":
+            items = self._run_processes(
+                paths,
+                worker_count,
+                engine_name,
+                fail_fast,
+                {
+                    "output_dir": output_dir,
+                    "fmt": fmt,
+                    "skip_existing": skip_existing,
+                    "fail_fast": fail_fast,
+                    "collect_metrics": collect_metrics,
+                    "retry_policies": retry_policies,
+                    **kwargs,
+                },
+            )
+            summary_extras["executor"] = "process"
+        elif pack_files:
+            packs = self._plan_packs(paths, engine_name, **kwargs)
+            run_pack = partial(
+                self._run_pack,
+                run_item=run_item,
+                output_dir=output_dir,
+                engine_name=engine_name,
+                fmt=fmt,
+                skip_existing=skip_existing,
+                fail_fast=fail_fast,
+                collect_metrics=collect_metrics,
+                **kwargs,
+            )
+            with ThreadPoolExecutor(max_workers=worker_count) as pool:
+                items = [item for pack_items in pool.map(run_pack, packs) for item in pack_items]
+            items.sort(key=lambda item: item.source)
+            summary_extras["pack_count"] = len(packs)
+        elif worker_count == 1:
+            items = [run_item(path) for path in paths]
         else:
             items = []
-            with ThreadPoolExecutor(max_workers=worker_count) as executor:
-                futures = {
-                    executor.submit(
-                        self._run_one,
-                        path,
-                        output_dir,
-                        engine_name,
-                        fmt,
-                        skip_existing,
-                        fail_fast,
-                        collect_metrics,
-                        **kwargs,
-                    ): path
-                    for path in paths
-                }
+            with ThreadPoolExecutor(max_workers=worker_count) as pool:
+                futures = {pool.submit(run_item, path): path for path in paths}
                 for future in as_completed(futures):
                     items.append(future.result())
             items.sort(key=lambda item: item.source)
 
-        result = BatchRunResult(items=items, summary=self._build_summary(items))
-        self._write_jsonl(output_dir / "batch-results.jsonl", items)
-        self._write_json(output_dir / "batch-summary.json", result.summary)
-        return result
+        if limiter is not None:
+            summary_extras["concurrency"] = limiter.summary()
+        cache = getattr(self.parse_service, "cache", None)
+        if cache is not None and executor == "thread":
+            # Worker processes keep their own counters, so only thread runs report them.
+            summary_extras["cache"] = cache.stats()
+        if breaker is not None:
+            summary_extras["circuit_breaker"] = {
+                "state": breaker.state,
+                "open_count": breaker.open_count,
+            }
+        return self._finish_run(items, output_dir, **summary_extras)
 
     def expand_inputs(self, inputs) -> list[Path]:
         paths: list[Path] = []
@@ -102,54 +247,315 @@ class BatchParseService:
         skip_existing: bool,
         fail_fast: bool,
         collect_metrics: bool,
+        retry_policies: dict[ErrorType, RetryPolicy] | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        engine_seconds: list[float] | None = None,
         **kwargs,
     ) -> BatchItemResult:
+        """
+        Parse one file with retries. When engine_seconds is given, the
+        duration of each engine call is appended to it (backoff sleeps and
+        breaker waits excluded).
+        """
         started_at = self._utc_now()
         output_path = output_dir / self._output_filename(path, fmt)
         if skip_existing and output_path.exists():
-            return BatchItemResult(
-                source=str(path),
-                status="skipped",
-                output_path=str(output_path),
-                engine=engine_name,
-                started_at=started_at,
-                finished_at=self._utc_now(),
-            )
+            return self._skipped_item(path, output_path, engine_name, started_at)
 
         start = time.perf_counter()
+        attempts = 0
         try:
-            parsed = self.parse_service.parse_result(path, engine_name=engine_name, **kwargs)
-            rendered = self.parse_service.render_output(parsed, fmt)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            output_path.write_text(rendered, encoding="utf-8")
-            elapsed = time.perf_counter() - start
-            metrics = collect_parse_metrics(parsed, elapsed) if collect_metrics else None
-            return BatchItemResult(
-                source=str(path),
-                status="success",
-                output_path=str(output_path),
-                metrics=metrics,
-                engine=engine_name,
-                started_at=started_at,
-                finished_at=self._utc_now(),
+            while True:
+                attempts += 1
+                if circuit_breaker is not None:
+                    circuit_breaker.before_call()
+                call_start = time.perf_counter()
+                try:
+                    parsed = self.parse_service.parse_result(path, engine_name=engine_name, **kwargs)
+                except Exception as exc:
+                    if engine_seconds is not None:
+                        engine_seconds.append(time.perf_counter() - call_start)
+                    error_type = classify_exception(exc).error_type
+                    if circuit_breaker is not None:
+                        circuit_breaker.record_failure(error_type)
+                    policy = (retry_policies or {}).get(error_type)
+                    if policy is None or attempts >= policy.max_attempts:
+                        raise
+                    time.sleep(policy.delay(attempts))
+                    continue
+                if engine_seconds is not None:
+                    engine_seconds.append(time.perf_counter() - call_start)
+                if circuit_breaker is not None:
+                    circuit_breaker.record_success()
+                break
+            item = self._success_item(
+                path, parsed, output_path, fmt, engine_name, started_at, start, collect_metrics
             )
         except Exception as exc:
             if fail_fast:
                 raise
-            classified = classify_exception(exc)
-            return BatchItemResult(
-                source=str(path),
-                status="failed",
-                engine=engine_name,
-                error_type=classified.error_type.value,
-                error_message=classified.message,
-                started_at=started_at,
-                finished_at=self._utc_now(),
+            item = self._failed_item(path, engine_name, exc, started_at)
+        item.attempts = max(1, attempts)
+        return item
+
+    def _plan_packs(self, paths: list[Path], engine_name: str, **kwargs) -> list[list[Path]]:
+        get_engine = getattr(self.parse_service, "_get_engine", None)
+        if not callable(get_engine):
+            return [[path] for path in paths]
+        plan_packs = getattr(get_engine(engine_name, **kwargs), "plan_packs", None)
+        if not callable(plan_packs):
+            return [[path] for path in paths]
+        return plan_packs(paths)
+
+    def _engine_starts_service(self, engine_name: str, **kwargs) -> bool:
+        get_engine = getattr(self.parse_service, "_get_engine", None)
+        if not callable(get_engine):
+            return False
+        return bool(getattr(get_engine(engine_name, **kwargs), "starts_service", False))
+
+    def _run_pack(
+        self,
+        pack: list[Path],
+        run_item,
+        output_dir: Path,
+        engine_name: str,
+        fmt: str,
+        skip_existing: bool,
+        fail_fast: bool,
+        collect_metrics: bool,
+        **kwargs,
+    ) -> list[BatchItemResult]:
+        started_at = self._utc_now()
+        items = []
+        pending = []
+        for path in pack:
+            output_path = output_dir / self._output_filename(path, fmt)
+            if skip_existing and output_path.exists():
+                items.append(self._skipped_item(path, output_path, engine_name, started_at))
+            else:
+                pending.append(path)
+        if not pending:
+            return items
+        if len(pending) == 1:
+            return items + [run_item(pending[0])]
+
+        start = time.perf_counter()
+        try:
+            parsed_results = self.parse_service.parse_results(pending, engine_name=engine_name, **kwargs)
+        except Exception:
+            # One bad file fails the whole request; parse the pack's files one by one
+            # (with retries) so only that file fails.
+            return items + [run_item(path) for path in pending]
+        # The request's time is shared evenly by its files.
+        elapsed = (time.perf_counter() - start) / len(pending)
+        for path, parsed in zip(pending, parsed_results):
+            output_path = output_dir / self._output_filename(path, fmt)
+            try:
+                items.append(
+                    self._success_item(
+                        path, parsed, output_path, fmt, engine_name, started_at, start, collect_metrics, elapsed
+                    )
+                )
+            except Exception as exc:
+                if fail_fast:
+                    raise
+                items.append(self._failed_item(path, engine_name, exc, started_at))
+        return items
+
+    def _run_processes(
+        self,
+        paths: list[Path],
+        worker_count: int,
+        engine_name: str,
+        fail_fast: bool,
+        run_kwargs: dict,
+    ) -> list[BatchItemResult]:
+        items = []
+        # spawn rather than fork: workers must not inherit this process' threads,
+        # sockets or SQLite handles, and get the parse service by pickling instead.
+        with ProcessPoolExecutor(
+            max_workers=max(1, min(worker_count, len(paths) or 1)),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_process_worker,
+            initargs=(self.parse_service, engine_name, run_kwargs),
+        ) as pool:
+            futures = {pool.submit(_run_in_process, path): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    items.append(_unpack_item(future.result()))
+                except Exception as exc:
+                    # A worker that crashed or could not start; the item fails like a parse error.
+                    if fail_fast:
+                        raise
+                    items.append(self._failed_item(futures[future], engine_name, exc, self._utc_now()))
+        items.sort(key=lambda item: item.source)
+        return items
+
+    def _run_limited(
+        self,
+        limiter: AdaptiveConcurrencyLimiter,
+        run_item,
+        path: Path,
+    ) -> BatchItemResult:
+        limiter.acquire()
+        engine_seconds: list[float] = []
+        error_type = ErrorType.PARSE_FAILED.value
+        try:
+            item = run_item(path, engine_seconds=engine_seconds)
+            error_type = item.error_type
+            return item
+        finally:
+            # Skipped files never reach the engine and backoff sleeps are not
+            # engine latency: sample only the time spent in engine calls.
+            limiter.release(sum(engine_seconds) if engine_seconds else None, error_type)
+
+    def _health_probe(self, engine_name: str, **kwargs):
+        health_check = getattr(self.parse_service, "health_check", None)
+        if not callable(health_check):
+            return None
+        return lambda: health_check(engine_name=engine_name, **kwargs)
+
+    async def run_async(
+        self,
+        inputs,
+        engine_name: str = "simple",
+        output_dir="out",
+        fmt: str = "markdown",
+        max_concurrency: int = 64,
+        skip_existing: bool = False,
+        fail_fast: bool = False,
+        collect_metrics: bool = True,
+        **kwargs,
+    ) -> BatchRunResult:
+        """
+        asyncio batch runner: up to max_concurrency files are in flight on the
+        current event loop, using the engine's aprocess_document when it has one.
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = self.expand_inputs(inputs)
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run_bounded(path: Path) -> BatchItemResult:
+            async with semaphore:
+                return await self._run_one_async(
+                    path,
+                    output_dir,
+                    engine_name,
+                    fmt,
+                    skip_existing,
+                    fail_fast,
+                    collect_metrics,
+                    **kwargs,
+                )
+
+        items = list(await asyncio.gather(*(run_bounded(path) for path in paths)))
+        items.sort(key=lambda item: item.source)
+        return self._finish_run(items, output_dir)
+
+    async def _run_one_async(
+        self,
+        path: Path,
+        output_dir: Path,
+        engine_name: str,
+        fmt: str,
+        skip_existing: bool,
+        fail_fast: bool,
+        collect_metrics: bool,
+        **kwargs,
+    ) -> BatchItemResult:
+        started_at = self._utc_now()
+        output_path = output_dir / self._output_filename(path, fmt)
+        if skip_existing and output_path.exists():
+            return self._skipped_item(path, output_path, engine_name, started_at)
+
+        start = time.perf_counter()
+        try:
+            aparse_result = getattr(self.parse_service, "aparse_result", None)
+            if callable(aparse_result):
+                parsed = await aparse_result(path, engine_name=engine_name, **kwargs)
+            else:
+                parsed = await asyncio.to_thread(
+                    self.parse_service.parse_result, path, engine_name=engine_name, **kwargs
+                )
+            return self._success_item(
+                path, parsed, output_path, fmt, engine_name, started_at, start, collect_metrics
             )
+        except Exception as exc:
+            if fail_fast:
+                raise
+            return self._failed_item(path, engine_name, exc, started_at)
+
+    def _skipped_item(
+        self, path: Path, output_path: Path, engine_name: str, started_at: str
+    ) -> BatchItemResult:
+        return BatchItemResult(
+            source=str(path),
+            status="skipped",
+            output_path=str(output_path),
+            engine=engine_name,
+            started_at=started_at,
+            finished_at=self._utc_now(),
+        )
+
+    def _success_item(
+        self,
+        path: Path,
+        parsed,
+        output_path: Path,
+        fmt: str,
+        engine_name: str,
+        started_at: str,
+        start: float,
+        collect_metrics: bool,
+        elapsed: float | None = None,
+    ) -> BatchItemResult:
+        rendered = self.parse_service.render_output(parsed, fmt)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(rendered, encoding="utf-8")
+        if elapsed is None:
+            elapsed = time.perf_counter() - start
+        metrics = collect_parse_metrics(parsed, elapsed) if collect_metrics else None
+        return BatchItemResult(
+            source=str(path),
+            status="success",
+            output_path=str(output_path),
+            metrics=metrics,
+            engine=engine_name,
+            started_at=started_at,
+            finished_at=self._utc_now(),
+        )
+
+    def _failed_item(
+        self, path: Path, engine_name: str, exc: BaseException, started_at: str
+    ) -> BatchItemResult:
+        classified = classify_exception(exc)
+        return BatchItemResult(
+            source=str(path),
+            status="failed",
+            engine=engine_name,
+            error_type=classified.error_type.value,
+            error_message=classified.message,
+            started_at=started_at,
+            finished_at=self._utc_now(),
+        )
+
+    def _finish_run(
+        self, items: list[BatchItemResult], output_dir: Path, **summary_extras
+    ) -> BatchRunResult:
+        result = BatchRunResult(items=items, summary={**self._build_summary(items), **summary_extras})
+        self._write_jsonl(output_dir / "batch-results.jsonl", items)
+        self._write_json(output_dir / "batch-summary.json", result.summary)
+        return result
 
     def _build_summary(self, items: list[BatchItemResult]) -> dict:
         total_pages = sum((item.metrics.page_count if item.metrics else 0) for item in items)
         total_elapsed = sum((item.metrics.elapsed_seconds if item.metrics else 0.0) for item in items)
+        startup_durations = [
+            item.metrics.service_startup_seconds
+            for item in items
+            if item.metrics and item.metrics.service_startup_seconds is not None
+        ]
         return {
             "total_files": len(items),
             "success_count": sum(1 for item in items if item.status == "success"),
@@ -161,6 +567,12 @@ class BatchParseService:
             if total_elapsed > 0
             else 0.0,
             "failed_sources": [item.source for item in items if item.status == "failed"],
+            "service_startup_seconds": max(startup_durations) if startup_durations else None,
+            "table_pages_skipped": sum(item.metrics.table_pages_skipped for item in items if item.metrics),
+            "table_extraction_seconds": round(
+                sum(item.metrics.table_extraction_seconds for item in items if item.metrics), 4
+            ),
+            "request_timings": summarize_request_timings([item.metrics for item in items if item.metrics]),
         }
 
     def _output_filename(self, source: Path, fmt: str) -> str:
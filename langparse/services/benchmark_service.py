@@ -4,6 +4,7 @@ import json
 from dataclasses import asdict
 from pathlib import Path
 
+from langparse.metrics import ParseMetrics, summarize_request_timings
 from langparse.services.batch_service import BatchParseService
 from langparse.services.quality import QualityCheck, run_quality_checks
 
@@ -86,6 +87,9 @@ class BenchmarkService:
                 row["id"] for row in quality_rows if not row["quality"]["passed"]
             ],
             "pdf_quality_summary": self._pdf_quality_summary(rows),
+            "request_timings": summarize_request_timings(
+                [ParseMetrics(**row["metrics"]) for row in rows if row["metrics"]]
+            ),
         }
 
     def _pdf_quality_summary(self, rows: list[dict]) -> dict:
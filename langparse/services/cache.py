@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, replace
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+from langparse.types import ParsedDocumentResult, ParsedElement, ParsedPageResult
+
+# Document metadata describing the run that produced a result rather than the result itself.
+# A cache hit does none of that work, so these are dropped instead of replayed into metrics.
+RUN_METADATA_KEYS = ("request_timings", "service_startup_seconds")
+
+# Engine options that change how a result is obtained (where the service runs, timeouts,
+# parallelism, caching) but never what it contains. They are left out of cache keys so
+# that e.g. moving mineru-api to another host or raising worker counts keeps hitting.
+TRANSPORT_OPTIONS = frozenset(
+    {
+        "api_url",
+        "api_host",
+        "api_port",
+        "api_workers",
+        "api_command",
+        "api_start_timeout",
+        "request_timeout",
+        "max_connections_per_host",
+        "shard_workers",
+        "async_max_concurrency",
+        "pack_max_files",
+        "pack_max_pages",
+        "pack_max_bytes",
+        "auto_install_runtime",
+        "workers",
+        "chunk_pages",
+        "parallel_min_pages",
+        "reorder_window",
+        "page_cache",
+        "page_cache_dir",
+        "page_cache_max_bytes",
+    }
+)
+
+
+def langparse_version() -> str:
+    try:
+        return version("langparse")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def file_sha256(file_path: Path, block_size: int = 1024 * 1024) -> str:
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as handle:
+        while True:
+            block = handle.read(block_size)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ParseResultCache:
+    """
+    Content-addressed on-disk cache of ParsedDocumentResults.
+
+    Entries are keyed by the file's SHA-256, the engine name, the resolved
+    engine config and the langparse version, so the same bytes under another
+    path hit the cache while any config or version change misses. Results are
+    stored as gzipped JSON next to an SQLite index; once the stored size
+    exceeds max_bytes the least recently used entries are evicted.
+    """
+
+    def __init__(self, cache_dir, max_bytes: int = 1024 * 1024 * 1024, version: str | None = None):
+        if max_bytes < 1:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}.")
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.max_bytes = max_bytes
+        self.version = version or langparse_version()
+        self._objects_dir = self.cache_dir / "objects"
+        self._objects_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._db = sqlite3.connect(self.cache_dir / "index.sqlite3", timeout=30.0, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, size INTEGER NOT NULL, engine TEXT NOT NULL, "
+                "created_at REAL NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+
+    def key_for(self, file_path, engine_name: str, engine_config: dict[str, Any]) -> str:
+        payload = json.dumps(
+            {
+                "sha256": file_sha256(file_path),
+                "engine": engine_name,
+                "config": _result_config(engine_config),
+                "version": self.version,
+            },
+            sort_keys=True,
+            default=repr,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> ParsedDocumentResult | None:
+        path = self._object_path(key)
+        with self._lock:
+            row = self._db.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None or not path.exists():
+                if row is not None:
+                    self._delete(key)
+                self._stats["misses"] += 1
+                return None
+            with self._db:
+                self._db.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+            self._stats["hits"] += 1
+        try:
+            payload = json.loads(gzip.decompress(path.read_bytes()).decode("utf-8"))
+        except (OSError, ValueError):
+            # Corrupt or concurrently evicted object: treat it as a miss.
+            with self._lock:
+                self._stats["hits"] -= 1
+                self._stats["misses"] += 1
+                self._delete(key)
+            return None
+        return _result_from_dict(payload)
+
+    def put(self, key: str, parsed: ParsedDocumentResult) -> None:
+        data = gzip.compress(json.dumps(asdict(parsed), ensure_ascii=False).encode("utf-8"))
+        if len(data) > self.max_bytes:
+            return
+        path = self._object_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        temp_path.write_bytes(data)
+        os.replace(temp_path, path)
+        now = time.time()
+        with self._lock:
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO entries (key, size, engine, created_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, len(data), parsed.engine, now, now),
+                )
+            self._stats["writes"] += 1
+            self._evict()
+
+    def lookup(
+        self, file_path, engine_name: str, engine_config: dict[str, Any]
+    ) -> tuple[str, ParsedDocumentResult | None]:
+        """Return the cache key for a file and its cached result re-pointed at file_path, if any."""
+        key = self.key_for(file_path, engine_name, engine_config)
+        cached = self.get(key)
+        if cached is not None:
+            file_path = Path(file_path)
+            metadata = {key: value for key, value in cached.metadata.items() if key not in RUN_METADATA_KEYS}
+            cached = replace(cached, source=str(file_path), filename=file_path.name, metadata=metadata)
+        return key, cached
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            entries, total_bytes = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": entries,
+                "bytes": total_bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            keys = [row[0] for row in self._db.execute("SELECT key FROM entries")]
+            for key in keys:
+                self._delete(key)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __getstate__(self) -> dict:
+        # The SQLite connection cannot be pickled; each process opens its own.
+        return {"cache_dir": self.cache_dir, "max_bytes": self.max_bytes, "version": self.version}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def __enter__(self) -> "ParseResultCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _evict(self) -> None:
+        (total_bytes,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total_bytes <= self.max_bytes:
+            return
+        for key, size in self._db.execute(
+            "SELECT key, size FROM entries ORDER BY last_access ASC"
+        ).fetchall():
+            if total_bytes <= self.max_bytes:
+                break
+            self._delete(key)
+            total_bytes -= size
+            self._stats["evictions"] += 1
+
+    def _delete(self, key: str) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._object_path(key).unlink(missing_ok=True)
+
+    def _object_path(self, key: str) -> Path:
+        return self._objects_dir / key[:2] / f"{key}.json.gz"
+
+
+def _result_config(engine_config: Any) -> Any:
+    # Nested option dicts (e.g. the hybrid engine's mineru_options) are filtered too.
+    if not isinstance(engine_config, dict):
+        return engine_config
+    return {
+        key: _result_config(value) for key, value in engine_config.items() if key not in TRANSPORT_OPTIONS
+    }
+
+
+def _result_from_dict(payload: dict[str, Any]) -> ParsedDocumentResult:
+    pages = [
+        ParsedPageResult(
+            **{
+                **page,
+                "elements": [ParsedElement(**element) for element in page.get("elements", [])],
+            }
+        )
+        for page in payload.get("pages", [])
+    ]
+    return ParsedDocumentResult(**{**payload, "pages": pages})
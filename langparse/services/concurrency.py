@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import threading
+import time
+from statistics import median
+
+from langparse.errors import ErrorType
+
+# Failures that signal an overloaded engine rather than a bad input file.
+OVERLOAD_ERROR_TYPES = frozenset({ErrorType.ENGINE_TIMEOUT.value, ErrorType.ENGINE_UNAVAILABLE.value})
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for a remote parsing engine.
+
+    Completed requests are evaluated in windows of `limit` samples. The limit
+    grows by increase_step while throughput keeps up, and is multiplied by
+    decrease_factor when a window contains overload errors (timeouts, engine
+    unavailable) or its median latency exceeds latency_tolerance times the
+    baseline latency. The baseline starts at the first window's median and
+    moves baseline_smoothing of the way towards each faster window, so one
+    unusually cheap window cannot pin it near zero. Releases without a
+    latency (work that never reached the engine) only free their slot.
+    Every change is kept in `history`.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 2,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        baseline_smoothing: float = 0.25,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit.")
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.baseline_smoothing = baseline_smoothing
+        self.history: list[dict] = []
+        self._limit = initial_limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+        self._started = time.monotonic()
+        self._window_started = self._started
+        self._latencies: list[float] = []
+        self._overload_errors = 0
+        self._baseline_latency: float | None = None
+        self._previous_throughput: float | None = None
+        self._record_change("initial")
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    def acquire(self) -> None:
+        with self._condition:
+            while self._in_flight >= self._limit:
+                self._condition.wait()
+            self._in_flight += 1
+
+    def release(self, latency: float | None, error_type: str | None = None) -> None:
+        with self._condition:
+            self._in_flight -= 1
+            if latency is None:
+                self._condition.notify_all()
+                return
+            self._latencies.append(latency)
+            if error_type in OVERLOAD_ERROR_TYPES:
+                self._overload_errors += 1
+            if len(self._latencies) >= self._limit:
+                self._evaluate_window()
+            self._condition.notify_all()
+
+    def summary(self) -> dict:
+        limits = [entry["limit"] for entry in self.history]
+        return {
+            "initial_limit": self.initial_limit,
+            "final_limit": self._limit,
+            "min_limit_observed": min(limits),
+            "max_limit_observed": max(limits),
+            "history": list(self.history),
+        }
+
+    def _evaluate_window(self) -> None:
+        now = time.monotonic()
+        window_latency = median(self._latencies)
+        throughput = len(self._latencies) / max(now - self._window_started, 1e-9)
+
+        if self._overload_errors:
+            self._decrease("errors")
+        elif (
+            self._baseline_latency is not None
+            and window_latency > self._baseline_latency * self.latency_tolerance
+        ):
+            self._decrease("latency")
+        elif self._previous_throughput is None or throughput >= self._previous_throughput * 0.95:
+            self._increase("throughput")
+
+        if self._baseline_latency is None:
+            self._baseline_latency = window_latency
+        elif window_latency < self._baseline_latency:
+            self._baseline_latency += self.baseline_smoothing * (window_latency - self._baseline_latency)
+        self._previous_throughput = throughput
+        self._window_started = now
+        self._latencies = []
+        self._overload_errors = 0
+
+    def _increase(self, reason: str) -> None:
+        new_limit = min(self.max_limit, self._limit + self.increase_step)
+        if new_limit != self._limit:
+            self._limit = new_limit
+            self._record_change(reason)
+
+    def _decrease(self, reason: str) -> None:
+        new_limit = max(self.min_limit, int(self._limit * self.decrease_factor))
+        if new_limit != self._limit:
+            self._limit = new_limit
+            self._record_change(reason)
+
+    def _record_change(self, reason: str) -> None:
+        self.history.append(
+            {
+                "elapsed_seconds": round(time.monotonic() - self._started, 4),
+                "limit": self._limit,
+                "reason": reason,
+            }
+        )
@@ -1,28 +1,69 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
+import time
 from collections.abc import Iterable
 from dataclasses import asdict
 from pathlib import Path
-from typing import Iterator, Union
+from typing import IO, Iterator, Union
 
 from langparse.config import settings
+from langparse.engines.pdf.fast import FastPDFEngine
+from langparse.engines.pdf.hybrid import HybridPDFEngine
 from langparse.engines.pdf.mineru import MinerUEngine
 from langparse.engines.pdf.other import DeepDocEngine, PaddleOCRVLEngine
 from langparse.engines.pdf.simple import SimplePDFEngine
 from langparse.engines.pdf.vision_llm import VisionLLMEngine
+from langparse.metrics import ParseMetrics, ParseMetricsAccumulator
+from langparse.services.cache import ParseResultCache
 from langparse.types import Document, ParsedDocumentResult, ParsedPageResult
 
 ENGINE_MAP = {
     "simple": SimplePDFEngine,
+    "fast": FastPDFEngine,
+    "hybrid": HybridPDFEngine,
     "mineru": MinerUEngine,
     "vision_llm": VisionLLMEngine,
     "deepdoc": DeepDocEngine,
     "paddle": PaddleOCRVLEngine,
 }
 
+# Options that select what to parse in one call rather than configure the engine;
+# they reach process()/process_document() but never split the engine cache.
+PER_CALL_OPTIONS = frozenset({"pages", "max_pages"})
+
 
 class ParseService:
+    def __init__(self, cache: ParseResultCache | None = None):
+        self.cache = cache
+        self._engines: dict[str, object] = {}
+        self._engines_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Release engines created by this service, e.g. managed mineru-api processes."""
+        with self._engines_lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+        for engine in engines:
+            close = getattr(engine, "close", None)
+            if callable(close):
+                close()
+
+    def __getstate__(self) -> dict:
+        # Engines and locks stay behind; a worker process builds its own engines.
+        return {"cache": self.cache}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(**state)
+
+    def __enter__(self) -> "ParseService":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     def render_output(self, parsed: ParsedDocumentResult, fmt: str) -> str:
         if fmt == "markdown":
             return parsed.markdown_content
@@ -48,7 +89,7 @@ class ParseService:
         **kwargs,
     ) -> list[tuple[Path, str]]:
         outputs = []
-        active_engine = engine or self._create_engine(engine_name, **kwargs)
+        active_engine = engine or self._get_engine(engine_name, **kwargs)
         for file_path in self.expand_inputs(inputs):
             outputs.append(
                 (
@@ -112,6 +153,139 @@ class ParseService:
             **kwargs,
         )
 
+    def parse_results(self, file_paths, engine_name="simple", engine=None, **kwargs) -> list[ParsedDocumentResult]:
+        """
+        Parse several files in one engine call and return their results in
+        order. Engines with process_documents (mineru) get every cache miss at
+        once, e.g. as one multi-file request; other engines parse them one by one.
+        """
+        file_paths = [Path(file_path) for file_path in file_paths]
+        for file_path in file_paths:
+            if not file_path.exists():
+                raise FileNotFoundError(f"File not found: {file_path}")
+
+        active_engine = engine or self._get_engine(engine_name, **kwargs)
+        results: dict[Path, ParsedDocumentResult] = {}
+        cache_keys = {}
+        for file_path in file_paths:
+            cache_key, cached = self._cache_lookup(file_path, engine_name, active_engine, kwargs)
+            if cached is not None:
+                results[file_path] = cached
+            else:
+                cache_keys[file_path] = cache_key
+
+        misses = list(cache_keys)
+        if misses:
+            process_documents = getattr(active_engine, "process_documents", None)
+            if callable(process_documents):
+                parsed_results = process_documents(misses, **kwargs)
+                if len(parsed_results) != len(misses) or not all(
+                    isinstance(parsed, ParsedDocumentResult) for parsed in parsed_results
+                ):
+                    raise TypeError(
+                        f"{type(active_engine).__name__}.process_documents must return one "
+                        "ParsedDocumentResult per file"
+                    )
+            else:
+                parsed_results = [
+                    self._run_engine(file_path, engine_name, active_engine, **kwargs) for file_path in misses
+                ]
+            for file_path, parsed in zip(misses, parsed_results):
+                if cache_keys[file_path] is not None:
+                    self.cache.put(cache_keys[file_path], parsed)
+                results[file_path] = parsed
+        return [results[file_path] for file_path in file_paths]
+
+    async def aparse_result(self, file_path, engine_name="simple", engine=None, **kwargs):
+        """
+        asyncio variant of parse_result. Engines with aprocess_document run on
+        the event loop; other engines are parsed in a worker thread.
+        """
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        active_engine = engine or self._get_engine(engine_name, **kwargs)
+        aprocess_document = getattr(active_engine, "aprocess_document", None)
+        if not callable(aprocess_document):
+            return await asyncio.to_thread(
+                self.parse_result,
+                file_path,
+                engine_name=engine_name,
+                engine=active_engine,
+                **kwargs,
+            )
+
+        cache_key, cached = await asyncio.to_thread(
+            self._cache_lookup, file_path, engine_name, active_engine, kwargs
+        )
+        if cached is not None:
+            return cached
+
+        parsed = await aprocess_document(file_path, **kwargs)
+        if not isinstance(parsed, ParsedDocumentResult):
+            raise TypeError(
+                f"{type(active_engine).__name__}.aprocess_document must return ParsedDocumentResult"
+            )
+        if cache_key is not None:
+            await asyncio.to_thread(self.cache.put, cache_key, parsed)
+        return parsed
+
+    def iter_pages(self, file_path, engine_name="simple", engine=None, **kwargs) -> Iterator[ParsedPageResult]:
+        """
+        Yield ParsedPageResults as the engine produces them. Engines that only
+        parse whole documents (process_document) yield their pages once the
+        document is done. Streaming never reads or fills the result cache.
+        """
+        yield from self._stream_pages(file_path, engine_name, engine, {}, **kwargs)
+
+    def stream_output(
+        self,
+        file_path,
+        sink: Union[str, Path, IO[str]],
+        engine_name="simple",
+        fmt="markdown",
+        engine=None,
+        **kwargs,
+    ) -> ParseMetrics:
+        """
+        Parse a file and write each page to sink (a path or a text file object)
+        as soon as it is yielded, returning metrics computed page by page. fmt
+        is "markdown" (pages joined by newlines, like parse_output) or "jsonl"
+        (one ParsedPageResult per line). Only one page is held at a time.
+        """
+        if fmt not in {"markdown", "jsonl"}:
+            raise ValueError(f"Unsupported streaming format: {fmt}")
+        if isinstance(sink, (str, Path)):
+            destination = Path(sink)
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            with destination.open("w", encoding="utf-8") as handle:
+                return self.stream_output(
+                    file_path, handle, engine_name=engine_name, fmt=fmt, engine=engine, **kwargs
+                )
+
+        accumulator = ParseMetricsAccumulator()
+        document_metadata: dict = {}
+        start = time.perf_counter()
+        for page in self._stream_pages(file_path, engine_name, engine, document_metadata, **kwargs):
+            if fmt == "markdown":
+                if accumulator.page_count:
+                    sink.write("\n")
+                sink.write(page.markdown_content)
+            else:
+                sink.write(json.dumps(asdict(page), ensure_ascii=False))
+                sink.write("\n")
+            accumulator.add_page(page)
+        return accumulator.finish(time.perf_counter() - start, document_metadata)
+
+    def health_check(self, engine_name="simple", engine=None, **kwargs) -> bool:
+        """Probe an engine's backing service; engines without a health() are always healthy."""
+        active_engine = engine or self._get_engine(engine_name, **kwargs)
+        health = getattr(active_engine, "health", None)
+        if callable(health):
+            health()
+        return True
+
     def parse_file(self, file_path, engine_name="simple", engine=None, **kwargs):
         parsed = self.parse_result(
             file_path,
@@ -126,7 +300,7 @@ class ParseService:
 
     def parse_batch(self, inputs, engine_name="simple", engine=None, **kwargs):
         documents = []
-        active_engine = engine or self._create_engine(engine_name, **kwargs)
+        active_engine = engine or self._get_engine(engine_name, **kwargs)
         for file_path in self.expand_inputs(inputs):
             documents.append(
                 self.parse_file(file_path, engine_name=engine_name, engine=active_engine, **kwargs)
@@ -138,7 +312,17 @@ class ParseService:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        active_engine = engine or self._create_engine(engine_name, **kwargs)
+        active_engine = engine or self._get_engine(engine_name, **kwargs)
+        cache_key, cached = self._cache_lookup(file_path, engine_name, active_engine, kwargs)
+        if cached is not None:
+            return cached
+
+        parsed = self._run_engine(file_path, engine_name, active_engine, **kwargs)
+        if cache_key is not None:
+            self.cache.put(cache_key, parsed)
+        return parsed
+
+    def _run_engine(self, file_path: Path, engine_name, active_engine, **kwargs) -> ParsedDocumentResult:
         if hasattr(active_engine, "process_document"):
             process_document = getattr(active_engine, "process_document")
             if not callable(process_document):
@@ -166,6 +350,47 @@ class ParseService:
             metadata={},
         )
 
+    def _stream_pages(
+        self, file_path, engine_name, engine, document_metadata: dict, **kwargs
+    ) -> Iterator[ParsedPageResult]:
+        file_path = Path(file_path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+
+        active_engine = engine or self._get_engine(engine_name, **kwargs)
+        if hasattr(active_engine, "process_document"):
+            parsed = self._run_engine(file_path, engine_name, active_engine, **kwargs)
+            document_metadata.update(parsed.metadata)
+            yield from parsed.pages
+            return
+
+        for page in active_engine.process(file_path, **kwargs):
+            yield self._to_parsed_page_result(page)
+
+    def _cache_lookup(self, file_path: Path, engine_name, active_engine, kwargs):
+        # Only engines built by this service have a known config; caller-supplied
+        # engine instances may be configured arbitrarily, so they bypass the cache.
+        if self.cache is None or not self._is_managed_engine(active_engine):
+            return None, None
+        engine_config = settings.resolve_engine_config(engine_name, kwargs)
+        return self.cache.lookup(file_path, engine_name, engine_config)
+
+    def _is_managed_engine(self, engine) -> bool:
+        with self._engines_lock:
+            return any(engine is managed for managed in self._engines.values())
+
+    def _get_engine(self, engine_name: str, **kwargs):
+        # Engines are reused across files so that expensive runtimes (model loads,
+        # local services) are paid once per configuration instead of once per file.
+        kwargs = {key: value for key, value in kwargs.items() if key not in PER_CALL_OPTIONS}
+        key = json.dumps([engine_name, kwargs], sort_keys=True, default=repr)
+        with self._engines_lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = self._create_engine(engine_name, **kwargs)
+                self._engines[key] = engine
+            return engine
+
     def _create_engine(self, engine_name: str, **kwargs):
         engine_class = ENGINE_MAP.get(engine_name)
         if engine_class is None:
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from langparse.errors import ErrorType
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with full jitter: attempt n sleeps up to base_delay * 2**(n-1)."""
+
+    max_attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+
+    def delay(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+
+DEFAULT_RETRY_POLICIES: dict[ErrorType, RetryPolicy] = {
+    ErrorType.ENGINE_UNAVAILABLE: RetryPolicy(max_attempts=4, base_delay=1.0),
+    ErrorType.ENGINE_TIMEOUT: RetryPolicy(max_attempts=2, base_delay=5.0),
+}
+
+# Error types that count towards opening the circuit; bad input files do not.
+BREAKER_ERROR_TYPES = frozenset({ErrorType.ENGINE_UNAVAILABLE, ErrorType.ENGINE_TIMEOUT})
+
+
+class CircuitOpenError(RuntimeError):
+    pass
+
+
+class CircuitBreaker:
+    """
+    Stops sending work to an engine after failure_threshold consecutive
+    engine-level failures. While open, callers wait instead of burning request
+    timeouts; after reset_timeout one caller runs the health probe and work
+    resumes if it passes. Once the circuit has been open for max_wait,
+    callers fail fast with CircuitOpenError instead of waiting, but one caller
+    still runs the probe every reset_timeout, so the circuit closes again when
+    the engine recovers.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        reset_timeout: float = 10.0,
+        max_wait: float = 120.0,
+        probe: Callable[[], Any] | None = None,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.max_wait = max_wait
+        self.probe = probe
+        self.state = "closed"
+        self.open_count = 0
+        self._failures = 0
+        self._opened_at = 0.0
+        self._outage_started = 0.0
+        self._probing = False
+        self._condition = threading.Condition()
+
+    def before_call(self) -> None:
+        while True:
+            with self._condition:
+                while True:
+                    if self.state == "closed":
+                        return
+                    now = time.monotonic()
+                    # The deadline belongs to the outage, not the caller, so work
+                    # queued late in a long outage does not wait max_wait again.
+                    deadline = self._outage_started + self.max_wait
+                    if not self._probing and now >= self._opened_at + self.reset_timeout:
+                        self._probing = True
+                        break
+                    if now >= deadline:
+                        raise CircuitOpenError(
+                            "Engine unavailable: circuit breaker open after repeated failures."
+                        )
+                    self._condition.wait(
+                        timeout=max(0.01, min(self._opened_at + self.reset_timeout, deadline) - now)
+                    )
+
+            healthy = self._run_probe()
+            with self._condition:
+                self._probing = False
+                if healthy:
+                    self.state = "closed"
+                    self._failures = 0
+                    self._outage_started = 0.0
+                else:
+                    self._opened_at = time.monotonic()
+                self._condition.notify_all()
+
+    def record_success(self) -> None:
+        with self._condition:
+            self._failures = 0
+
+    def record_failure(self, error_type: ErrorType) -> None:
+        if error_type not in BREAKER_ERROR_TYPES:
+            return
+        with self._condition:
+            self._failures += 1
+            if self.state == "closed" and self._failures >= self.failure_threshold:
+                self.state = "open"
+                self.open_count += 1
+                self._opened_at = self._outage_started = time.monotonic()
+
+    def _run_probe(self) -> bool:
+        if self.probe is None:
+            return True
+        try:
+            result = self.probe()
+        except Exception:
+            return False
+        return result is not False
@@ -2,8 +2,11 @@ from pathlib import Path
 
 import pytest
 
+from langparse.errors import ErrorType
 from langparse.metrics import BatchRunResult
 from langparse.services.batch_service import BatchParseService
+from langparse.services.concurrency import AdaptiveConcurrencyLimiter
+from langparse.services.resilience import RetryPolicy
 from langparse.types import ParsedDocumentResult, ParsedPageResult
 
 
@@ -110,3 +113,205 @@ def test_batch_service_raises_when_fail_fast_true(tmp_path):
             max_workers=1,
             fail_fast=True,
         )
+
+
+def test_batch_service_run_async_uses_async_parse_when_available(tmp_path):
+    import asyncio
+
+    class AsyncParseService(StubParseService):
+        async def aparse_result(self, file_path, engine_name="simple", engine=None, **kwargs):
+            await asyncio.sleep(0)
+            return self.parse_result(file_path, engine_name=engine_name, **kwargs)
+
+    pdfs = []
+    for name in ("a.pdf", "b.pdf", "c.pdf"):
+        pdf = tmp_path / name
+        pdf.write_text("x", encoding="utf-8")
+        pdfs.append(pdf)
+
+    parse_service = AsyncParseService()
+    result = asyncio.run(
+        BatchParseService(parse_service=parse_service).run_async(
+            pdfs, output_dir=tmp_path / "out", max_concurrency=2
+        )
+    )
+
+    assert result.success_count == 3
+    assert [item.source for item in result.items] == [str(pdf) for pdf in pdfs]
+    assert (tmp_path / "out" / "batch-summary.json").exists()
+
+
+def test_batch_service_adaptive_concurrency_reports_limit_history(tmp_path):
+    pdfs = []
+    for index in range(6):
+        pdf = tmp_path / f"{index}.pdf"
+        pdf.write_text("x", encoding="utf-8")
+        pdfs.append(pdf)
+
+    result = BatchParseService(parse_service=StubParseService()).run(
+        pdfs,
+        output_dir=tmp_path / "out",
+        max_workers=4,
+        adaptive_concurrency=True,
+    )
+
+    assert result.success_count == 6
+    concurrency = result.summary["concurrency"]
+    assert concurrency["initial_limit"] == 2
+    assert concurrency["max_limit_observed"] <= 4
+    assert concurrency["history"][0]["reason"] == "initial"
+
+
+def test_batch_service_process_executor_parses_in_worker_processes(make_text_pdf, tmp_path):
+    good = make_text_pdf(["First page", "Second page"], name="good.pdf")
+    broken = tmp_path / "broken.pdf"
+    broken.write_bytes(b"not a pdf")
+
+    result = BatchParseService().run(
+        [good, broken],
+        output_dir=tmp_path / "out",
+        max_workers=2,
+        executor="process",
+    )
+
+    items = {Path(item.source).name: item for item in result.items}
+    assert items["good.pdf"].status == "success"
+    assert items["good.pdf"].metrics.page_count == 2
+    assert (tmp_path / "out" / "good.md").read_text(encoding="utf-8").startswith("First page")
+    assert items["broken.pdf"].status == "failed"
+    assert items["broken.pdf"].error_type == "parse_failed"
+    assert result.summary["executor"] == "process"
+
+
+def test_batch_service_process_executor_rejects_in_process_controls(tmp_path):
+    with pytest.raises(ValueError, match="executor='process'"):
+        BatchParseService(StubParseService()).run(
+            [], output_dir=tmp_path, executor="process", circuit_breaker=True
+        )
+    with pytest.raises(ValueError, match="Unsupported executor"):
+        BatchParseService(StubParseService()).run([], output_dir=tmp_path, executor="fiber")
+
+
+def test_batch_service_process_executor_rejects_managed_mineru_service(tmp_path):
+    from langparse.services.parse_service import ParseService
+
+    service = ParseService()
+    with pytest.raises(ValueError, match="separate mineru engine service in every worker"):
+        BatchParseService(service).run([], output_dir=tmp_path, engine_name="mineru", executor="process")
+    assert service._get_engine("mineru").starts_service
+    assert not service._get_engine("mineru", api_url="http://127.0.0.1:9").starts_service
+    with pytest.raises(ValueError, match="separate hybrid engine service in every worker"):
+        BatchParseService(service).run([], output_dir=tmp_path, engine_name="hybrid", executor="process")
+    assert not service._get_engine("hybrid", api_url="http://127.0.0.1:9").starts_service
+
+
+def test_pack_item_round_trips_batch_item_results():
+    from langparse.metrics import BatchItemResult, ParseMetrics
+    from langparse.services.batch_service import _pack_item, _unpack_item
+
+    item = BatchItemResult(
+        source="a.pdf",
+        status="success",
+        metrics=ParseMetrics(page_count=3, elapsed_seconds=1.5),
+        attempts=2,
+    )
+
+    packed = _pack_item(item)
+
+    assert all(not hasattr(value, "__dataclass_fields__") for value in packed)
+    assert _unpack_item(packed) == item
+
+
+def test_batch_service_pack_files_parses_packs_together_and_isolates_failures(tmp_path, monkeypatch):
+    from langparse.services.parse_service import ENGINE_MAP, ParseService
+
+    calls = []
+
+    class PackingEngine:
+        def __init__(self, **kwargs):
+            pass
+
+        def plan_packs(self, file_paths):
+            return [file_paths[:3], file_paths[3:]]
+
+        def process_documents(self, file_paths, **kwargs):
+            calls.append([path.name for path in file_paths])
+            if any(path.read_text() == "bad" for path in file_paths):
+                raise RuntimeError("pack rejected")
+            return [self.process_document(path) for path in file_paths]
+
+        def process_document(self, file_path, **kwargs):
+            if file_path.read_text() == "bad":
+                raise RuntimeError("bad file")
+            return ParsedDocumentResult(
+                source=str(file_path),
+                filename=file_path.name,
+                engine="packing",
+                pages=[ParsedPageResult(page_number=1, markdown_content=file_path.stem)],
+                markdown_content=file_path.stem,
+            )
+
+    monkeypatch.setitem(ENGINE_MAP, "packing", PackingEngine)
+    paths = []
+    for name in ("a", "b", "c", "d", "e"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_text("bad" if name == "e" else name)
+        paths.append(path)
+
+    result = BatchParseService(ParseService()).run(
+        paths, engine_name="packing", output_dir=tmp_path / "out", pack_files=True, max_workers=2
+    )
+
+    assert sorted(calls) == [["a.pdf", "b.pdf", "c.pdf"], ["d.pdf", "e.pdf"]]
+    assert [item.status for item in result.items] == ["success"] * 4 + ["failed"]
+    assert (tmp_path / "out" / "d.md").read_text(encoding="utf-8") == "d"
+    assert result.summary["pack_count"] == 2
+    with pytest.raises(ValueError, match="pack_files"):
+        BatchParseService(ParseService()).run(paths, engine_name="packing", pack_files=True, executor="process")
+
+
+def test_batch_service_adaptive_concurrency_samples_only_engine_calls(tmp_path):
+    class FixedDelay(RetryPolicy):
+        def delay(self, attempt):
+            return 0.3
+
+    class RecordingLimiter(AdaptiveConcurrencyLimiter):
+        def __init__(self, **kwargs):
+            self.samples = []
+            super().__init__(**kwargs)
+
+        def release(self, latency, error_type=None):
+            self.samples.append(latency)
+            super().release(latency, error_type)
+
+    class FlakyOnce(StubParseService):
+        def parse_result(self, file_path, engine_name="simple", engine=None, **kwargs):
+            if not self.calls:
+                self.calls.append(None)
+                raise RuntimeError("MinerU API request failed with HTTP 503: busy")
+            return super().parse_result(file_path, engine_name, engine, **kwargs)
+
+    output_dir = tmp_path / "out"
+    output_dir.mkdir()
+    pdfs = []
+    for name in ("a", "b", "c"):
+        pdf = tmp_path / f"{name}.pdf"
+        pdf.write_text("x", encoding="utf-8")
+        pdfs.append(pdf)
+    (output_dir / "a.md").write_text("old", encoding="utf-8")
+    (output_dir / "b.md").write_text("old", encoding="utf-8")
+    limiter = RecordingLimiter(initial_limit=1, max_limit=1)
+
+    result = BatchParseService(parse_service=FlakyOnce()).run(
+        pdfs,
+        output_dir=output_dir,
+        skip_existing=True,
+        adaptive_concurrency=limiter,
+        retry_policies={ErrorType.ENGINE_UNAVAILABLE: FixedDelay(max_attempts=2)},
+    )
+
+    assert result.skipped_count == 2
+    assert result.items[2].attempts == 2
+    assert limiter.samples.count(None) == 2
+    (sample,) = [latency for latency in limiter.samples if latency is not None]
+    assert sample < 0.1
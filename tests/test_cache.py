@@ -0,0 +1,170 @@
+from langparse.metrics import collect_parse_metrics
+from langparse.services.batch_service import BatchParseService
+from langparse.services.cache import ParseResultCache
+from langparse.services.parse_service import ENGINE_MAP, ParseService
+from langparse.types import ParsedDocumentResult, ParsedElement, ParsedPageResult
+
+
+class CountingEngine:
+    def __init__(self, **kwargs):
+        self.calls = 0
+
+    def process_document(self, file_path, **kwargs):
+        self.calls += 1
+        return ParsedDocumentResult(
+            source=str(file_path),
+            filename=file_path.name,
+            engine="counting",
+            pages=[
+                ParsedPageResult(
+                    page_number=1,
+                    markdown_content=f"parsed {file_path.read_text()}",
+                    elements=[ParsedElement(kind="text", text="x", bbox=(0, 0, 1, 1))],
+                )
+            ],
+            markdown_content=f"parsed {file_path.read_text()}",
+            metadata={
+                "mode": kwargs.get("mode"),
+                "service_startup_seconds": 4.0,
+                "request_timings": {"requests": 1, "upload_seconds": 0.5, "server_seconds": 2.0},
+            },
+        )
+
+
+def _service(tmp_path, monkeypatch, **cache_kwargs):
+    monkeypatch.setitem(ENGINE_MAP, "counting", CountingEngine)
+    return ParseService(cache=ParseResultCache(tmp_path / "cache", **cache_kwargs))
+
+
+def test_cache_hits_same_bytes_under_another_path(tmp_path, monkeypatch):
+    service = _service(tmp_path, monkeypatch)
+    first = tmp_path / "a.pdf"
+    copy = tmp_path / "copy.pdf"
+    first.write_text("same")
+    copy.write_text("same")
+
+    parsed = service.parse_result(first, engine_name="counting")
+    cached = service.parse_result(copy, engine_name="counting")
+
+    assert service._get_engine("counting").calls == 1
+    assert cached.source == str(copy)
+    assert cached.filename == "copy.pdf"
+    assert cached.markdown_content == parsed.markdown_content
+    assert isinstance(cached.pages[0].elements[0], ParsedElement)
+    assert service.cache.stats()["hits"] == 1
+    assert service.cache.stats()["misses"] == 1
+
+
+def test_cache_hits_report_no_requests_or_service_startup(tmp_path, monkeypatch):
+    service = _service(tmp_path, monkeypatch)
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("doc")
+
+    parsed = service.parse_result(pdf, engine_name="counting")
+    cached = service.parse_result(pdf, engine_name="counting")
+
+    assert collect_parse_metrics(parsed, elapsed_seconds=1.0).request_count == 1
+    metrics = collect_parse_metrics(cached, elapsed_seconds=0.01)
+    assert metrics.request_count == 0
+    assert metrics.upload_seconds == metrics.server_seconds == 0.0
+    assert metrics.service_startup_seconds is None
+    assert cached.metadata["mode"] is None
+
+
+def test_cache_misses_on_config_version_or_content_change(tmp_path, monkeypatch):
+    service = _service(tmp_path, monkeypatch)
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("v1")
+
+    service.parse_result(pdf, engine_name="counting", mode="fast")
+    service.parse_result(pdf, engine_name="counting", mode="accurate")
+    pdf.write_text("v2")
+    service.parse_result(pdf, engine_name="counting", mode="fast")
+
+    assert service.cache.stats()["misses"] == 3
+    upgraded = ParseResultCache(tmp_path / "cache", version="999.0")
+    assert upgraded.key_for(pdf, "counting", {"mode": "fast"}) != service.cache.key_for(
+        pdf, "counting", {"mode": "fast"}
+    )
+
+
+def test_cache_key_ignores_transport_and_concurrency_settings(tmp_path):
+    cache = ParseResultCache(tmp_path / "cache")
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("doc")
+    base = {"device": "cpu", "mineru_options": {"api_url": "http://a:8000"}}
+
+    key = cache.key_for(pdf, "mineru", {**base, "api_url": "http://a:8000", "request_timeout": 30})
+    moved = {
+        "device": "cpu",
+        "mineru_options": {"api_url": "http://b:9000", "shard_workers": 8},
+        "api_url": "http://b:9000",
+        "api_workers": 4,
+        "async_max_concurrency": 128,
+    }
+
+    assert cache.key_for(pdf, "mineru", moved) == key
+    assert cache.key_for(pdf, "mineru", {**base, "device": "cuda"}) != key
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path):
+    results = {
+        name: ParsedDocumentResult(source=name, filename=name, engine="simple", markdown_content=name * 20)
+        for name in ("a", "b", "c")
+    }
+    probe = ParseResultCache(tmp_path / "probe")
+    probe.put("a" * 64, results["a"])
+    entry_bytes = probe.stats()["bytes"]
+    cache = ParseResultCache(tmp_path / "cache", max_bytes=int(entry_bytes * 2.5))
+    cache.put("a" * 64, results["a"])
+    cache.put("b" * 64, results["b"])
+    assert cache.get("a" * 64) is not None
+    cache.put("c" * 64, results["c"])
+
+    stats = cache.stats()
+    assert stats["bytes"] <= cache.max_bytes
+    assert stats["evictions"] == 1
+    assert cache.get("b" * 64) is None
+    assert cache.get("c" * 64) is not None
+
+
+def test_cache_persists_across_instances_and_reports_in_batch_summary(tmp_path, monkeypatch):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("doc")
+    _service(tmp_path, monkeypatch).parse_result(pdf, engine_name="counting")
+
+    service = _service(tmp_path, monkeypatch)
+    result = BatchParseService(service).run([pdf], engine_name="counting", output_dir=tmp_path / "out")
+
+    assert service._get_engine("counting").calls == 0
+    assert result.summary["cache"]["hits"] == 1
+    assert result.summary["cache"]["entries"] == 1
+
+
+def test_cache_stats_reported_for_multi_worker_thread_runs(tmp_path, monkeypatch):
+    service = _service(tmp_path, monkeypatch)
+    paths = []
+    for name in ("a", "b", "c"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_text(name)
+        paths.append(path)
+
+    result = BatchParseService(service).run(
+        paths, engine_name="counting", output_dir=tmp_path / "out", max_workers=2
+    )
+
+    assert result.summary["cache"]["misses"] == 3
+    assert result.summary["cache"]["entries"] == 3
+
+
+def test_explicit_engine_instances_bypass_cache(tmp_path, monkeypatch):
+    service = _service(tmp_path, monkeypatch)
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("doc")
+    engine = CountingEngine()
+
+    service.parse_result(pdf, engine_name="counting", engine=engine)
+    service.parse_result(pdf, engine_name="counting", engine=engine)
+
+    assert engine.calls == 2
+    assert service.cache.stats()["entries"] == 0
@@ -4,6 +4,7 @@ from pathlib import Path
 import pytest
 
 from langparse.cli import build_parser, main
+from langparse.metrics import ParseMetrics
 from langparse.services.parse_service import ParseService
 from langparse.types import ParsedDocumentResult, ParsedPageResult
 
@@ -403,3 +404,102 @@ def test_cli_main_benchmark_delegates_to_benchmark_service(monkeypatch):
 
     assert exit_code == 0
     assert calls == [("samples/public.example.json", "reports", "mineru", "json", 2, {})]
+
+
+def test_cli_main_stream_parse_writes_pages_to_output(monkeypatch, capsys):
+    calls = []
+
+    class FakeService:
+        def stream_output(self, file_path, sink, engine_name="simple", fmt="markdown", **kwargs):
+            calls.append(("stream_output", file_path, sink, engine_name, fmt, kwargs))
+            return ParseMetrics(page_count=2)
+
+    monkeypatch.setattr("langparse.cli.ParseService", FakeService)
+
+    exit_code = main(
+        ["parse", "sample.pdf", "--stream", "--format", "jsonl", "--output", "out.jsonl", "--metrics"]
+    )
+
+    assert exit_code == 0
+    assert calls == [("stream_output", "sample.pdf", Path("out.jsonl"), "simple", "jsonl", {})]
+    assert json.loads(capsys.readouterr().err)["page_count"] == 2
+    with pytest.raises(SystemExit):
+        main(["parse", "sample.pdf", "--stream", "--format", "json"])
+
+
+def test_cli_main_single_parse_passes_page_selection(monkeypatch):
+    calls = []
+
+    class FakeService:
+        def parse_output(self, file_path, engine_name="simple", fmt="markdown", **kwargs):
+            calls.append(kwargs)
+            return "rendered"
+
+    monkeypatch.setattr("langparse.cli.ParseService", FakeService)
+
+    assert main(["parse", "sample.pdf", "--pages", "1-3,7", "--max-pages", "3"]) == 0
+    assert calls == [{"pages": "1-3,7", "max_pages": 3}]
+
+
+def test_cli_main_batch_pack_files_delegates_to_batch_service(monkeypatch):
+    calls = []
+
+    class FakeBatchService:
+        def run(self, inputs, **kwargs):
+            calls.append(kwargs)
+
+    monkeypatch.setattr("langparse.cli.BatchParseService", FakeBatchService)
+
+    assert main(["parse", "invoices/", "--batch", "--engine", "mineru", "--pack-files"]) == 0
+    assert calls[0]["pack_files"] is True
+
+
+def test_cli_main_response_zip_writes_images_next_to_outputs(monkeypatch):
+    calls = []
+
+    class FakeBatchService:
+        def run(self, inputs, **kwargs):
+            calls.append(kwargs)
+
+    monkeypatch.setattr("langparse.cli.BatchParseService", FakeBatchService)
+
+    argv = ["parse", "reports/", "--batch", "--engine", "mineru", "--metrics", "--output-dir", "out"]
+    assert main([*argv, "--response-zip"]) == 0
+    assert main([*argv, "--response-zip", "--image-dir", "figures"]) == 0
+    assert calls[0]["response_format_zip"] is True
+    assert calls[0]["image_dir"] == str(Path("out") / "images")
+    assert calls[1]["image_dir"] == "figures"
+
+
+def test_cli_main_retries_counts_retries_after_the_first_attempt(monkeypatch):
+    calls = []
+
+    class FakeBatchService:
+        def run(self, inputs, **kwargs):
+            calls.append(kwargs)
+
+    monkeypatch.setattr("langparse.cli.BatchParseService", FakeBatchService)
+
+    assert main(["parse", "docs/", "--batch", "--engine", "mineru", "--retries", "0"]) == 0
+    assert main(["parse", "docs/", "--batch", "--engine", "mineru", "--retries", "2"]) == 0
+    assert {policy.max_attempts for policy in calls[0]["retry_policies"].values()} == {1}
+    assert {policy.max_attempts for policy in calls[1]["retry_policies"].values()} == {3}
+    with pytest.raises(SystemExit):
+        main(["parse", "docs/", "--batch", "--retries", "-1"])
+
+
+def test_cli_main_bare_retries_uses_default_policies(monkeypatch):
+    from langparse.errors import ErrorType
+
+    calls = []
+
+    class FakeBatchService:
+        def run(self, inputs, **kwargs):
+            calls.append(kwargs)
+
+    monkeypatch.setattr("langparse.cli.BatchParseService", FakeBatchService)
+
+    assert main(["parse", "docs/", "--batch", "--engine", "mineru", "--retries"]) == 0
+    policies = calls[0]["retry_policies"]
+    assert policies[ErrorType.ENGINE_UNAVAILABLE].max_attempts == 4
+    assert policies[ErrorType.ENGINE_TIMEOUT].max_attempts == 2
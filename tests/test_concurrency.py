@@ -0,0 +1,57 @@
+from langparse.errors import ErrorType
+from langparse.services.concurrency import AdaptiveConcurrencyLimiter
+
+
+def complete_window(limiter, latency, error_type=None):
+    for _ in range(limiter.limit):
+        limiter.acquire()
+    for _ in range(limiter.limit):
+        limiter.release(latency, error_type)
+
+
+def test_limiter_increases_while_latency_is_stable():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+    complete_window(limiter, 0.1)
+    complete_window(limiter, 0.1)
+    complete_window(limiter, 0.1)
+
+    assert limiter.limit == 4
+    assert [entry["reason"] for entry in limiter.history] == ["initial", "throughput", "throughput"]
+
+
+def test_limiter_backs_off_on_timeouts_and_latency():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=16)
+
+    complete_window(limiter, 0.1, ErrorType.ENGINE_TIMEOUT.value)
+    assert limiter.limit == 4
+
+    complete_window(limiter, 0.1)
+    complete_window(limiter, 1.0)
+    assert limiter.limit == 2
+    assert limiter.history[-1]["reason"] == "latency"
+
+
+def test_limiter_ignores_input_errors():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+    complete_window(limiter, 0.1, ErrorType.PARSE_FAILED.value)
+
+    assert limiter.limit == 3
+    summary = limiter.summary()
+    assert summary["initial_limit"] == 2
+    assert summary["final_limit"] == 3
+    assert summary["max_limit_observed"] == 3
+
+
+def test_limiter_baseline_survives_one_cheap_window():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+
+    complete_window(limiter, 1.0)
+    complete_window(limiter, 0.001)
+    complete_window(limiter, 1.0)
+    limiter.acquire()
+    limiter.release(None)
+
+    assert limiter.limit == 2
+    assert all(entry["reason"] != "latency" for entry in limiter.history)
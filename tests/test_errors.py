@@ -27,3 +27,15 @@ def test_classify_unknown_runtime_error_as_parse_failed():
 
     assert error.error_type == ErrorType.PARSE_FAILED
     assert "unexpected parser crash" in error.message
+
+
+def test_classify_transient_http_errors_as_engine_unavailable():
+    error = classify_exception(RuntimeError("MinerU API request failed with HTTP 503: busy"))
+
+    assert error.error_type == ErrorType.ENGINE_UNAVAILABLE
+
+
+def test_classify_connection_refused_as_engine_unavailable():
+    error = classify_exception(RuntimeError("MinerU API request failed: [Errno 111] Connection refused"))
+
+    assert error.error_type == ErrorType.ENGINE_UNAVAILABLE
@@ -0,0 +1,181 @@
+import http.client
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from langparse.engines.pdf.http_pool import HTTPConnectionPool
+from langparse.engines.pdf.mineru_client import MinerUClient
+
+
+class RecordingHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.peers.append(self.client_address)
+        if self.path == "/fail":
+            body = b"boom"
+            self.send_response(503)
+        else:
+            body = json.dumps({"status": "ok"}).encode("utf-8")
+            self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return None
+
+
+@pytest.fixture
+def http_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), RecordingHandler)
+    server.peers = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_pool_reuses_keep_alive_connection(http_server):
+    base_url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    with HTTPConnectionPool() as pool:
+        client = MinerUClient(base_url, timeout=5, connection_pool=pool)
+        assert client.health() == {"status": "ok"}
+        assert client.health() == {"status": "ok"}
+
+        assert len(http_server.peers) == 2
+        assert len(set(http_server.peers)) == 1
+        assert pool.stats() == {"open_connections": 1, "idle_connections": 1}
+
+
+def test_pool_evicts_idle_connections(http_server):
+    url = f"http://127.0.0.1:{http_server.server_address[1]}/health"
+    with HTTPConnectionPool(idle_timeout=0.0) as pool:
+        pool.request("GET", url)
+        pool.request("GET", url)
+
+    assert len(set(http_server.peers)) == 2
+
+
+def test_pool_limits_connections_per_host(http_server):
+    url = f"http://127.0.0.1:{http_server.server_address[1]}/health"
+    pool = HTTPConnectionPool(max_connections_per_host=2)
+    threads = [threading.Thread(target=pool.request, args=("GET", url)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(http_server.peers) == 8
+    assert len(set(http_server.peers)) <= 2
+    assert pool.stats()["open_connections"] <= 2
+    pool.close()
+    assert pool.stats()["open_connections"] == 0
+
+
+def test_pool_does_not_replay_post_dropped_after_it_was_sent():
+    class DroppingHandler(RecordingHandler):
+        def do_POST(self):
+            self.server.posts += 1
+            self.rfile.read(int(self.headers["Content-Length"]))
+            # Mid-inference crash: the request arrived, no response is sent.
+            self.close_connection = True
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DroppingHandler)
+    server.peers = []
+    server.posts = 0
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with HTTPConnectionPool() as pool:
+            pool.request("GET", f"{base_url}/health")
+            with pytest.raises(http.client.RemoteDisconnected):
+                pool.request("POST", f"{base_url}/file_parse", body=b"{}", headers={"Content-Length": "2"})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert server.posts == 1
+
+
+def test_pool_replaces_connections_the_server_closed_while_idle():
+    class ClosingHandler(RecordingHandler):
+        def do_GET(self):
+            super().do_GET()
+            # Keep-alive response, but the server drops the connection right after it.
+            self.close_connection = True
+
+        def do_POST(self):
+            self.server.peers.append(self.client_address)
+            self.rfile.read(int(self.headers["Content-Length"]))
+            body = b"{}"
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ClosingHandler)
+    server.peers = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    try:
+        with HTTPConnectionPool() as pool:
+            pool.request("GET", f"{base_url}/health")
+            time.sleep(0.1)
+            response = pool.request("POST", f"{base_url}/file_parse", body=b"{}", headers={"Content-Length": "2"})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.status == 200
+    assert len(set(server.peers)) == 2
+
+
+def test_client_reports_http_errors(http_server):
+    base_url = f"http://127.0.0.1:{http_server.server_address[1]}"
+    client = MinerUClient(base_url, timeout=5, connection_pool=HTTPConnectionPool())
+
+    with pytest.raises(RuntimeError, match="HTTP 503: boom"):
+        client._request_json("GET", "/fail")
+
+
+def test_client_streams_multipart_upload(tmp_path):
+    received = {}
+
+    class UploadHandler(RecordingHandler):
+        def do_POST(self):
+            received["length"] = int(self.headers["Content-Length"])
+            received["body"] = self.rfile.read(received["length"])
+            body = json.dumps({"markdown": "# Uploaded"}).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), UploadHandler)
+    server.peers = []
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    pdf_path = tmp_path / "large.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4" + b"x" * 300_000)
+    try:
+        with HTTPConnectionPool() as pool:
+            client = MinerUClient(f"http://127.0.0.1:{server.server_address[1]}", timeout=5, connection_pool=pool)
+            pages = client.parse_file(pdf_path, {})
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    timings = pages[0].pop("timings")
+    assert pages == [{"page_number": 1, "markdown": "# Uploaded"}]
+    assert timings["requests"] == 1
+    assert timings["upload_seconds"] > 0 and timings["server_reported_seconds"] is None
+    assert received["length"] == len(received["body"])
+    assert pdf_path.read_bytes() in received["body"]
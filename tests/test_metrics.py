@@ -2,9 +2,12 @@ from langparse.metrics import (
     BatchItemResult,
     BatchRunResult,
     ParseMetrics,
+    collect_parse_metrics,
     count_markdown_tables,
     pages_per_second,
+    summarize_request_timings,
 )
+from langparse.types import ParsedDocumentResult, ParsedPageResult
 
 
 def test_pages_per_second_handles_zero_elapsed():
@@ -34,3 +37,90 @@ def test_batch_run_result_summary_counts_statuses():
     assert run.success_count == 1
     assert run.failed_count == 1
     assert run.skipped_count == 1
+
+
+def test_collect_parse_metrics_reports_service_startup_seconds():
+    parsed = ParsedDocumentResult(
+        source="a.pdf",
+        filename="a.pdf",
+        engine="mineru",
+        pages=[],
+        markdown_content="",
+        metadata={"service_startup_seconds": 12.5},
+    )
+
+    assert collect_parse_metrics(parsed, elapsed_seconds=1.0).service_startup_seconds == 12.5
+
+
+def test_collect_parse_metrics_reports_table_gating():
+    parsed = ParsedDocumentResult(
+        source="a.pdf",
+        filename="a.pdf",
+        engine="simple",
+        pages=[
+            ParsedPageResult(page_number=1, markdown_content="", metadata={"table_extraction": "skipped"}),
+            ParsedPageResult(
+                page_number=2,
+                markdown_content="",
+                metadata={"table_extraction": "run", "table_extraction_seconds": 0.25},
+            ),
+        ],
+    )
+
+    metrics = collect_parse_metrics(parsed, elapsed_seconds=1.0)
+
+    assert metrics.table_pages_skipped == 1
+    assert metrics.table_extraction_seconds == 0.25
+
+
+def test_collect_parse_metrics_aggregates_per_page_ocr():
+    parsed = ParsedDocumentResult(
+        source="a.pdf",
+        filename="a.pdf",
+        engine="simple",
+        pages=[
+            ParsedPageResult(page_number=1, markdown_content="digital"),
+            ParsedPageResult(
+                page_number=2,
+                markdown_content="scanned",
+                metadata={"ocr_applied": True, "ocr_text_chars": 7},
+            ),
+        ],
+    )
+
+    metrics = collect_parse_metrics(parsed, elapsed_seconds=1.0)
+
+    assert metrics.ocr_applied is True
+    assert metrics.ocr_pages == 1
+    assert metrics.ocr_text_chars == 7
+
+
+def test_request_timings_flow_into_metrics_and_summaries():
+    timings = {
+        "requests": 2,
+        "upload_seconds": 0.1,
+        "server_seconds": 3.0,
+        "download_seconds": 0.4,
+        "decode_seconds": 0.3,
+        "normalize_seconds": 0.2,
+        "server_reported_seconds": 2.8,
+    }
+    parsed = ParsedDocumentResult(
+        source="a.pdf",
+        filename="a.pdf",
+        engine="mineru",
+        pages=[],
+        metadata={"request_timings": timings},
+    )
+
+    metrics = collect_parse_metrics(parsed, elapsed_seconds=4.0)
+    summary = summarize_request_timings([metrics, ParseMetrics(elapsed_seconds=1.0)])
+
+    assert metrics.request_count == 2
+    assert metrics.server_seconds == 3.0
+    assert metrics.server_reported_seconds == 2.8
+    assert summary["requests"] == 2
+    assert summary["decode_seconds"] == 0.3
+    assert summary["server_reported_seconds"] == 2.8
+    assert summary["server_share"] == 0.75
+    assert summarize_request_timings([ParseMetrics()])["server_reported_seconds"] is None
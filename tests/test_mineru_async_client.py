@@ -0,0 +1,201 @@
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from langparse.engines.pdf.mineru import MinerUEngine
+from langparse.engines.pdf.mineru_async_client import AsyncMinerUClient
+from langparse.engines.pdf.mineru_mock import MockMinerUBehavior, MockMinerUServer
+
+
+class FakeMinerUHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self._reply(200, {"status": "ok"})
+
+    def do_POST(self):
+        length = int(self.headers["Content-Length"])
+        body = self.rfile.read(length)
+        with self.server.lock:
+            self.server.in_flight += 1
+            self.server.peak = max(self.server.peak, self.server.in_flight)
+        time.sleep(0.05)
+        with self.server.lock:
+            self.server.in_flight -= 1
+        if b"fail.pdf" in body:
+            self._reply(503, {"detail": "busy"})
+            return
+        self._reply(200, {"content_list": [{"page_idx": 0, "type": "text", "text": "Async page"}]})
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        return None
+
+
+@pytest.fixture
+def mineru_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeMinerUHandler)
+    server.lock = threading.Lock()
+    server.in_flight = 0
+    server.peak = 0
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_async_client_runs_requests_concurrently_within_limit(mineru_server, tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    client = AsyncMinerUClient(f"http://127.0.0.1:{mineru_server.server_address[1]}", timeout=5, max_concurrency=4)
+
+    async def run():
+        assert await client.health() == {"status": "ok"}
+        results = await asyncio.gather(*(client.parse_file(pdf_path, {}) for _ in range(12)))
+        await client.aclose()
+        return results
+
+    results = asyncio.run(run())
+
+    assert all(pages[0]["plain_text"] == "Async page" for pages in results)
+    assert 1 < mineru_server.peak <= 4
+
+
+def test_async_client_reports_http_errors(mineru_server, tmp_path):
+    pdf_path = tmp_path / "fail.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    client = AsyncMinerUClient(f"http://127.0.0.1:{mineru_server.server_address[1]}", timeout=5)
+
+    with pytest.raises(RuntimeError, match="HTTP 503"):
+        asyncio.run(client.parse_file(pdf_path, {}))
+
+
+def test_async_client_does_not_replay_dropped_parse_requests(tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    with MockMinerUServer(behavior=MockMinerUBehavior(disconnect_rate=1.0)) as server:
+        client = AsyncMinerUClient(server.base_url, timeout=5)
+
+        async def run():
+            assert await client.health() == {"status": "ok"}
+            await client.parse_file(pdf_path, {})
+
+        with pytest.raises(RuntimeError, match="MinerU API request failed"):
+            asyncio.run(run())
+        stats = server.stats()
+
+    assert stats["parse_requests"] == 1
+    assert stats["disconnects"] == 1
+
+
+def test_async_client_reads_zip_responses(tmp_path):
+    pdf_path = tmp_path / "report.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    behavior = MockMinerUBehavior(pages=3, page_chars=10, images_per_page=2, image_bytes=512)
+    with MockMinerUServer(behavior=behavior) as server:
+        client = AsyncMinerUClient(server.base_url, response_format_zip=True, image_dir=tmp_path / "images")
+        pages = asyncio.run(client.parse_file(pdf_path, {}))
+
+    assert [page["page_number"] for page in pages] == [1, 2, 3]
+    assert [len(page["images"]) for page in pages] == [2, 2, 2]
+    assert sorted(path.name for path in (tmp_path / "images" / "report").iterdir())[:2] == [
+        "page1_0.jpg",
+        "page1_1.jpg",
+    ]
+
+
+def test_engine_aprocess_document_uses_async_client(mineru_server, monkeypatch, tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    base_url = f"http://127.0.0.1:{mineru_server.server_address[1]}"
+    engine = MinerUEngine(device="cpu", api_url=base_url)
+
+    lease_threads = []
+    released = []
+
+    class StubManager:
+        def ensure_started(self):
+            return base_url
+
+        @contextmanager
+        def lease(self):
+            lease_threads.append(threading.get_ident())
+            try:
+                yield base_url
+            finally:
+                lease_threads.append(threading.get_ident())
+                released.append(base_url)
+
+        def close(self):
+            pass
+
+    monkeypatch.setattr(engine, "_create_service_manager", lambda: StubManager())
+
+    async def run():
+        return threading.get_ident(), await engine.aprocess_document(pdf_path)
+
+    loop_thread, parsed = asyncio.run(run())
+
+    assert parsed.engine == "mineru"
+    assert parsed.pages[0].plain_text == "Async page"
+    assert released == [base_url]
+    assert len(lease_threads) == 2
+    assert loop_thread not in lease_threads
+
+    [client] = engine._async_clients.values()
+    [connection] = client._idle
+    sock = connection.writer.get_extra_info("socket").dup()
+    engine.close()
+    try:
+        assert engine._async_clients == {}
+        assert client._idle == []
+        # The loop that opened the connection is gone; close() still ends it.
+        assert sock.recv(1) == b""
+    finally:
+        sock.close()
+
+
+def test_engine_aprocess_document_releases_lease_on_cancellation(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    engine = MinerUEngine(device="cpu", api_url="http://127.0.0.1:1")
+    released = []
+
+    class StubManager:
+        @contextmanager
+        def lease(self):
+            try:
+                yield "http://127.0.0.1:1"
+            finally:
+                released.append(True)
+
+    class HangingClient:
+        async def parse_file(self, *args, **kwargs):
+            await asyncio.sleep(60)
+
+    monkeypatch.setattr(engine, "_create_service_manager", lambda: StubManager())
+    monkeypatch.setattr(engine, "_get_async_client", lambda base_url: HangingClient())
+
+    async def run():
+        task = asyncio.create_task(engine.aprocess_document(pdf_path))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert released == [True]
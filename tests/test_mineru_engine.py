@@ -1,4 +1,6 @@
 import subprocess
+import sys
+import time
 from contextlib import contextmanager
 import json
 from pathlib import Path
@@ -6,7 +8,7 @@ from pathlib import Path
 import pytest
 
 from langparse.engines.pdf.mineru_client import MinerUClient
-from langparse.engines.pdf.mineru_service import MinerUServiceManager
+from langparse.engines.pdf.mineru_service import MinerUServiceManager, MinerUServicePool
 from langparse.engines.pdf.mineru import MinerUEngine
 from langparse.types import ParsedDocumentResult, ParsedPageResult
 
@@ -209,7 +211,7 @@ def test_remote_api_url_bypasses_local_service(monkeypatch, tmp_path):
 
     class StubManager:
         @contextmanager
-        def running_service(self):
+        def lease(self):
             captured["used_manager"] = True
             yield "http://remote.example:8000"
 
@@ -266,6 +268,218 @@ def test_service_manager_starts_local_service_when_api_url_missing(monkeypatch):
     assert health_attempts["stopped"] is True
 
 
+def test_wait_until_ready_fails_fast_with_output_when_process_exits():
+    manager = MinerUServiceManager(start_timeout=30.0)
+    process = subprocess.Popen(
+        [sys.executable, "-c", "import sys; print('loading models'); print('CUDA out of memory'); sys.exit(3)"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+
+    class DownClient:
+        def health(self):
+            raise RuntimeError("connection refused")
+
+    started = time.monotonic()
+    with pytest.raises(RuntimeError, match="exited with code 3") as excinfo:
+        manager._wait_until_ready(DownClient(), process)
+
+    assert time.monotonic() - started < 5
+    assert "CUDA out of memory" in str(excinfo.value)
+    assert manager.startup_seconds is None
+
+
+def test_wait_until_ready_checks_health_on_ready_line_and_records_startup():
+    manager = MinerUServiceManager(start_timeout=30.0)
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import time; time.sleep(0.3); print('INFO: Application startup complete.', flush=True); time.sleep(30)",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+    )
+    checks = []
+
+    class StubClient:
+        def health(self):
+            checks.append(time.monotonic())
+            if len(checks) < 4:
+                raise RuntimeError("not ready")
+            return {"status": "ok"}
+
+    try:
+        manager._wait_until_ready(StubClient(), process)
+    finally:
+        manager._stop_process(process)
+
+    assert manager.startup_seconds is not None
+    assert 0 < manager.startup_seconds < 5
+    assert len(checks) == 4
+
+
+def test_service_manager_keeps_local_service_running_until_close(monkeypatch):
+    manager = MinerUServiceManager(command="mineru-api", port=8123)
+    events = []
+
+    class StubProcess:
+        def poll(self):
+            return None
+
+    monkeypatch.setattr(manager, "_is_healthy", lambda client: False)
+    monkeypatch.setattr(
+        manager,
+        "_start_local_service",
+        lambda home_override=None: events.append("start") or StubProcess(),
+    )
+    monkeypatch.setattr(manager, "_wait_until_ready", lambda client, process=None: None)
+    monkeypatch.setattr(manager, "_stop_process", lambda process: events.append("stop"))
+
+    with manager:
+        assert manager.ensure_started() == "http://127.0.0.1:8123"
+        assert manager.ensure_started() == "http://127.0.0.1:8123"
+        with manager.running_service() as base_url:
+            assert base_url == "http://127.0.0.1:8123"
+        assert events == ["start"]
+
+    assert events == ["start", "stop"]
+    assert manager.started is False
+
+
+def test_engine_reuses_service_manager_across_files(monkeypatch, tmp_path):
+    engine = MinerUEngine(device="cpu")
+    events = []
+
+    class StubManager:
+        @contextmanager
+        def lease(self):
+            events.append("lease")
+            yield "http://127.0.0.1:8000"
+
+        def close(self):
+            events.append("close")
+
+    class StubClient:
+        def parse_file(self, file_path, runtime_config):
+            return [{"page_number": 1, "markdown": file_path.stem}]
+
+    monkeypatch.setattr(engine, "_create_service_manager", lambda: events.append("create") or StubManager())
+    monkeypatch.setattr(engine, "_create_client", lambda base_url: StubClient())
+
+    with engine:
+        for name in ("a.pdf", "b.pdf"):
+            pdf_path = tmp_path / name
+            pdf_path.write_bytes(b"%PDF-1.4")
+            engine.process_document(pdf_path)
+
+    assert events == ["create", "lease", "lease", "close"]
+
+
+class StubPoolManager:
+    def __init__(self, port):
+        self.port = port
+        self.alive = True
+        self.unhealthy = False
+        self.closed = False
+        self.request_timeout = 1.0
+
+    @property
+    def process_alive(self):
+        return self.alive
+
+    def ensure_started(self):
+        return f"http://127.0.0.1:{self.port}"
+
+    def close(self):
+        self.closed = True
+
+    def is_healthy(self):
+        return self.alive and not self.unhealthy
+
+
+def make_stub_pool(monkeypatch, size):
+    pool = MinerUServicePool(size, health_check_interval=3600)
+    managers = []
+
+    def create_manager():
+        manager = StubPoolManager(9000 + len(managers))
+        managers.append(manager)
+        return manager
+
+    monkeypatch.setattr(pool, "_create_manager", create_manager)
+    return pool, managers
+
+
+def test_service_pool_routes_to_least_outstanding_instance(monkeypatch):
+    pool, managers = make_stub_pool(monkeypatch, 2)
+
+    with pool.lease() as first:
+        with pool.lease() as second:
+            assert {first, second} == {"http://127.0.0.1:9000", "http://127.0.0.1:9001"}
+        with pool.lease() as third:
+            assert third == second
+
+    pool.close()
+    assert all(manager.closed for manager in managers)
+
+
+def test_service_pool_releases_lease_on_cancellation(monkeypatch):
+    pool, managers = make_stub_pool(monkeypatch, 2)
+
+    with pytest.raises(KeyboardInterrupt):
+        with pool.lease():
+            raise KeyboardInterrupt
+
+    assert [member.outstanding for member in pool._members] == [0, 0]
+
+
+def test_service_pool_replaces_crashed_instance(monkeypatch):
+    pool, managers = make_stub_pool(monkeypatch, 1)
+    assert pool.ensure_started() == "http://127.0.0.1:9000"
+
+    managers[0].alive = False
+    with pool.lease() as base_url:
+        assert base_url == "http://127.0.0.1:9001"
+
+    assert managers[0].closed is True
+    assert pool.base_urls == ["http://127.0.0.1:9001"]
+
+
+def test_service_pool_leases_replacement_of_unhealthy_running_instance(monkeypatch):
+    pool, managers = make_stub_pool(monkeypatch, 1)
+    pool.ensure_started()
+    pool.health_check_interval = 0.0
+
+    managers[0].unhealthy = True
+    with pool.lease() as base_url:
+        assert base_url == "http://127.0.0.1:9001"
+
+    assert managers[0].closed is True
+    assert pool.base_urls == ["http://127.0.0.1:9001"]
+
+
+def test_engine_uses_service_pool_when_api_workers_configured():
+    engine = MinerUEngine(api_workers=3)
+
+    manager = engine._create_service_manager()
+
+    assert isinstance(manager, MinerUServicePool)
+    assert manager.size == 3
+    assert isinstance(MinerUEngine(api_workers=3, api_url="http://remote")._create_service_manager(), MinerUServiceManager)
+
+
+def test_service_manager_picks_free_port_when_port_is_zero(monkeypatch):
+    manager = MinerUServiceManager(port=0)
+    monkeypatch.setattr(manager, "find_free_port", lambda: 8765)
+    monkeypatch.setattr(manager, "_start_local_service", lambda home_override=None: None)
+    monkeypatch.setattr(manager, "_wait_until_ready", lambda client, process=None: None)
+    monkeypatch.setattr(manager, "_stop_process", lambda process: None)
+
+    assert manager.ensure_started() == "http://127.0.0.1:8765"
+    manager.close()
+
+
 def test_service_manager_uses_local_model_dir_via_generated_mineru_home(tmp_path):
     model_dir = tmp_path / "models"
     model_dir.mkdir()
@@ -385,3 +599,226 @@ def test_client_normalizes_content_list_response(tmp_path):
     assert [page["page_number"] for page in pages] == [1, 2]
     assert pages[0]["plain_text"] == "Title"
     assert pages[1]["elements"][0]["kind"] == "text"
+
+
+def test_multipart_body_streams_file_in_blocks(tmp_path):
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_bytes = b"%PDF-1.4" + bytes(range(256)) * 40
+    pdf_path.write_bytes(pdf_bytes)
+    client = MinerUClient("http://mineru.example")
+
+    body, content_type = client._encode_multipart_form({"return_md": "true"}, pdf_path)
+    body.block_size = 1024
+    blocks = list(body)
+    boundary = body.boundary
+
+    assert content_type == f"multipart/form-data; boundary={boundary}"
+    assert max(len(block) for block in blocks) <= 1024
+    assert b"".join(blocks) == b"\r\n".join(
+        [
+            f"--{boundary}".encode(),
+            b'Content-Disposition: form-data; name="return_md"',
+            b"",
+            b"true",
+            f"--{boundary}".encode(),
+            b'Content-Disposition: form-data; name="files"; filename="sample.pdf"',
+            b"Content-Type: application/pdf",
+            b"",
+            pdf_bytes,
+            f"--{boundary}--".encode(),
+            b"",
+        ]
+    )
+    assert body.content_length == len(b"".join(blocks))
+    assert b"".join(body) == b"".join(blocks)
+
+
+def test_split_page_range_covers_all_pages():
+    from langparse.engines.pdf.page_ranges import split_page_range
+
+    assert split_page_range(5, 2) == [(0, 1), (2, 3), (4, 4)]
+    assert split_page_range(2, 5) == [(0, 1)]
+
+
+def test_process_document_shards_large_pdf_and_merges_pages(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "large.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    engine = MinerUEngine(device="cpu", shard_pages=2, shard_workers=3)
+    requested_ranges = []
+
+    class StubManager:
+        @contextmanager
+        def lease(self):
+            yield "http://127.0.0.1:8000"
+
+    class ShardClient(MinerUClient):
+        def _request_json(self, method, path, fields=None, file_path=None):
+            start, end = int(fields["start_page_id"]), int(fields["end_page_id"])
+            requested_ranges.append((start, end))
+            return {
+                "content_list": [
+                    {"page_idx": index, "type": "text", "text": f"Page {start + index + 1}"}
+                    for index in range(end - start + 1)
+                ]
+            }
+
+    monkeypatch.setattr("langparse.engines.pdf.mineru.count_pdf_pages", lambda path: 5)
+    monkeypatch.setattr(engine, "_create_service_manager", lambda: StubManager())
+    monkeypatch.setattr(engine, "_create_client", lambda base_url: ShardClient(base_url))
+
+    parsed = engine.process_document(pdf_path)
+
+    assert sorted(requested_ranges) == [(0, 1), (2, 3), (4, 4)]
+    assert [page.page_number for page in parsed.pages] == [1, 2, 3, 4, 5]
+    assert [page.plain_text for page in parsed.pages] == [f"Page {n}" for n in range(1, 6)]
+    assert parsed.metadata["shard_count"] == 3
+
+
+def test_process_document_requests_only_selected_pages(monkeypatch, tmp_path):
+    pdf_path = tmp_path / "large.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+    engine = MinerUEngine(device="cpu", shard_pages=2)
+    requested = []
+
+    class StubManager:
+        @contextmanager
+        def lease(self):
+            yield "http://127.0.0.1:8000"
+
+    class RangeClient(MinerUClient):
+        def _request_json(self, method, path, fields=None, file_path=None):
+            start, end = int(fields["start_page_id"]), int(fields["end_page_id"])
+            requested.append((start, end))
+            assert "pages" not in fields and "max_pages" not in fields
+            return {
+                "content_list": [
+                    {"page_idx": index, "type": "text", "text": f"Page {start + index + 1}"}
+                    for index in range(end - start + 1)
+                ]
+            }
+
+    monkeypatch.setattr("langparse.engines.pdf.mineru.count_pdf_pages", lambda path: 40)
+    monkeypatch.setattr(engine, "_create_service_manager", lambda: StubManager())
+    monkeypatch.setattr(engine, "_create_client", lambda base_url: RangeClient(base_url))
+
+    parsed = engine.process_document(pdf_path, pages="1-3,20")
+    first_page = engine.process_document(pdf_path, max_pages=1)
+
+    assert sorted(requested) == [(0, 0), (0, 1), (2, 2), (19, 19)]
+    assert [page.page_number for page in parsed.pages] == [1, 2, 3, 20]
+    assert [page.plain_text for page in first_page.pages] == ["Page 1"]
+
+
+def test_plan_packs_respects_budgets_and_unique_stems(monkeypatch, tmp_path):
+    page_counts = {"a": 1, "b": 2, "c": 3, "d": 1, "e": None}
+    paths = []
+    for name in ("a", "b", "c", "d", "e"):
+        path = tmp_path / name / f"{name if name != 'd' else 'a'}.pdf"
+        path.parent.mkdir()
+        path.write_bytes(b"%PDF-1.4")
+        paths.append(path)
+    monkeypatch.setattr(
+        "langparse.engines.pdf.mineru.count_pdf_pages", lambda path: page_counts[path.parent.name]
+    )
+
+    packs = MinerUEngine(pack_max_files=3, pack_max_pages=5).plan_packs(paths)
+
+    assert [[path.parent.name for path in pack] for pack in packs] == [["a", "b"], ["c", "d"], ["e"]]
+
+
+def test_process_documents_splits_one_multi_file_request(monkeypatch, tmp_path):
+    paths = []
+    for name in ("invoice-1", "invoice-2"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(b"%PDF-1.4")
+        paths.append(path)
+    engine = MinerUEngine(device="cpu")
+    requests = []
+
+    class StubManager:
+        @contextmanager
+        def lease(self):
+            yield "http://127.0.0.1:8000"
+
+    class MultiFileClient(MinerUClient):
+        def _request_json(self, method, path, fields=None, file_path=None, file_paths=None):
+            requests.append([file.name for file in file_paths])
+            return {
+                "results": {
+                    file.stem: {
+                        "md_content": f"# {file.stem}",
+                        "content_list": json.dumps([{"page_idx": 0, "type": "text", "text": file.stem}]),
+                    }
+                    for file in reversed(file_paths)
+                }
+            }
+
+    monkeypatch.setattr(engine, "_create_service_manager", lambda: StubManager())
+    monkeypatch.setattr(engine, "_create_client", lambda base_url: MultiFileClient(base_url))
+
+    parsed = engine.process_documents(paths)
+
+    assert requests == [["invoice-1.pdf", "invoice-2.pdf"]]
+    assert [result.filename for result in parsed] == ["invoice-1.pdf", "invoice-2.pdf"]
+    assert [result.pages[0].plain_text for result in parsed] == ["invoice-1", "invoice-2"]
+    assert parsed[0].metadata["packed_files"] == 2
+    with pytest.raises(RuntimeError, match="no result for other.pdf"):
+        MinerUClient("http://mineru.example")._split_file_results({"results": {}}, [Path("other.pdf")])
+
+
+def test_client_normalization_does_not_duplicate_document_markdown():
+    client = MinerUClient("http://mineru.example")
+    response = {
+        "markdown": "# Scanned report",
+        "content_list": [
+            {"page_idx": 0, "type": "image", "bbox": [0, 0, 10, 10]},
+            {"page_idx": 1, "type": "image", "bbox": [0, 0, 10, 10]},
+            {"page_idx": 2, "type": "image", "img_path": "images/p3.jpg", "image_caption": ["Figure 3"]},
+        ],
+    }
+
+    pages = client._normalize_parse_response(response)
+
+    assert [page["markdown"] for page in pages] == ["", "", "![Figure 3](images/p3.jpg)"]
+    assert all(page["engine_specific"] == {} for page in pages)
+
+    pages = client._normalize_parse_response({**response, "content_list": response["content_list"][:2]})
+
+    assert [page["markdown"] for page in pages] == ["# Scanned report", ""]
+
+
+def test_client_retains_raw_content_list_only_when_requested():
+    response = {"content_list": [{"page_idx": 0, "type": "text", "text": "Title"}]}
+
+    pages = MinerUClient("http://mineru.example", retain_raw=True)._normalize_parse_response(response)
+
+    assert pages[0]["engine_specific"]["content_list"] == response["content_list"]
+    assert pages[0]["engine_specific"]["retained_bytes"] > 0
+
+
+def test_service_manager_restarts_process_that_exited(monkeypatch):
+    manager = MinerUServiceManager(port=8123)
+    processes = []
+
+    class StubProcess:
+        def __init__(self):
+            self.exit_code = None
+
+        def poll(self):
+            return self.exit_code
+
+    def start_local_service(home_override=None):
+        processes.append(StubProcess())
+        return processes[-1]
+
+    monkeypatch.setattr(manager, "_is_healthy", lambda client: False)
+    monkeypatch.setattr(manager, "_start_local_service", start_local_service)
+    monkeypatch.setattr(manager, "_wait_until_ready", lambda client, process=None: None)
+    monkeypatch.setattr(manager, "_stop_process", lambda process: None)
+
+    manager.ensure_started()
+    processes[0].exit_code = 1
+    manager.ensure_started()
+    manager.close()
+
+    assert len(processes) == 2
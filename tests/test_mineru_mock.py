@@ -0,0 +1,191 @@
+import json
+import random
+import shlex
+import sys
+from pathlib import Path
+
+import pytest
+
+from langparse.cli import main
+from langparse.engines.pdf.http_pool import HTTPConnectionPool
+from langparse.engines.pdf.mineru import MinerUEngine
+from langparse.engines.pdf.mineru_client import (
+    REQUEST_TIMING_PHASES,
+    MinerUClient,
+    server_reported_seconds,
+)
+from langparse.engines.pdf.mineru_mock import MockMinerUBehavior, MockMinerUServer
+from langparse.engines.pdf.mineru_service import MinerUServiceManager
+
+
+def _sample_pdf(tmp_path: Path) -> Path:
+    pdf_path = tmp_path / "sample.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4 mock")
+    return pdf_path
+
+
+def test_mock_server_honours_page_range_and_reuses_connections(tmp_path):
+    behavior = MockMinerUBehavior(pages=10, page_chars=50)
+    with MockMinerUServer(behavior=behavior) as server, HTTPConnectionPool() as pool:
+        client = MinerUClient(server.base_url, connection_pool=pool)
+        assert client.health() == {"status": "ok"}
+        pages = client.parse_file(_sample_pdf(tmp_path), {"device": "cpu"}, page_range=(4, 6))
+        client.parse_file(_sample_pdf(tmp_path), {"device": "cpu"})
+        stats = server.stats()
+
+    assert [page["page_number"] for page in pages] == [5, 6, 7]
+    assert pages[0]["markdown"].startswith("Mock page 5.")
+    assert stats["parse_requests"] == 2
+    assert stats["connections"] == 1
+
+
+def test_mock_server_answers_multi_file_requests_per_file(tmp_path):
+    paths = []
+    for name in ("one", "two", "three"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(b"%PDF-1.4 mock")
+        paths.append(path)
+    with MockMinerUServer(behavior=MockMinerUBehavior(pages=2, page_chars=10)) as server:
+        file_pages = MinerUClient(server.base_url).parse_files(paths, {"device": "cpu"})
+        stats = server.stats()
+
+    assert [[page["page_number"] for page in pages] for pages in file_pages] == [[1, 2]] * 3
+    assert stats["parse_requests"] == 1
+
+
+def test_zip_responses_stream_members_and_extract_images(tmp_path):
+    paths = []
+    for name in ("one", "two"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(b"%PDF-1.4 mock")
+        paths.append(path)
+    behavior = MockMinerUBehavior(pages=2, page_chars=10, images_per_page=1, image_bytes=2048, seed=3)
+    with MockMinerUServer(behavior=behavior) as server:
+        client = MinerUClient(server.base_url, response_format_zip=True, image_dir=tmp_path / "images")
+        file_pages = client.parse_files(paths, {"device": "cpu"})
+        ranged = client.parse_file(paths[0], {"device": "cpu"}, page_range=(1, 1))
+        json_pages = MinerUClient(server.base_url, image_dir=tmp_path / "json-images").parse_file(
+            paths[0], {"device": "cpu"}
+        )
+
+    first_page = file_pages[1][0]
+    image = first_page["images"][0]
+    assert [[page["page_number"] for page in pages] for pages in file_pages] == [[1, 2], [1, 2]]
+    assert image["path"] == str(tmp_path / "images" / "two" / "page1_0.jpg")
+    assert image["caption"] == "Figure 1.0"
+    assert Path(image["path"]).stat().st_size == 2048
+    assert f"![Figure 1.0]({image['path']})" in first_page["markdown"]
+    assert ranged[0]["page_number"] == 2
+    assert Path(json_pages[0]["images"][0]["path"]).read_bytes() == Path(image["path"]).read_bytes()
+
+
+def test_zip_mode_accepts_json_from_services_without_zip_support(tmp_path):
+    with MockMinerUServer(behavior=MockMinerUBehavior(pages=1, page_chars=10)) as server:
+        client = MinerUClient(server.base_url, response_format_zip=True)
+        fields = client._build_form_fields({})
+        # A service that ignores response_format_zip answers with JSON.
+        client._build_form_fields = lambda runtime_config, page_range=None: {
+            **fields,
+            "response_format_zip": "false",
+        }
+        pages = client.parse_file(_sample_pdf(tmp_path), {"device": "cpu"})
+
+    assert fields["response_format_zip"] == "true"
+    assert pages[0]["markdown"].startswith("Mock page 1.")
+
+
+def test_request_timings_cover_each_phase_and_server_reports(tmp_path, monkeypatch):
+    paths = []
+    for name in ("one", "two"):
+        path = tmp_path / f"{name}.pdf"
+        path.write_bytes(b"%PDF-1.4 mock")
+        paths.append(path)
+    monkeypatch.setattr("langparse.engines.pdf.mineru.count_pdf_pages", lambda path: 4)
+    behavior = MockMinerUBehavior(latency_mean=0.02, pages=4, page_chars=10)
+    with MockMinerUServer(behavior=behavior) as server:
+        with MinerUEngine(device="cpu", api_url=server.base_url, shard_pages=2) as engine:
+            sharded = engine.process_document(paths[0])
+        packed = MinerUClient(server.base_url).parse_files(paths, {"device": "cpu"})
+
+    timings = sharded.metadata["request_timings"]
+    assert timings["requests"] == 2
+    assert timings["server_seconds"] >= 0.04
+    assert 0.04 <= timings["server_reported_seconds"] <= timings["server_seconds"]
+    assert all(timings[phase] >= 0 for phase in REQUEST_TIMING_PHASES)
+    assert [pages[0]["timings"]["requests"] for pages in packed] == [1, 0]
+    assert packed[0][0]["timings"]["server_seconds"] == packed[1][0]["timings"]["server_seconds"]
+    assert server_reported_seconds({"server-timing": "queue;dur=50, infer;dur=150"}) == 0.2
+    assert server_reported_seconds({"x-process-time": "1.5"}) == 1.5
+    assert server_reported_seconds({}) is None
+
+
+def test_mock_server_injects_errors(tmp_path):
+    behavior = MockMinerUBehavior(error_rate=1.0, error_status=503)
+    with MockMinerUServer(behavior=behavior) as server, HTTPConnectionPool() as pool:
+        client = MinerUClient(server.base_url, connection_pool=pool)
+        with pytest.raises(RuntimeError, match="HTTP 503"):
+            client.parse_file(_sample_pdf(tmp_path), {"device": "cpu"})
+        assert server.stats()["errors"] == 1
+
+
+def test_mock_latency_distributions_are_non_negative():
+    rng = random.Random(7)
+    for latency in ("constant", "uniform", "exponential", "lognormal"):
+        behavior = MockMinerUBehavior(latency=latency, latency_mean=0.1, latency_spread=0.5, page_latency=0.01)
+        samples = [behavior.sample_latency(rng, page_count=2) for _ in range(200)]
+        assert min(samples) >= 0.02
+
+    with pytest.raises(ValueError, match="latency distribution"):
+        MockMinerUBehavior(latency="pareto")
+
+
+def test_service_manager_starts_mock_as_mineru_api_command():
+    command = f"{shlex.quote(sys.executable)} -m langparse.engines.pdf.mineru_mock"
+    with MinerUServiceManager(command=command, port=0, start_timeout=20.0) as manager:
+        base_url = manager.ensure_started()
+        assert MinerUClient(base_url).health() == {"status": "ok"}
+
+    assert manager.startup_seconds is not None
+
+
+def test_mock_load_test_is_not_capped_by_the_connection_pool(tmp_path):
+    from langparse.cli import run_mock_load_test
+
+    report = run_mock_load_test(
+        [str(_sample_pdf(tmp_path))],
+        MockMinerUBehavior(latency_mean=0.3),
+        repeat=16,
+        max_workers=16,
+        output_dir=str(tmp_path / "out"),
+    )
+
+    assert report["success_count"] == 16
+    assert report["server"]["max_in_flight"] > 8
+
+
+def test_cli_mock_mineru_load_test_reports_throughput(tmp_path, capsys):
+    pdf_path = _sample_pdf(tmp_path)
+
+    exit_code = main(
+        [
+            "mock-mineru",
+            "--load-test",
+            str(pdf_path),
+            "--repeat",
+            "6",
+            "--max-workers",
+            "2",
+            "--pages",
+            "3",
+            "--output-dir",
+            str(tmp_path / "out"),
+        ]
+    )
+    report = json.loads(capsys.readouterr().out)
+
+    assert exit_code == 0
+    assert report["documents"] == 6
+    assert report["success_count"] == 6
+    assert report["total_pages"] == 18
+    assert report["server"]["parse_requests"] == 6
+    assert report["server"]["connections"] <= 2
@@ -0,0 +1,87 @@
+from langparse.core.page_cache import PageResultCache
+from langparse.engines.pdf.simple import SimplePDFEngine
+from langparse.metrics import collect_parse_metrics
+from langparse.services.parse_service import ParseService
+
+
+def test_revised_pdf_only_reextracts_changed_pages(make_text_pdf, tmp_path, monkeypatch):
+    cache = PageResultCache(tmp_path / "pages")
+    engine = SimplePDFEngine(page_cache=cache)
+    extracted = []
+    original_extract = engine._extract_page
+    monkeypatch.setattr(
+        engine,
+        "_extract_page",
+        lambda page, page_number: extracted.append(page_number) or original_extract(page, page_number),
+    )
+
+    original = make_text_pdf(["Clause one", "Clause two", "Clause three"], name="v1.pdf")
+    revised = make_text_pdf(["Clause one", "Clause two amended", "Clause three"], name="v2.pdf")
+    first = list(engine.process(original))
+    extracted.clear()
+    second = list(engine.process(revised))
+
+    assert extracted == [2]
+    assert [page.metadata["page_cache"] for page in first] == ["miss", "miss", "miss"]
+    assert [page.metadata["page_cache"] for page in second] == ["hit", "miss", "hit"]
+    assert [page.plain_text for page in second] == ["Clause one", "Clause two amended", "Clause three"]
+    assert [page.page_number for page in second] == [1, 2, 3]
+    assert cache.stats()["hits"] == 2
+
+
+def test_moved_pages_hit_cache_with_new_page_numbers(make_text_pdf, tmp_path):
+    engine = SimplePDFEngine(page_cache_dir=str(tmp_path / "pages"))
+    list(engine.process(make_text_pdf(["Alpha", "Beta"], name="a.pdf")))
+
+    pages = list(engine.process(make_text_pdf(["Cover", "Alpha", "Beta"], name="b.pdf")))
+
+    assert [(page.page_number, page.metadata["page_cache"]) for page in pages] == [
+        (1, "miss"),
+        (2, "hit"),
+        (3, "hit"),
+    ]
+
+
+def test_page_cache_hits_are_reported_in_parse_metrics(make_text_pdf, tmp_path):
+    engine = SimplePDFEngine(page_cache=PageResultCache(tmp_path / "pages"))
+    service = ParseService()
+    service.parse_result(make_text_pdf(["One", "Two"], name="a.pdf"), engine_name="simple", engine=engine)
+    parsed = service.parse_result(make_text_pdf(["One", "Changed"], name="b.pdf"), engine_name="simple", engine=engine)
+
+    metrics = collect_parse_metrics(parsed, elapsed_seconds=1.0)
+
+    assert metrics.page_cache_hits == 1
+    assert metrics.page_cache_misses == 1
+    assert metrics.page_cache_hit_rate == 0.5
+
+
+def test_page_cache_hits_do_not_replay_extraction_timings(make_text_pdf, tmp_path):
+    engine = SimplePDFEngine(page_cache=PageResultCache(tmp_path / "pages"), force_table_extraction=True)
+    service = ParseService()
+    pdf_path = make_text_pdf(["One", "Two"])
+    first = service.parse_result(pdf_path, engine_name="simple", engine=engine)
+    cached = service.parse_result(pdf_path, engine_name="simple", engine=engine)
+
+    assert all("table_extraction_seconds" in page.metadata for page in first.pages)
+    assert [page.metadata["page_cache"] for page in cached.pages] == ["hit", "hit"]
+    assert not any("table_extraction_seconds" in page.metadata for page in cached.pages)
+    assert collect_parse_metrics(cached, elapsed_seconds=1.0).table_extraction_seconds == 0.0
+
+
+def test_page_cache_keys_change_with_extraction_version(tmp_path):
+    cache = PageResultCache(tmp_path / "pages")
+    upgraded = PageResultCache(tmp_path / "pages", version="langparse=999.0;pdfplumber=0.11.0")
+
+    assert "langparse=" in cache.version and "pdfplumber=" in cache.version
+    assert cache.key_for("simple", "abc") == PageResultCache(tmp_path / "pages").key_for("simple", "abc")
+    assert upgraded.key_for("simple", "abc") != cache.key_for("simple", "abc")
+
+
+def test_page_cache_evicts_least_recently_used_pages(make_text_pdf, tmp_path):
+    cache = PageResultCache(tmp_path / "pages", max_bytes=1)
+    engine = SimplePDFEngine(page_cache=cache)
+
+    list(engine.process(make_text_pdf(["One", "Two"])))
+
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["evictions"] == 2
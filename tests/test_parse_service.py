@@ -1,10 +1,12 @@
+import io
+import json
 from types import SimpleNamespace
 
 import pytest
 
 from langparse.core.engine import PageResult
 from langparse.metrics import collect_parse_metrics
-from langparse.services.parse_service import ParseService
+from langparse.services.parse_service import ENGINE_MAP, ParseService
 from langparse.types import ParsedDocumentResult, ParsedPageResult
 
 
@@ -137,3 +139,120 @@ def test_collect_parse_metrics_counts_pages_tables_and_output_size():
     assert metrics.image_count == 1
     assert metrics.ocr_applied is True
     assert metrics.ocr_text_chars == 12
+
+
+def test_parse_result_reuses_engine_until_close(monkeypatch, tmp_path):
+    created = []
+
+    class ClosableEngine:
+        def __init__(self, **kwargs):
+            self.closed = False
+            created.append(self)
+
+        def process_document(self, file_path, **kwargs):
+            return ParsedDocumentResult(
+                source=str(file_path),
+                filename=file_path.name,
+                engine="simple",
+                pages=[ParsedPageResult(page_number=1, markdown_content="Hello")],
+                markdown_content="Hello",
+            )
+
+        def close(self):
+            self.closed = True
+
+    monkeypatch.setitem(__import__("langparse.services.parse_service", fromlist=["ENGINE_MAP"]).ENGINE_MAP, "simple", ClosableEngine)
+    a = tmp_path / "a.pdf"
+    b = tmp_path / "b.pdf"
+    a.write_text("x")
+    b.write_text("y")
+
+    with ParseService() as service:
+        service.parse_result(a, engine_name="simple")
+        service.parse_result(b, engine_name="simple")
+        assert len(created) == 1
+
+    assert created[0].closed is True
+
+
+def test_stream_output_writes_each_page_before_the_next_is_parsed(tmp_path):
+    sink = io.StringIO()
+    written_before_page = []
+
+    class LazyEngine:
+        def process(self, file_path, **kwargs):
+            for number in (1, 2, 3):
+                written_before_page.append(sink.getvalue())
+                yield PageResult(
+                    page_number=number,
+                    markdown_content=f"Page {number}",
+                    tables=[{"rows": [["A"]]}] if number == 2 else [],
+                )
+
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("x")
+    engine = LazyEngine()
+
+    service = ParseService()
+    metrics = service.stream_output(pdf, sink, engine=engine)
+    expected = service.parse_result(pdf, engine=engine)
+
+    assert written_before_page[:3] == ["", "Page 1", "Page 1\nPage 2"]
+    assert sink.getvalue() == expected.markdown_content
+    assert metrics.page_count == 3
+    assert metrics.table_count == 1
+    assert metrics.output_bytes == collect_parse_metrics(expected, 1).output_bytes
+
+
+def test_stream_output_writes_jsonl_pages_and_document_metadata(tmp_path):
+    class FastPathEngine:
+        def process_document(self, file_path, **kwargs):
+            return ParsedDocumentResult(
+                source=str(file_path),
+                filename=file_path.name,
+                engine="simple",
+                pages=[
+                    ParsedPageResult(page_number=1, markdown_content="One"),
+                    ParsedPageResult(page_number=2, markdown_content="Two"),
+                ],
+                markdown_content="One\nTwo",
+                metadata={"ocr_applied": True},
+            )
+
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("x")
+    output = tmp_path / "out" / "a.jsonl"
+
+    metrics = ParseService().stream_output(pdf, output, fmt="jsonl", engine=FastPathEngine())
+
+    lines = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+    assert [line["markdown_content"] for line in lines] == ["One", "Two"]
+    assert metrics.page_count == 2
+    assert metrics.ocr_applied is True
+    with pytest.raises(ValueError, match="Unsupported streaming format"):
+        ParseService().stream_output(pdf, io.StringIO(), fmt="json", engine=FastPathEngine())
+
+
+def test_page_selection_reaches_engine_without_creating_new_engines(monkeypatch, tmp_path):
+    created = []
+
+    class SelectingEngine:
+        def __init__(self, **kwargs):
+            created.append(kwargs)
+
+        def process(self, file_path, pages=None, max_pages=None, **kwargs):
+            for number in range(1, (max_pages or 5) + 1):
+                yield PageResult(page_number=number, markdown_content=f"Page {number}")
+
+    monkeypatch.setitem(ENGINE_MAP, "simple", SelectingEngine)
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("x")
+
+    service = ParseService()
+    full = service.parse_result(pdf)
+    triage = service.parse_result(pdf, max_pages=3)
+
+    assert len(full.pages) == 5
+    assert len(triage.pages) == 3
+    assert len(created) == 1
+    assert "max_pages" not in created[0]
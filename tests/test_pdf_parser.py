@@ -1,11 +1,12 @@
 import sys
 import types
 from unittest.mock import patch
+import pytest
 
 from langparse.core.engine import PageResult
 from langparse.engines.pdf.simple import SimplePDFEngine
 from langparse.parsers.pdf_parser import PDFParser
-from langparse.types import Document, ParsedElement
+from langparse.types import Document, ParsedDocumentResult, ParsedElement, ParsedPageResult
 from langparse.config import settings
 
 
@@ -204,3 +205,324 @@ def test_pdf_parser_merges_config_and_runtime_extra_options(monkeypatch):
         "cache_dir": "/cache",
         "workers": 4,
     }
+
+
+def test_simple_engine_parallel_mode_yields_pages_in_order(make_text_pdf):
+    pdf_path = make_text_pdf([f"Page body {index}" for index in range(1, 24)])
+    sequential = list(SimplePDFEngine().process(pdf_path))
+
+    engine = SimplePDFEngine(workers=2, chunk_pages=3, parallel_min_pages=10, reorder_window=2)
+    try:
+        parallel = list(engine.process(pdf_path))
+    finally:
+        engine.close()
+
+    assert [page.page_number for page in parallel] == list(range(1, 24))
+    assert [page.plain_text for page in parallel] == [page.plain_text for page in sequential]
+
+
+def test_simple_engine_parallel_mode_skips_small_documents(make_text_pdf, monkeypatch):
+    engine = SimplePDFEngine(workers=4, parallel_min_pages=10)
+    monkeypatch.setattr(engine, "_get_page_pool", lambda: pytest.fail("small PDFs must not start workers"))
+
+    pages = list(engine.process(make_text_pdf(["Only page"])))
+
+    assert [page.plain_text for page in pages] == ["Only page"]
+
+
+def test_simple_engine_creates_one_page_pool_under_concurrent_calls(monkeypatch):
+    import threading
+    import time
+
+    import langparse.engines.pdf.simple as simple_module
+
+    created = []
+
+    class SlowPool:
+        def __init__(self, **kwargs):
+            time.sleep(0.05)
+            created.append(self)
+
+        def shutdown(self, cancel_futures=False):
+            pass
+
+    monkeypatch.setattr(simple_module, "ProcessPoolExecutor", SlowPool)
+    engine = SimplePDFEngine(workers=4)
+    pools = []
+    threads = [threading.Thread(target=lambda: pools.append(engine._get_page_pool())) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(pool is created[0] for pool in pools)
+
+
+def test_simple_engine_falls_back_to_pdf_pages_without_lazy_page_support(make_text_pdf, monkeypatch):
+    import langparse.engines.pdf.simple as simple_module
+
+    assert simple_module._lazy_page_class() is not None
+    monkeypatch.setattr(simple_module, "_lazy_page_class", lambda: None)
+    engine = SimplePDFEngine()
+    pdf_path = make_text_pdf(["One", "Two", "Three"])
+
+    assert [page.plain_text for page in engine.process(pdf_path)] == ["One", "Two", "Three"]
+    assert [(page.page_number, page.plain_text) for page in engine.process(pdf_path, pages="1,3")] == [
+        (1, "One"),
+        (3, "Three"),
+    ]
+
+
+def test_select_page_ranges_parses_specs_and_limits():
+    from langparse.engines.pdf.page_ranges import select_page_ranges
+
+    assert select_page_ranges() is None
+    assert select_page_ranges("1-3,7,10-", page_count=12) == [(0, 2), (6, 6), (9, 11)]
+    assert select_page_ranges([5, 2, (3, 4)], page_count=3) == [(1, 2)]
+    assert select_page_ranges("2-9", max_pages=3) == [(1, 3)]
+    assert select_page_ranges(max_pages=3, page_count=2) == [(0, 1)]
+    with pytest.raises(ValueError):
+        select_page_ranges("0-2")
+
+
+def test_simple_engine_extracts_only_selected_pages(make_text_pdf, monkeypatch):
+    pdf_path = make_text_pdf([f"Page body {index}" for index in range(1, 11)])
+    engine = SimplePDFEngine()
+    extracted = []
+    extract_page = engine._extract_page
+
+    def record(page, page_number):
+        extracted.append(page_number)
+        return extract_page(page, page_number)
+
+    monkeypatch.setattr(engine, "_extract_page", record)
+
+    pages = list(engine.process(pdf_path, pages="2-3,9"))
+    first_pages = list(engine.process(pdf_path, max_pages=2))
+
+    assert [page.plain_text for page in pages] == ["Page body 2", "Page body 3", "Page body 9"]
+    assert [page.page_number for page in first_pages] == [1, 2]
+    assert extracted == [2, 3, 9, 1, 2]
+
+
+def test_simple_engine_parallel_mode_honours_page_selection(make_text_pdf):
+    pdf_path = make_text_pdf([f"Page body {index}" for index in range(1, 24)])
+    engine = SimplePDFEngine(workers=2, chunk_pages=3, parallel_min_pages=5, pages="2-4,10-")
+    try:
+        pages = list(engine.process(pdf_path))
+    finally:
+        engine.close()
+
+    assert [page.page_number for page in pages] == [2, 3, 4, *range(10, 24)]
+
+
+def test_simple_engine_peak_memory_stays_flat_as_page_count_grows(make_text_pdf):
+    import tracemalloc
+
+    def peak_bytes(page_count):
+        pdf_path = make_text_pdf(
+            [f"Line of text number {index} " * 8 for index in range(page_count)],
+            name=f"pages-{page_count}.pdf",
+        )
+        tracemalloc.start()
+        try:
+            for _ in SimplePDFEngine().process(pdf_path):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    peak_bytes(1)  # warm up imports and font caches
+    small, large = peak_bytes(10), peak_bytes(50)
+
+    # Retaining each page's layout costs ~350 KiB/page on this input; released pages cost only
+    # pdfminer's per-object bookkeeping.
+    assert (large - small) / 40 < 16 * 1024
+
+
+TABLE_PAGE = (
+    b"72 600 200 100 re S 172 600 m 172 700 l S 72 650 m 272 650 l S "
+    b"BT /F1 12 Tf 80 670 Td (Name) Tj ET BT /F1 12 Tf 180 670 Td (Value) Tj ET "
+    b"BT /F1 12 Tf 80 620 Td (alpha) Tj ET BT /F1 12 Tf 180 620 Td (42) Tj ET"
+)
+
+
+def test_simple_engine_skips_table_extraction_on_pages_without_ruling_lines(make_text_pdf):
+    pdf_path = make_text_pdf(["Just prose, no table here", TABLE_PAGE])
+
+    gated = list(SimplePDFEngine().process(pdf_path))
+    forced = list(SimplePDFEngine(force_table_extraction=True).process(pdf_path))
+
+    assert gated[0].metadata["table_extraction"] == "skipped"
+    assert "table_extraction_seconds" not in gated[0].metadata
+    assert gated[1].metadata["table_extraction"] == "run"
+    assert gated[1].tables == [{"rows": [["Name", "Value"], ["alpha", "42"]]}]
+    assert forced[0].metadata["table_extraction"] == "run"
+    assert [page.markdown_content for page in gated] == [page.markdown_content for page in forced]
+
+
+def test_simple_engine_extracts_tables_from_pages_without_edge_information():
+    class StubPage:
+        def extract_text(self):
+            return "text"
+
+        def extract_tables(self):
+            return [[["A"], ["1"]]]
+
+    page = SimplePDFEngine()._extract_page(StubPage(), 1)
+
+    assert page.tables == [{"rows": [["A"], ["1"]]}]
+    assert page.metadata["table_extraction"] == "run"
+
+
+def test_fast_engine_matches_simple_engine_text_and_page_numbers(make_text_pdf):
+    from langparse.engines.pdf.fast import FastPDFEngine
+    from langparse.services.parse_service import ENGINE_MAP
+
+    pdf_path = make_text_pdf(["First page text", "Second page text", "Third page text"])
+
+    fast = list(FastPDFEngine().process(pdf_path))
+    simple = list(SimplePDFEngine().process(pdf_path))
+    selected = list(FastPDFEngine().process(pdf_path, pages="2-", max_pages=1))
+
+    assert ENGINE_MAP["fast"] is FastPDFEngine
+    assert [page.page_number for page in fast] == [1, 2, 3]
+    assert [page.plain_text for page in fast] == [page.plain_text for page in simple]
+    assert fast[0].markdown_content == "First page text"
+    assert fast[0].metadata == {"engine_name": "fast"}
+    assert [page.plain_text for page in selected] == ["Second page text"]
+
+
+SCANNED_PAGE = b"q 200 0 0 200 100 400 cm BI /W 2 /H 2 /CS /G /BPC 8 ID \x00\xff\xff\x00 EI Q"
+
+
+def test_simple_engine_ocrs_only_scanned_pages_with_one_session(make_text_pdf):
+    import pickle
+
+    class StubOCR:
+        def __init__(self):
+            self.images = []
+
+        def __call__(self, image):
+            self.images.append(image.shape)
+            return [[[[0, 0], [1, 0], [1, 1], [0, 1]], "Scanned words", 0.9]], [0.1]
+
+    pdf_path = make_text_pdf(["Digital page with plenty of text", SCANNED_PAGE, b"", SCANNED_PAGE])
+    engine = SimplePDFEngine(enable_ocr=True, ocr_resolution=72)
+    engine._ocr_engine = ocr = StubOCR()
+
+    pages = list(engine.process(pdf_path))
+
+    assert [page.plain_text for page in pages] == [
+        "Digital page with plenty of text",
+        "Scanned words",
+        "",
+        "Scanned words",
+    ]
+    assert ocr.images == [(792, 612, 3), (792, 612, 3)]
+    assert "ocr_applied" not in pages[0].metadata
+    assert "ocr_applied" not in pages[2].metadata
+    assert pages[1].metadata["ocr_applied"] is True
+    assert pages[1].metadata["ocr_text_chars"] == len("Scanned words")
+    assert pickle.loads(pickle.dumps(engine))._ocr_engine is None
+
+
+def test_simple_engine_ocr_requires_rapidocr(make_text_pdf, monkeypatch):
+    import sys
+
+    monkeypatch.setitem(sys.modules, "rapidocr_onnxruntime", None)
+    engine = SimplePDFEngine(enable_ocr=True)
+
+    with pytest.raises(ImportError, match="rapidocr_onnxruntime"):
+        list(engine.process(make_text_pdf([SCANNED_PAGE])))
+
+
+def test_hybrid_engine_sends_only_scanned_pages_to_mineru(make_text_pdf):
+    from langparse.engines.pdf.hybrid import HybridPDFEngine
+
+    class StubMinerU:
+        def __init__(self):
+            self.calls = []
+
+        def process_document(self, file_path, **kwargs):
+            self.calls.append(kwargs)
+            pages = [number for first, last in kwargs["pages"] for number in range(first, last + 1)]
+            return ParsedDocumentResult(
+                source=str(file_path),
+                filename=file_path.name,
+                engine="mineru",
+                pages=[ParsedPageResult(page_number=number, markdown_content=f"OCR {number}") for number in pages],
+                metadata={"ocr_applied": True},
+            )
+
+    text = "A digital page with a healthy text layer of well over sixty four characters."
+    pdf_path = make_text_pdf([text, SCANNED_PAGE, SCANNED_PAGE, text, SCANNED_PAGE])
+    engine = HybridPDFEngine(device="cpu", mineru_merge_gap=0)
+    engine._mineru_engine = mineru = StubMinerU()
+
+    parsed = engine.process_document(pdf_path, device="cpu")
+
+    assert mineru.calls == [{"pages": [(2, 3), (5, 5)], "device": "cpu"}]
+    assert [page.markdown_content for page in parsed.pages] == [text, "OCR 2", "OCR 3", text, "OCR 5"]
+    assert [page.metadata["routing"]["engine"] for page in parsed.pages] == [
+        "simple",
+        "mineru",
+        "mineru",
+        "simple",
+        "mineru",
+    ]
+    assert parsed.pages[1].metadata["routing"]["reasons"] == ["no_text_layer"]
+    assert parsed.metadata["routing"] == {"simple_pages": 2, "mineru_pages": 3, "mineru_ranges": [[2, 3], [5, 5]]}
+    assert parsed.metadata["ocr_applied"] is True
+
+
+def test_hybrid_engine_bounds_mineru_requests_for_interleaved_scans(make_text_pdf):
+    from langparse.engines.pdf.hybrid import HybridPDFEngine
+
+    class StubMinerU:
+        def __init__(self):
+            self.calls = []
+
+        def process_document(self, file_path, **kwargs):
+            self.calls.append(kwargs["pages"])
+            pages = [number for first, last in kwargs["pages"] for number in range(first, last + 1)]
+            return ParsedDocumentResult(
+                source=str(file_path),
+                filename=file_path.name,
+                engine="mineru",
+                pages=[ParsedPageResult(page_number=number, markdown_content=f"OCR {number}") for number in pages],
+            )
+
+    text = "A digital page with a healthy text layer of well over sixty four characters."
+    layout = [SCANNED_PAGE, text, SCANNED_PAGE, text, text, text, SCANNED_PAGE, text, SCANNED_PAGE]
+    pdf_path = make_text_pdf(layout)
+
+    engine = HybridPDFEngine()
+    engine._mineru_engine = merged = StubMinerU()
+    parsed = engine.process_document(pdf_path)
+
+    assert merged.calls == [[(1, 3), (7, 9)]]
+    assert parsed.metadata["routing"]["mineru_ranges"] == [[1, 3], [7, 9]]
+    expected = [f"OCR {number}" if page is SCANNED_PAGE else text for number, page in enumerate(layout, start=1)]
+    assert [page.markdown_content for page in parsed.pages] == expected
+
+    engine = HybridPDFEngine(mineru_merge_gap=0, max_mineru_ranges=3)
+    engine._mineru_engine = capped = StubMinerU()
+    parsed = engine.process_document(pdf_path)
+
+    assert capped.calls == [[(1, 9)]]
+    assert [page.markdown_content for page in parsed.pages] == expected
+
+
+def test_hybrid_engine_skips_mineru_for_digital_documents(make_text_pdf):
+    from langparse.engines.pdf.hybrid import HybridPDFEngine
+
+    engine = HybridPDFEngine()
+    engine._get_mineru_engine = lambda: pytest.fail("digital pages must not start MinerU")
+
+    parsed = engine.process_document(make_text_pdf(["Short", "Pages"]), max_pages=1)
+
+    assert [page.plain_text for page in parsed.pages] == ["Short"]
+    assert parsed.pages[0].metadata["routing"]["reasons"] == []
+    assert parsed.metadata["routing"]["mineru_pages"] == 0
@@ -0,0 +1,163 @@
+import threading
+import time
+
+import pytest
+
+from langparse.errors import ErrorType
+from langparse.services.batch_service import BatchParseService
+from langparse.services.resilience import CircuitBreaker, CircuitOpenError, RetryPolicy
+from langparse.types import ParsedDocumentResult, ParsedPageResult
+
+
+def test_retry_policy_delay_is_jittered_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=3.0)
+
+    delays = [policy.delay(attempt) for attempt in (1, 2, 5) for _ in range(50)]
+
+    assert all(0 <= delay <= 3.0 for delay in delays)
+    assert max(policy.delay(1) for _ in range(50)) <= 1.0
+
+
+def test_circuit_breaker_opens_and_resumes_after_successful_probe():
+    probes = []
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.01, probe=lambda: probes.append("probe"))
+
+    breaker.record_failure(ErrorType.PARSE_FAILED)
+    breaker.record_failure(ErrorType.ENGINE_UNAVAILABLE)
+    assert breaker.state == "closed"
+    breaker.record_failure(ErrorType.ENGINE_TIMEOUT)
+    assert breaker.state == "open"
+
+    breaker.before_call()
+
+    assert probes == ["probe"]
+    assert breaker.state == "closed"
+
+
+def test_circuit_breaker_fails_fast_when_probe_keeps_failing():
+    def probe():
+        raise RuntimeError("MinerU API request failed: Connection refused")
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01, max_wait=0.05, probe=probe)
+    breaker.record_failure(ErrorType.ENGINE_UNAVAILABLE)
+
+    with pytest.raises(CircuitOpenError, match="circuit breaker open"):
+        breaker.before_call()
+
+
+def test_circuit_breaker_fails_queued_callers_fast_once_outage_exceeds_max_wait():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0, max_wait=0.2, probe=lambda: False)
+    breaker.record_failure(ErrorType.ENGINE_UNAVAILABLE)
+    outcomes = []
+
+    def call():
+        started = time.monotonic()
+        try:
+            breaker.before_call()
+        except CircuitOpenError:
+            outcomes.append(time.monotonic() - started)
+
+    first = [threading.Thread(target=call) for _ in range(4)]
+    for thread in first:
+        thread.start()
+    for thread in first:
+        thread.join()
+    started = time.monotonic()
+    for _ in range(5):
+        call()
+
+    assert len(outcomes) == 9
+    assert max(outcomes[:4]) < 1.0
+    # Callers arriving after max_wait do not wait out a fresh max_wait each.
+    assert time.monotonic() - started < 0.1
+
+
+def test_circuit_breaker_recovers_after_outage_exceeds_max_wait():
+    healthy = []
+    probes = []
+
+    def probe():
+        probes.append(time.monotonic())
+        return bool(healthy)
+
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.05, max_wait=0.1, probe=probe)
+    breaker.record_failure(ErrorType.ENGINE_UNAVAILABLE)
+    time.sleep(0.15)
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    # Inside reset_timeout nobody probes; callers fail fast.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert len(probes) == 1
+
+    healthy.append(True)
+    time.sleep(0.06)
+    breaker.before_call()
+
+    assert len(probes) == 2
+    assert breaker.state == "closed"
+    breaker.record_failure(ErrorType.ENGINE_UNAVAILABLE)
+    assert breaker.state == "open"
+    # A new outage gets a fresh max_wait instead of failing fast straight away.
+    started = time.monotonic()
+    breaker.before_call()
+    assert time.monotonic() - started >= 0.04
+
+
+class FlakyParseService:
+    def __init__(self, failures):
+        self.failures = failures
+        self.calls = 0
+
+    def parse_result(self, file_path, engine_name="simple", engine=None, **kwargs):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise RuntimeError("MinerU API request failed with HTTP 503: busy")
+        return ParsedDocumentResult(
+            source=str(file_path),
+            filename=file_path.name,
+            engine=engine_name,
+            pages=[ParsedPageResult(page_number=1, markdown_content="Hello")],
+            markdown_content="Hello",
+        )
+
+    def render_output(self, parsed, fmt):
+        return parsed.markdown_content
+
+    def health_check(self, engine_name="simple", **kwargs):
+        return True
+
+
+def test_batch_service_retries_transient_engine_errors(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("x", encoding="utf-8")
+    parse_service = FlakyParseService(failures=2)
+
+    result = BatchParseService(parse_service=parse_service).run(
+        [pdf],
+        output_dir=tmp_path / "out",
+        max_workers=1,
+        retry_policies={ErrorType.ENGINE_UNAVAILABLE: RetryPolicy(max_attempts=3, base_delay=0.0)},
+        circuit_breaker=True,
+    )
+
+    assert result.success_count == 1
+    assert result.items[0].attempts == 3
+    assert result.summary["circuit_breaker"] == {"state": "closed", "open_count": 0}
+
+
+def test_batch_service_gives_up_after_max_attempts(tmp_path):
+    pdf = tmp_path / "a.pdf"
+    pdf.write_text("x", encoding="utf-8")
+
+    result = BatchParseService(parse_service=FlakyParseService(failures=5)).run(
+        [pdf],
+        output_dir=tmp_path / "out",
+        max_workers=1,
+        retry_policies={ErrorType.ENGINE_UNAVAILABLE: RetryPolicy(max_attempts=2, base_delay=0.0)},
+    )
+
+    assert result.failed_count == 1
+    assert result.items[0].attempts == 2
+    assert result.items[0].error_type == "engine_unavailable"